@@ -3,6 +3,7 @@ Configuration and environment variables for VerifAI agent-x402.
 Centralizes all settings to enable easy customization.
 """
 import os
+import secrets
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -10,12 +11,19 @@ load_dotenv()
 # ============================================================================
 # API Keys and Credentials
 # ============================================================================
-EXA_API_KEY = os.getenv("EXA_API_KEY")
-NEWSAPI_KEY = os.getenv("NEWSAPI_KEY")  # For real-time news verification
-DEEPINFRA_API_KEY = os.getenv("DEEPINFRA_API_KEY")
-ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+# Offline benchmarking: with FAKE_PROVIDERS_URL set (e.g. http://127.0.0.1:9100,
+# served by scripts/fake_providers.py) every provider URL points at the local
+# stand-ins, missing API keys get a dummy value, provider quotas are lifted and
+# the x402 payment wall is off - nothing real is called, charged or paid.
+FAKE_PROVIDERS_URL = os.getenv("FAKE_PROVIDERS_URL", "").rstrip("/")
+_FAKE_API_KEY = "fake-key" if FAKE_PROVIDERS_URL else None
+
+EXA_API_KEY = os.getenv("EXA_API_KEY", _FAKE_API_KEY)
+NEWSAPI_KEY = os.getenv("NEWSAPI_KEY", _FAKE_API_KEY)  # For real-time news verification
+DEEPINFRA_API_KEY = os.getenv("DEEPINFRA_API_KEY", _FAKE_API_KEY)
+ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY", _FAKE_API_KEY)
+GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", _FAKE_API_KEY)
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", _FAKE_API_KEY)
 MERCHANT_WALLET_ADDRESS = os.getenv("MERCHANT_WALLET_ADDRESS")
 
 # ============================================================================
@@ -66,20 +74,117 @@ X402_OUTPUT_SCHEMA = {
     "note": "Use Accept header to request different formats: application/json (default), text/html, or text/plain"
 }
 
+# ============================================================================
+# Prepaid Session Configuration
+# ============================================================================
+# One x402 payment buys a block of verification credits redeemed with a signed
+# session token (X-Session-Token header) instead of paying per request.
+# Set SESSION_SECRET in production so tokens survive restarts/redeploys.
+SESSION_SECRET = os.getenv("SESSION_SECRET") or secrets.token_hex(32)
+SESSION_CREDITS_PER_PURCHASE = int(os.getenv("SESSION_CREDITS_PER_PURCHASE", "100"))
+SESSION_PRICE = f"{float(X402_PRICE) * SESSION_CREDITS_PER_PURCHASE:.2f}"  # USDC per session
+SESSION_TTL_SECONDS = 7 * 24 * 3600  # Unused credits expire after 7 days
+SESSION_TOKEN_HEADER = "X-Session-Token"
+
+# ============================================================================
+# Settlement Queue Configuration
+# ============================================================================
+# Settle/refund decisions are journaled per request and flushed to the
+# facilitator in periodic bulk runs, off the request's critical path.
+SETTLEMENT_JOURNAL_FILE = "logs/settlement_queue.jsonl"
+SETTLEMENT_BATCH_SIZE = 50  # Max decisions per bulk settlement run
+SETTLEMENT_FLUSH_INTERVAL_SECONDS = 60
+# A decision the facilitator rejects this many times is moved to the dead-letter file
+SETTLEMENT_MAX_REJECTIONS = 5
+SETTLEMENT_DEAD_LETTER_FILE = "logs/settlement_failed.jsonl"
+# Bulk settlement endpoint; unset = local stand-in that records batches to logs/
+SETTLEMENT_FACILITATOR_URL = os.getenv("SETTLEMENT_FACILITATOR_URL")
+
 # Base URL for production (Railway uses HTTPS)
 SERVICE_BASE_URL = os.getenv("SERVICE_BASE_URL", "https://verifai-production.up.railway.app")
 
 # ============================================================================
 # Rate Limiting Configuration
 # ============================================================================
-RATE_LIMIT_MAX = 60  # requests per window per IP
+RATE_LIMIT_MAX = int(os.getenv("RATE_LIMIT_MAX", "60"))  # requests per window per IP (raise for local load tests)
 RATE_LIMIT_WINDOW_SECONDS = 60
 
+# Admission control (src/middleware/admission.py): each endpoint belongs to a
+# pool (bulkhead) with its own in-flight limit and bounded queue, so batches
+# cannot crowd out single verifications. A request is shed with 503 +
+# Retry-After - before payment - when its pool's queue is full or its expected
+# wait exceeds the pool's max_queue_wait_seconds. GET /metrics/admission
+ADMISSION_CONTROL_ENABLED = os.getenv("ADMISSION_CONTROL_ENABLED", "true").lower() == "true"
+ADMISSION_POOLS = {
+    # service_seconds: initial estimate of one request, refined as they complete
+    "interactive": {
+        "max_in_flight": int(os.getenv("ADMISSION_INTERACTIVE_MAX_IN_FLIGHT", "32")),
+        "max_queue": 64,
+        "max_queue_wait_seconds": 5.0,
+        "service_seconds": 10.0,
+    },
+    "bulk": {
+        "max_in_flight": int(os.getenv("ADMISSION_BULK_MAX_IN_FLIGHT", "4")),
+        "max_queue": 8,
+        "max_queue_wait_seconds": 30.0,
+        "service_seconds": 30.0,
+    },
+}
+ADMISSION_PATH_POOLS = {"/verify": "interactive", "/verify/news": "interactive", "/verify/batch": "bulk"}
+
+# Provider-slot bulkheads (src/utils/bulkheads.py): concurrent calls per
+# provider as (capacity, reserved for interactive). Bulk traffic may use at
+# most capacity - reserved slots. GET /metrics/admission
+BULKHEAD_PROVIDER_SLOTS = {
+    "default": (int(os.getenv("BULKHEAD_PROVIDER_CAPACITY", "16")), int(os.getenv("BULKHEAD_INTERACTIVE_RESERVED", "6"))),
+}
+
+# Fair queuing (src/utils/fair_queue.py): contended provider slots are granted
+# in deficit round-robin order across tenants (payer wallet, else client IP).
+# Premium payers get a larger share: FAIR_QUEUE_WEIGHTS="0xabc...=3,0xdef...=2"
+FAIR_QUEUE_WEIGHTS = {
+    wallet.strip().lower(): float(weight)
+    for wallet, weight in (
+        item.split("=") for item in os.getenv("FAIR_QUEUE_WEIGHTS", "").split(",") if item.strip()
+    )
+}
+FAIR_QUEUE_QUANTUM = 1.0  # credit per round, in provider calls
+FAIR_QUEUE_MAX_TRACKED_TENANTS = 1000  # per-tenant wait metrics kept for the most recent
+
+# Provider quotas (src/utils/quotas.py): requests and tokens per minute per
+# "provider/model" (or per provider), matched to the account's plan. Calls
+# reserve estimated tokens and wait up to QUOTA_MAX_WAIT_SECONDS for a bucket
+# to refill instead of drawing a 429; x-ratelimit headers and Retry-After
+# override these estimates. Missing rpm/tpm = unlimited. GET /metrics/quotas
+QUOTA_LIMITS = {
+    "deepinfra": {"rpm": 600},
+    "openai": {"rpm": 500, "tpm": 200_000},
+    "anthropic": {"rpm": 50, "tpm": 50_000},
+    "gemini": {"rpm": 10, "tpm": 4_000_000},
+}
+if FAKE_PROVIDERS_URL:
+    QUOTA_LIMITS = {}  # the stand-ins have no quotas (their simulated 429s are still honored)
+QUOTA_MAX_WAIT_SECONDS = 3.0
+QUOTA_DEFAULT_RETRY_AFTER_SECONDS = 1.0  # a 429 without Retry-After or reset headers
+
 # ============================================================================
 # AI Model Configuration
 # ============================================================================
 DEEPINFRA_BASE_URL = "https://api.deepinfra.com/v1/openai"
 OPENAI_BASE_URL = "https://api.openai.com/v1"
+ANTHROPIC_BASE_URL = "https://api.anthropic.com"
+GEMINI_BASE_URL = "https://generativelanguage.googleapis.com"
+EXA_BASE_URL = "https://api.exa.ai"
+NEWSAPI_URL = "https://newsapi.org/v2/everything"
+
+if FAKE_PROVIDERS_URL:
+    # scripts/fake_providers.py serves each provider's API under its own prefix
+    DEEPINFRA_BASE_URL = f"{FAKE_PROVIDERS_URL}/deepinfra/v1/openai"
+    OPENAI_BASE_URL = f"{FAKE_PROVIDERS_URL}/openai/v1"
+    ANTHROPIC_BASE_URL = f"{FAKE_PROVIDERS_URL}/anthropic"
+    GEMINI_BASE_URL = f"{FAKE_PROVIDERS_URL}/gemini"
+    EXA_BASE_URL = f"{FAKE_PROVIDERS_URL}/exa"
+    NEWSAPI_URL = f"{FAKE_PROVIDERS_URL}/newsapi/v2/everything"
 
 PROVER_MODEL = "meta-llama/Llama-3.3-70B-Instruct-Turbo"
 DEBUNKER_MODEL = "deepseek-ai/DeepSeek-V3"
@@ -95,18 +200,147 @@ DEBUNKER_FALLBACK_MODEL = "gpt-4o-mini"  # OpenAI, cheap, ensures diversity vs G
 EXA_SEARCH_TIMEOUT_SECONDS = 20
 DEBATE_TIMEOUT_SECONDS = 30
 
+# Per-request deadline (src/utils/deadline.py): the tier's deadline_seconds,
+# optionally shortened by the client, is shared by every stage. The timeouts
+# above become caps; a stage gets min(cap, time left), and optional stages
+# are skipped (returning a degraded, manual-review result) when too little is left.
+DEADLINE_HEADER = "X-Request-Timeout"  # seconds; clients may only shorten the tier deadline
+DEADLINE_MIN_CLIENT_SECONDS = 2
+DEADLINE_SAFETY_MARGIN_SECONDS = 0.5  # kept back to assemble and log the response
+DEADLINE_MIN_QUICK_CHECK_SECONDS = 1.5
+DEADLINE_MIN_DEBATE_SECONDS = 6  # prover/debunker need at least this to be worth starting
+DEADLINE_MIN_JUDGE_SECONDS = 3
+DEADLINE_MIN_FALLBACK_SECONDS = 2  # below this, agents skip their fallback provider
+
+# Adaptive per-provider timeouts (src/utils/adaptive_timeouts.py): each call's
+# timeout is 1.5x the p99 of the provider/model's last 200 latencies, clamped
+# to (floor, ceiling) seconds. Ceilings are the old static timeouts and apply
+# until 20 samples are in. Current values: GET /metrics/timeouts
+ADAPTIVE_TIMEOUTS_ENABLED = os.getenv("ADAPTIVE_TIMEOUTS_ENABLED", "true").lower() == "true"
+ADAPTIVE_TIMEOUT_P99_MULTIPLIER = 1.5
+ADAPTIVE_TIMEOUT_WINDOW = 200
+ADAPTIVE_TIMEOUT_MIN_SAMPLES = 20
+ADAPTIVE_TIMEOUT_BOUNDS = {
+    "default": (3, 30),
+    "exa": (2, EXA_SEARCH_TIMEOUT_SECONDS),
+    "newsapi": (2, EXA_SEARCH_TIMEOUT_SECONDS),
+    "deepinfra": (4, DEBATE_TIMEOUT_SECONDS),
+    "openai": (4, DEBATE_TIMEOUT_SECONDS),
+    "gemini": (4, DEBATE_TIMEOUT_SECONDS),
+    "anthropic": (4, DEBATE_TIMEOUT_SECONDS),
+}
+
+# Retries (src/utils/retry.py): transient provider errors (connection resets,
+# timeouts, 408/409/429/5xx/529) are retried on the same provider with
+# decorrelated jitter - each delay drawn from [base, 3 x previous], capped -
+# as long as the request deadline leaves room for the wait plus another
+# attempt. Other errors go straight to the fallback. GET /metrics/retries
+RETRY_MAX_ATTEMPTS = 3  # including the first
+RETRY_BASE_DELAY_SECONDS = 0.2
+RETRY_MAX_DELAY_SECONDS = 2.0
+RETRY_MIN_ATTEMPT_SECONDS = 2  # deadline time a retry must still have after its delay
+
+# ============================================================================
+# Outbound HTTP Clients (src/utils/http_clients.py)
+# ============================================================================
+# One pooled keep-alive client per upstream host, shared by every integration.
+# Per-request deadlines (e.g. EXA_SEARCH_TIMEOUT_SECONDS) are enforced by the
+# callers; timeout_seconds here is only the transport-level backstop.
+HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "true").lower() == "true"  # needs the optional h2 package
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 60
+HTTP_CLIENT_LIMITS = {
+    "default": {"max_connections": 10, "max_keepalive_connections": 5, "timeout_seconds": 30},
+    "exa": {"max_connections": 20, "max_keepalive_connections": 10, "timeout_seconds": 30},
+    "newsapi": {"max_connections": 10, "max_keepalive_connections": 5, "timeout_seconds": 20},
+    "deepinfra": {"max_connections": 50, "max_keepalive_connections": 20, "timeout_seconds": 60},
+    "openai": {"max_connections": 20, "max_keepalive_connections": 10, "timeout_seconds": 60},
+    "facilitator": {"max_connections": 5, "max_keepalive_connections": 2, "timeout_seconds": 30},
+}
+
+# Provider SDK clients (src/utils/provider_clients.py) are built on first use.
+# Prewarm builds them all in the background right after startup: readiness
+# doesn't wait for the SDK imports, and the first request usually finds them warm.
+PROVIDER_PREWARM_ENABLED = os.getenv("PROVIDER_PREWARM_ENABLED", "true").lower() == "true"
+
+# Connection warm-up (src/utils/connection_warmup.py): after prewarm, probe
+# every configured provider so DNS/TCP/TLS are paid before the first request,
+# and re-probe within the keep-alive expiry so pools stay warm while idle.
+# GET /ready answers 503 until the first pass is done (replaces the prewarm
+# task when enabled).
+CONNECTION_WARMUP_ENABLED = os.getenv("CONNECTION_WARMUP_ENABLED", "true").lower() == "true"
+WARMUP_INTERVAL_SECONDS = 45  # < HTTP_KEEPALIVE_EXPIRY_SECONDS
+WARMUP_PROBE_TIMEOUT_SECONDS = 5
+WARMUP_CONNECTIONS_PER_HOST = 2
+
 # ============================================================================
 # Verification Configuration
 # ============================================================================
 EXA_NUM_RESULTS = 5
 MAX_SOURCE_TEXT_LENGTH = 500
 
+# Relevance-ranked passages (src/services/passages.py): fetch up to
+# EXA_MAX_DOCUMENT_CHARS per page, then fill each source's text budget with the
+# BM25-best sentence chunks instead of the page's first characters
+PASSAGE_EXTRACTION_ENABLED = True
+EXA_MAX_DOCUMENT_CHARS = 8000
+PASSAGE_CHUNK_CHARS = 160
+PASSAGE_SEPARATOR = " … "
+
+# News retrieval (search_news_sources): NewsAPI and Exa are queried concurrently
+# and merged by reciprocal rank fusion; once enough articles from the freshness
+# window have arrived, the slower provider is cancelled
+NEWS_FRESH_WINDOW_HOURS = 48
+NEWS_RRF_K = 60
+NEWS_EARLY_RETURN_ENABLED = True
+NEWS_EARLY_RETURN_MIN_FRESH_SOURCES = 3
+
+# Persistent evidence index (src/services/evidence_index.py): every retrieved
+# document is stored in a local SQLite FTS5 index and searched before Exa/NewsAPI.
+# A claim is answered locally only when num_results documents retrieved within
+# the max age each contain >= 75% of the claim's terms.
+EVIDENCE_INDEX_ENABLED = os.getenv("EVIDENCE_INDEX_ENABLED", "true").lower() == "true"
+EVIDENCE_INDEX_PATH = os.getenv("EVIDENCE_INDEX_PATH", "logs/evidence_index.db")
+EVIDENCE_INDEX_MAX_AGE_HOURS = 24
+EVIDENCE_INDEX_NEWS_MAX_AGE_MINUTES = 30  # Breaking news goes stale fast
+EVIDENCE_INDEX_MIN_TERM_COVERAGE = 0.75
+EVIDENCE_INDEX_RETENTION_DAYS = 30
+
+# Near-duplicate source elimination (src/services/dedupe.py): syndicated copies
+# whose word 4-gram sets overlap >= 60% (Jaccard) collapse into one citation
+DEDUPE_ENABLED = True
+DEDUPE_SHINGLE_SIZE = 4
+DEDUPE_SIMILARITY_THRESHOLD = 0.6
+
+# Source credibility (src/services/credibility.py): per-domain weights, matched
+# on the longest domain suffix ("en.m.wikipedia.org" -> "wikipedia.org", "cdc.gov" -> "gov")
+DOMAIN_CREDIBILITY_PATH = os.getenv(
+    "DOMAIN_CREDIBILITY_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "domain_credibility.json")
+)
+# Recency multipliers for news sources: (max age in hours, multiplier), youngest first
+RECENCY_MULTIPLIERS = [
+    (24, 1.5),      # Breaking news
+    (24 * 7, 1.2),  # Recent news
+]
+
+# Matched as whole words/phrases by src/utils/claim_classifier.py
+# ("will" no longer fires on "goodwill"), so list inflections explicitly.
 PREDICTION_KEYWORDS = [
-    'will', 'forecast', 'predict', 'expect', 'likely', 'probably',
+    'will', "won't", 'forecast', 'forecasts', 'forecasted', 'forecasting',
+    'predict', 'predicts', 'predicted', 'predicting', 'prediction', 'predictions',
+    'expect', 'expects', 'expected', 'likely', 'unlikely', 'probably',
     'going to', 'next week', 'tomorrow', 'this week', 'future',
     'by 2026', 'by 2030', 'in the coming'
 ]
 
+# Cues that a claim is about breaking news / current events
+NEWS_KEYWORDS = [
+    'breaking', 'just announced', 'announced', 'announces', 'today', 'yesterday',
+    'this morning', 'tonight', 'last night', 'earlier today', 'reportedly',
+    'according to reports', 'sources say', 'resigned', 'resigns', 'arrested',
+    'press release', 'live updates'
+]
+
 # ============================================================================
 # HITL (Human-in-the-Loop) Configuration
 # ============================================================================
@@ -143,6 +377,117 @@ DEBUNKER_SYSTEM_PROMPT = "You are a critical fact-checker who finds flaws in cla
 # ============================================================================
 JUDGE_MAX_TOKENS = 500
 
+# ============================================================================
+# Quick Check (Tier 1) Configuration
+# ============================================================================
+# A single cheap model call settles easy claims; the full Prover/Debunker/Judge
+# debate only runs when the quick check is unsure or the sources disagree.
+QUICK_CHECK_ENABLED = os.getenv("QUICK_CHECK_ENABLED", "true").lower() == "true"
+QUICK_CHECK_MODEL = "meta-llama/Llama-3.3-70B-Instruct-Turbo"  # DeepInfra
+QUICK_CHECK_FALLBACK_MODEL = "gpt-4o-mini"  # OpenAI
+QUICK_CHECK_TEMPERATURE = 0.1
+QUICK_CHECK_MAX_TOKENS = 400
+QUICK_CHECK_TIMEOUT_SECONDS = 10
+QUICK_CHECK_MIN_CONFIDENCE = 0.85  # Escalate to debate below this
+QUICK_CHECK_MIN_SOURCE_AGREEMENT = 0.80  # Share of source weight agreeing with the verdict
+QUICK_CHECK_ESCALATE_PREDICTIONS = True  # Predictions always get the full debate
+
+# ============================================================================
+# LLM Gateway (src/llm/)
+# ============================================================================
+# Every agent call goes through one gateway: the role picks a chain of
+# (provider, model) tried in order, each with pooling, bulkhead slot, quota,
+# adaptive timeout and retries applied. A tier's model override replaces the
+# first model of the chain. Token usage and cost per role/provider/model:
+# GET /metrics/llm
+LLM_ROUTES = {
+    "prover": {
+        "chain": [("deepinfra", PROVER_MODEL), ("gemini", PROVER_FALLBACK_MODEL)],
+        "temperature": PROVER_TEMPERATURE,
+        "max_tokens": PROVER_MAX_TOKENS,
+        "hedge": True,
+    },
+    "debunker": {
+        "chain": [("deepinfra", DEBUNKER_MODEL), ("openai", DEBUNKER_FALLBACK_MODEL)],
+        "temperature": DEBUNKER_TEMPERATURE,
+        "max_tokens": DEBUNKER_MAX_TOKENS,
+        "hedge": True,
+    },
+    "judge": {
+        "chain": [("anthropic", JUDGE_MODEL)],
+        "max_tokens": JUDGE_MAX_TOKENS,
+    },
+    "quick_check": {
+        "chain": [("deepinfra", QUICK_CHECK_MODEL), ("openai", QUICK_CHECK_FALLBACK_MODEL)],
+        "temperature": QUICK_CHECK_TEMPERATURE,
+        "max_tokens": QUICK_CHECK_MAX_TOKENS,
+        "json": True,
+        "hedge": True,
+    },
+}
+# Hedged requests: when a "hedge" route's call is still running after its
+# provider/model's p95 latency (at least LLM_HEDGE_MIN_DELAY_SECONDS), the next
+# model in the chain is started too and the first answer wins. Off by default:
+# a hedge can double the cost of slow calls.
+LLM_HEDGING_ENABLED = os.getenv("LLM_HEDGING_ENABLED", "false").lower() == "true"
+LLM_HEDGE_PERCENTILE = 95
+LLM_HEDGE_MIN_DELAY_SECONDS = 1.0
+
+# ============================================================================
+# Client-Selectable Latency Tiers
+# ============================================================================
+# Clients pick ?tier=fast|standard|thorough on /verify, /verify/news and
+# /verify/batch. Each tier fixes the model set, retrieval breadth, source
+# length, overall deadline and price.
+#   debate: "never"    - quick check only (answers in a few seconds)
+#           "escalate" - quick check, full debate only when unsettled
+#           "always"   - full Prover/Debunker/Judge debate regardless of time
+DEFAULT_TIER = "standard"
+VERIFICATION_TIERS = {
+    "fast": {
+        "price": "0.02",
+        "session_credits": 1,
+        "debate": "never",
+        "num_results": 3,
+        "max_source_text_length": 300,
+        "deadline_seconds": 5,
+        "models": {
+            "quick_check": "meta-llama/Meta-Llama-3.1-8B-Instruct-Turbo",
+            "prover": PROVER_MODEL,
+            "debunker": DEBUNKER_MODEL,
+            "judge": JUDGE_MODEL,
+        },
+    },
+    "standard": {
+        "price": X402_PRICE,
+        "session_credits": 1,
+        "debate": "escalate",
+        "num_results": EXA_NUM_RESULTS,
+        "max_source_text_length": MAX_SOURCE_TEXT_LENGTH,
+        "deadline_seconds": 45,
+        "models": {
+            "quick_check": QUICK_CHECK_MODEL,
+            "prover": PROVER_MODEL,
+            "debunker": DEBUNKER_MODEL,
+            "judge": JUDGE_MODEL,
+        },
+    },
+    "thorough": {
+        "price": "0.10",
+        "session_credits": 2,
+        "debate": "always",
+        "num_results": 8,
+        "max_source_text_length": 1000,
+        "deadline_seconds": 90,
+        "models": {
+            "quick_check": QUICK_CHECK_MODEL,
+            "prover": PROVER_MODEL,
+            "debunker": DEBUNKER_MODEL,
+            "judge": "claude-3-5-sonnet-20241022",
+        },
+    },
+}
+
 # ============================================================================
 # Server Configuration
 # ============================================================================
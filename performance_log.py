@@ -25,6 +25,10 @@ DEEPINFRA_PRICES = {
         "input": 0.59,   # per 1M input tokens
         "output": 0.79   # per 1M output tokens
     },
+    "meta-llama/Meta-Llama-3.1-8B-Instruct-Turbo": {
+        "input": 0.02,   # fast tier quick check
+        "output": 0.05
+    },
     "deepseek-ai/DeepSeek-V3": {
         "input": 0.27,
         "output": 1.10
@@ -35,7 +39,15 @@ DEEPINFRA_PRICES = {
 ANTHROPIC_PRICES = {
     "claude-3-5-haiku-20241022": {
         "input": 1.00,
-        "output": 5.00
+        "output": 5.00,
+        "cached_input": 0.08,   # prompt cache read
+        "cache_write": 1.25     # prompt cache write (5 min TTL)
+    },
+    "claude-3-5-sonnet-20241022": {
+        "input": 3.00,   # thorough tier judge
+        "output": 15.00,
+        "cached_input": 0.30,
+        "cache_write": 3.75
     }
 }
 
@@ -47,6 +59,15 @@ GEMINI_PRICES = {
     }
 }
 
+# OpenAI pricing per 1M tokens (debunker / quick check fallback)
+OPENAI_PRICES = {
+    "gpt-4o-mini": {
+        "input": 0.15,
+        "output": 0.60,
+        "cached_input": 0.075   # automatic prefix caching
+    }
+}
+
 # Revenue per request
 USDC_REVENUE_PER_REQUEST = 0.05  # $0.05 USDC
 
@@ -64,28 +85,31 @@ class PerformanceLogger:
     """Track and analyze verification request economics."""
     
     @staticmethod
-    def calculate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
-        """Calculate cost for a model call."""
-        # Check DeepInfra models
-        if model in DEEPINFRA_PRICES:
-            pricing = DEEPINFRA_PRICES[model]
-            input_cost = (input_tokens / 1_000_000) * pricing["input"]
-            output_cost = (output_tokens / 1_000_000) * pricing["output"]
-            return input_cost + output_cost
-        
-        # Check Anthropic models
-        if model in ANTHROPIC_PRICES:
-            pricing = ANTHROPIC_PRICES[model]
-            input_cost = (input_tokens / 1_000_000) * pricing["input"]
-            output_cost = (output_tokens / 1_000_000) * pricing["output"]
-            return input_cost + output_cost
-        
-        # Check Gemini models
-        if model in GEMINI_PRICES:
-            pricing = GEMINI_PRICES[model]
-            input_cost = (input_tokens / 1_000_000) * pricing["input"]
-            output_cost = (output_tokens / 1_000_000) * pricing["output"]
-            return input_cost + output_cost
+    def calculate_cost(
+        model: str,
+        input_tokens: int,
+        output_tokens: int,
+        cached_input_tokens: int = 0,
+        cache_write_tokens: int = 0
+    ) -> float:
+        """
+        Calculate cost for a model call.
+        
+        input_tokens counts every prompt token; the cached_input / cache_write
+        subsets are billed at the model's cache rates when it has them
+        (falling back to the normal input rate otherwise).
+        """
+        for prices in (DEEPINFRA_PRICES, ANTHROPIC_PRICES, GEMINI_PRICES, OPENAI_PRICES):
+            if model in prices:
+                pricing = prices[model]
+                uncached = max(input_tokens - cached_input_tokens - cache_write_tokens, 0)
+                input_cost = (
+                    uncached * pricing["input"]
+                    + cached_input_tokens * pricing.get("cached_input", pricing["input"])
+                    + cache_write_tokens * pricing.get("cache_write", pricing["input"])
+                ) / 1_000_000
+                output_cost = (output_tokens / 1_000_000) * pricing["output"]
+                return input_cost + output_cost
         
         # Unknown model - return 0 and log warning
         print(f"Warning: Unknown model pricing for {model}")
@@ -101,7 +125,12 @@ class PerformanceLogger:
         judge_tokens: Optional[Dict[str, int]] = None,
         search_count: int = 0,
         execution_time: float = 0.0,
-        was_refunded: bool = False  # NEW: Track refund decisions
+        was_refunded: bool = False,  # NEW: Track refund decisions
+        quick_check_tokens: Optional[Dict[str, int]] = None,
+        verification_path: str = "full_debate",  # "pre_filtered", "quick_check" or "full_debate"
+        tier: str = "standard",  # Client-selected latency tier
+        revenue_usdc: Optional[float] = None,  # Tier price; defaults to USDC_REVENUE_PER_REQUEST
+        dedupe_tokens_saved: int = 0  # Prompt tokens avoided by collapsing duplicate sources
     ):
         """Log a verification request with costs and revenue."""
         
@@ -109,43 +138,67 @@ class PerformanceLogger:
         costs = {
             "prover": 0.0,
             "debunker": 0.0,
-            "judge": 0.0
+            "judge": 0.0,
+            "quick_check": 0.0
         }
         
         total_tokens = {
             "input": 0,
-            "output": 0
+            "output": 0,
+            "cached_input": 0  # Subset of input served from provider prompt caches
         }
         
         if prover_tokens:
             costs["prover"] = PerformanceLogger.calculate_cost(
                 prover_tokens.get("model", "meta-llama/Llama-3.3-70B-Instruct-Turbo"),
                 prover_tokens.get("input", 0),
-                prover_tokens.get("output", 0)
+                prover_tokens.get("output", 0),
+                prover_tokens.get("cached_input", 0),
+                prover_tokens.get("cache_write", 0)
             )
             total_tokens["input"] += prover_tokens.get("input", 0)
             total_tokens["output"] += prover_tokens.get("output", 0)
+            total_tokens["cached_input"] += prover_tokens.get("cached_input", 0)
         
         if debunker_tokens:
             costs["debunker"] = PerformanceLogger.calculate_cost(
                 debunker_tokens.get("model", "deepseek-ai/DeepSeek-V3"),
                 debunker_tokens.get("input", 0),
-                debunker_tokens.get("output", 0)
+                debunker_tokens.get("output", 0),
+                debunker_tokens.get("cached_input", 0),
+                debunker_tokens.get("cache_write", 0)
             )
             total_tokens["input"] += debunker_tokens.get("input", 0)
             total_tokens["output"] += debunker_tokens.get("output", 0)
+            total_tokens["cached_input"] += debunker_tokens.get("cached_input", 0)
         
         if judge_tokens:
             costs["judge"] = PerformanceLogger.calculate_cost(
                 judge_tokens.get("model", "claude-3-5-haiku-20241022"),
                 judge_tokens.get("input", 0),
-                judge_tokens.get("output", 0)
+                judge_tokens.get("output", 0),
+                judge_tokens.get("cached_input", 0),
+                judge_tokens.get("cache_write", 0)
             )
             total_tokens["input"] += judge_tokens.get("input", 0)
             total_tokens["output"] += judge_tokens.get("output", 0)
+            total_tokens["cached_input"] += judge_tokens.get("cached_input", 0)
+        
+        if quick_check_tokens:
+            costs["quick_check"] = PerformanceLogger.calculate_cost(
+                quick_check_tokens.get("model", "meta-llama/Llama-3.3-70B-Instruct-Turbo"),
+                quick_check_tokens.get("input", 0),
+                quick_check_tokens.get("output", 0),
+                quick_check_tokens.get("cached_input", 0),
+                quick_check_tokens.get("cache_write", 0)
+            )
+            total_tokens["input"] += quick_check_tokens.get("input", 0)
+            total_tokens["output"] += quick_check_tokens.get("output", 0)
+            total_tokens["cached_input"] += quick_check_tokens.get("cached_input", 0)
         
         total_cost = sum(costs.values())
-        revenue = USDC_REVENUE_PER_REQUEST if not was_refunded else 0.0  # No revenue if refunded
+        price = USDC_REVENUE_PER_REQUEST if revenue_usdc is None else revenue_usdc
+        revenue = price if not was_refunded else 0.0  # No revenue if refunded
         profit = revenue - total_cost
         margin = (profit / revenue * 100) if revenue > 0 else -100  # Negative margin if refunded
         
@@ -162,14 +215,17 @@ class PerformanceLogger:
             "tokens": {
                 "total_input": total_tokens["input"],
                 "total_output": total_tokens["output"],
+                "total_cached_input": total_tokens["cached_input"],
                 "prover": prover_tokens,
                 "debunker": debunker_tokens,
-                "judge": judge_tokens
+                "judge": judge_tokens,
+                "quick_check": quick_check_tokens
             },
             "costs": {
                 "prover_cost": round(costs["prover"], 6),
                 "debunker_cost": round(costs["debunker"], 6),
                 "judge_cost": round(costs["judge"], 6),
+                "quick_check_cost": round(costs["quick_check"], 6),
                 "total_cost": round(total_cost, 6)
             },
             "economics": {
@@ -181,7 +237,10 @@ class PerformanceLogger:
             },
             "metadata": {
                 "search_count": search_count,
-                "execution_time_sec": round(execution_time, 2)
+                "execution_time_sec": round(execution_time, 2),
+                "verification_path": verification_path,
+                "tier": tier,
+                "dedupe_tokens_saved": dedupe_tokens_saved
             }
         }
         
@@ -248,6 +307,7 @@ class PerformanceLogger:
         
         total_tokens_input = sum(log["tokens"]["total_input"] for log in logs)
         total_tokens_output = sum(log["tokens"]["total_output"] for log in logs)
+        total_tokens_cached = sum(log["tokens"].get("total_cached_input", 0) for log in logs)
         
         # Calculate agent-specific metrics for analytics
         total_prover_cost = sum(log["costs"].get("prover_cost", 0.0) for log in logs)
@@ -265,6 +325,45 @@ class PerformanceLogger:
         avg_exec_time = sum(log["metadata"].get("execution_time_sec", 0.0) for log in logs) / len(logs)
         avg_cost_per_request = total_cost / len(logs)
         
+        # Tiered pipeline: how often the quick check settled the claim vs escalating
+        path_stats = {}
+        for log in logs:
+            path = log["metadata"].get("verification_path", "full_debate")
+            stats = path_stats.setdefault(path, {"count": 0, "total_time": 0.0, "total_cost": 0.0})
+            stats["count"] += 1
+            stats["total_time"] += log["metadata"].get("execution_time_sec", 0.0)
+            stats["total_cost"] += log["economics"]["total_cost_usd"]
+        verification_path_stats = {
+            path: {
+                "count": stats["count"],
+                "pct_of_requests": round(stats["count"] / len(logs) * 100, 2),
+                "avg_execution_time": round(stats["total_time"] / stats["count"], 2),
+                "avg_cost_usd": round(stats["total_cost"] / stats["count"], 6)
+            }
+            for path, stats in path_stats.items()
+        }
+        
+        # Latency tiers: per-tier latency, cost and revenue
+        tier_times = {}
+        tier_totals = {}
+        for log in logs:
+            tier = log["metadata"].get("tier", "standard")
+            tier_times.setdefault(tier, []).append(log["metadata"].get("execution_time_sec", 0.0))
+            totals = tier_totals.setdefault(tier, {"cost": 0.0, "revenue": 0.0})
+            totals["cost"] += log["economics"]["total_cost_usd"]
+            totals["revenue"] += log["economics"]["revenue_usdc"]
+        tier_stats = {}
+        for tier, times in tier_times.items():
+            times = sorted(times)
+            tier_stats[tier] = {
+                "count": len(times),
+                "avg_execution_time": round(sum(times) / len(times), 2),
+                "p95_execution_time": times[min(len(times) - 1, int(len(times) * 0.95))],
+                "avg_cost_usd": round(tier_totals[tier]["cost"] / len(times), 6),
+                "total_revenue_usd": round(tier_totals[tier]["revenue"], 4),
+                "total_profit_usd": round(tier_totals[tier]["revenue"] - tier_totals[tier]["cost"], 4)
+            }
+        
         return {
             "total_requests": len(logs),
             "total_revenue_usd": round(total_revenue, 4),
@@ -305,11 +404,15 @@ class PerformanceLogger:
                     f"to cover ${round(inconclusive_avg_cost, 4)} avg cost + small margin"
                 ) if inconclusive_count > 0 else "No inconclusive verdicts yet"
             },
+            "verification_path_stats": verification_path_stats,
+            "tier_stats": tier_stats,
             "total_tokens": total_tokens_input + total_tokens_output,
             "avg_tokens_per_request": {
                 "input": round(total_tokens_input / len(logs)),
                 "output": round(total_tokens_output / len(logs))
-            }
+            },
+            "total_dedupe_tokens_saved": sum(log["metadata"].get("dedupe_tokens_saved", 0) for log in logs),
+            "prompt_cache_hit_rate_pct": round(total_tokens_cached / total_tokens_input * 100, 2) if total_tokens_input else 0.0
         }
     
     @staticmethod
@@ -354,6 +457,7 @@ class PerformanceLogger:
         print(f"   Total Input:           {summary['total_tokens']['input']:,}")
         print(f"   Total Output:          {summary['total_tokens']['output']:,}")
         print(f"   Avg per request:       {summary['avg_tokens_per_request']['input']:,} in / {summary['avg_tokens_per_request']['output']:,} out")
+        print(f"   Prompt cache hits:     {summary['prompt_cache_hit_rate_pct']:.1f}% of input tokens")
         print("\n" + "="*70 + "\n")
     
     @staticmethod
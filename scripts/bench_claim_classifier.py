@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark: single-pass claim classifier vs the legacy per-pattern loop.
+
+The legacy path ran re.search (with IGNORECASE) once per NORMATIVE_PATTERNS
+entry and then did a substring scan over the keyword list of the time. Both
+are reproduced here as the baseline, with that keyword list frozen below:
+the current PREDICTION_KEYWORDS lists inflections for whole-word matching
+and would not be the code that ran.
+
+Usage:
+    python scripts/bench_claim_classifier.py [iterations]
+"""
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.utils.claim_classifier import NORMATIVE_PATTERNS, classify_claim  # noqa: E402
+
+FIXTURES = ROOT / "tests" / "fixtures" / "claim_classifier_cases.json"
+
+# PREDICTION_KEYWORDS before the single-pass classifier (substring-matched)
+LEGACY_PREDICTION_KEYWORDS = [
+    'will', 'forecast', 'predict', 'expect', 'likely', 'probably',
+    'going to', 'next week', 'tomorrow', 'this week', 'future',
+    'by 2026', 'by 2030', 'in the coming'
+]
+
+
+def legacy_classify(claim: str) -> set:
+    labels = set()
+    claim_lower = claim.lower()
+    for pattern in NORMATIVE_PATTERNS:
+        if re.search(pattern, claim_lower, re.IGNORECASE):
+            labels.add("normative")
+            break
+    if any(keyword in claim_lower for keyword in LEGACY_PREDICTION_KEYWORDS):
+        labels.add("prediction")
+    return labels
+
+
+def bench(fn, claims, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for claim in claims:
+            fn(claim)
+    elapsed = time.perf_counter() - start
+    return elapsed / (iterations * len(claims)) * 1_000_000  # µs per claim
+
+
+def accuracy(fn, cases, labels_of):
+    """Fraction of fixtures whose normative/prediction labels match."""
+    scored = {"normative", "prediction"}
+    hits = sum(
+        1 for case in cases
+        if labels_of(fn(case["claim"])) & scored == set(case["labels"]) & scored
+    )
+    return hits / len(cases)
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    cases = json.loads(FIXTURES.read_text(encoding="utf-8"))
+    claims = [case["claim"] for case in cases]
+
+    legacy_us = bench(legacy_classify, claims, iterations)
+    new_us = bench(classify_claim, claims, iterations)
+    legacy_acc = accuracy(legacy_classify, cases, lambda labels: labels)
+    new_acc = accuracy(classify_claim, cases, lambda result: result.labels)
+
+    print(f"\n{'='*60}")
+    print(f"Claim classifier benchmark ({len(claims)} claims x {iterations} iterations)")
+    print(f"{'='*60}")
+    print(f"  Legacy loop:    {legacy_us:8.2f} µs/claim   accuracy {legacy_acc:.0%}")
+    print(f"  Single-pass:    {new_us:8.2f} µs/claim   accuracy {new_acc:.0%}")
+    print(f"  Speedup:        {legacy_us / new_us:8.2f}x")
+    print(f"{'='*60}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cold-start import cost of the app (`python -X importtime`).
+
+Imports `src.app` in a fresh interpreter, reports its cumulative import time,
+the slowest top-level packages, and whether any provider SDK (which should
+load lazily) was pulled in at import. Each run appends a line to
+logs/import_time.jsonl so startup cost can be tracked over time.
+
+Usage:
+    python scripts/bench_import_time.py [runs] [--no-record]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+HISTORY = ROOT / "logs" / "import_time.jsonl"
+TARGET = "src.app"
+PROVIDER_SDKS = ("openai", "anthropic", "google.genai", "exa_py")
+
+
+def import_profile() -> dict:
+    """One cold import of TARGET: {module: (self_us, cumulative_us)}."""
+    env = dict(os.environ)
+    for key in ("EXA_API_KEY", "DEEPINFRA_API_KEY", "OPENAI_API_KEY", "ANTHROPIC_API_KEY", "GEMINI_API_KEY"):
+        env.setdefault(key, "bench")  # SDK clients refuse to construct without a key
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {TARGET}"],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        # A module can appear twice (package + submodule re-entry); keep the first
+        profile.setdefault(module.strip(), (int(self_us), int(cumulative_us)))
+    return profile
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    runs = int(args[0]) if args else 5
+    record = "--no-record" not in sys.argv
+
+    totals, by_package = [], defaultdict(list)
+    eager_sdks = set()
+    for _ in range(runs):
+        profile = import_profile()
+        totals.append(profile[TARGET][1] / 1000)
+        packages = defaultdict(int)
+        for module, (self_us, _) in profile.items():
+            packages[module.split(".")[0]] += self_us
+        for package, us in packages.items():
+            by_package[package].append(us / 1000)
+        eager_sdks |= {sdk for sdk in PROVIDER_SDKS if sdk in profile}
+
+    median_ms = statistics.median(totals)
+    slowest = sorted(by_package.items(), key=lambda item: statistics.median(item[1]), reverse=True)[:10]
+
+    print(f"\n{'='*60}")
+    print(f"Import time of {TARGET} ({runs} cold runs)")
+    print(f"{'='*60}")
+    print(f"  Median:         {median_ms:8.1f} ms   (min {min(totals):.1f}, max {max(totals):.1f})")
+    print("  Slowest packages (self time, median):")
+    for package, samples in slowest:
+        print(f"    {package:<24} {statistics.median(samples):8.1f} ms")
+    print(f"  Provider SDKs imported eagerly: {', '.join(sorted(eager_sdks)) or 'none'}")
+    print(f"{'='*60}\n")
+
+    if record:
+        HISTORY.parent.mkdir(parents=True, exist_ok=True)
+        with HISTORY.open("a", encoding="utf-8") as f:
+            f.write(json.dumps({
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "commit": git_commit(),
+                "python": sys.version.split()[0],
+                "runs": runs,
+                "median_ms": round(median_ms, 1),
+                "eager_provider_sdks": sorted(eager_sdks),
+            }) + "\n")
+        print(f"Recorded to {HISTORY.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark: server throughput and tail latency under concurrent load.
+
+Sends --requests verifications (a distinct claim each, so neither the dedupe
+layer nor the evidence index answers them) from --concurrency workers and
+reports completed requests per second and the p50/p95/p99 latency of
+successful ones. Meant for a local server running against the offline
+provider stand-ins (scripts/fake_providers.py); it refuses to run against a
+server that calls real providers unless --allow-live is given. Each run
+appends a line to logs/load_bench.jsonl.
+
+Usage:
+    python scripts/bench_load.py [--url URL] [--concurrency N] [--requests N]
+                                 [--tier fast|standard|thorough] [--path /verify|/verify/news]
+                                 [--allow-live] [--no-record]
+"""
+import argparse
+import asyncio
+import json
+import math
+import subprocess
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+HISTORY = ROOT / "logs" / "load_bench.jsonl"
+TIMEOUT_SECONDS = 120
+CLAIMS = [
+    "The Eiffel Tower is in Paris",
+    "Water boils at 100 degrees Celsius at sea level",
+    "The Great Wall of China is visible from the Moon",
+    "Bitcoin was launched in 2009",
+    "Mount Everest is the tallest mountain on Earth",
+]
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list (0.0 when empty)."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(1, math.ceil(q / 100 * len(sorted_values))) - 1]
+
+
+async def run(url: str, path: str, tier: str, concurrency: int, total: int) -> dict:
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    next_index = iter(range(total))
+
+    async def worker(client: httpx.AsyncClient):
+        for i in next_index:
+            claim = f"{CLAIMS[i % len(CLAIMS)]} (load test {i})"
+            started = time.perf_counter()
+            try:
+                response = await client.get(path, params={"claim": claim, "tier": tier})
+                statuses[str(response.status_code)] += 1
+                if response.status_code == 200:
+                    latencies.append(time.perf_counter() - started)
+            except httpx.HTTPError as e:
+                statuses[type(e).__name__] += 1
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=TIMEOUT_SECONDS) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": total,
+        "ok": len(latencies),
+        "statuses": dict(sorted(statuses.items())),
+        "elapsed_s": round(elapsed, 2),
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+        "max_ms": round(percentile(latencies, 100) * 1000, 1),
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Throughput and tail latency of a local VerifAI server")
+    parser.add_argument("--url", default="http://127.0.0.1:8001")
+    parser.add_argument("--path", default="/verify")
+    parser.add_argument("--tier", default="standard")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--allow-live", action="store_true", help="also run against real providers (costs money)")
+    parser.add_argument("--no-record", action="store_true")
+    args = parser.parse_args()
+
+    health = httpx.get(f"{args.url}/health", timeout=10).json()
+    if not health.get("fake_providers") and not args.allow_live:
+        sys.exit("Server is calling real providers; start it with FAKE_PROVIDERS_URL or pass --allow-live")
+
+    print(f"\n{'='*60}")
+    print(f"{args.requests} x GET {args.path} (tier={args.tier}), {args.concurrency} concurrent")
+    print(f"{'='*60}")
+    result = asyncio.run(run(args.url, args.path, args.tier, args.concurrency, args.requests))
+    print(f"  ok         {result['ok']}/{result['requests']}   statuses {result['statuses']}")
+    print(f"  throughput {result['throughput_rps']:.2f} req/s over {result['elapsed_s']:.1f} s")
+    print(f"  latency    p50 {result['p50_ms']:.0f} ms   p95 {result['p95_ms']:.0f} ms   "
+          f"p99 {result['p99_ms']:.0f} ms   max {result['max_ms']:.0f} ms")
+    print(f"{'='*60}\n")
+
+    if not args.no_record:
+        HISTORY.parent.mkdir(parents=True, exist_ok=True)
+        with HISTORY.open("a", encoding="utf-8") as f:
+            f.write(json.dumps({
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "commit": git_commit(),
+                "fake_providers": bool(health.get("fake_providers")),
+                "path": args.path,
+                "tier": args.tier,
+                "concurrency": args.concurrency,
+                **result,
+            }) + "\n")
+        print(f"Recorded to {HISTORY.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
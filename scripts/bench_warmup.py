@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark: first-request latency to each provider host, cold vs warmed.
+
+For every provider in PROVIDER_URLS, a fresh pooled client sends one HEAD
+request (cold: DNS + TCP + TLS + round trip, what the first request after a
+deploy or idle period pays without warm-up), then a second one on the same
+client (warm: the reused keep-alive connection a warmed-up pool serves
+from). No API keys are needed; any HTTP response counts. Each run appends a
+line to logs/warmup_latency.jsonl.
+
+Usage:
+    python scripts/bench_warmup.py [runs] [--no-record]
+"""
+import asyncio
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.utils.connection_warmup import PROVIDER_URLS  # noqa: E402
+
+HISTORY = ROOT / "logs" / "warmup_latency.jsonl"
+TIMEOUT_SECONDS = 10
+
+
+async def head_ms(client: httpx.AsyncClient, url: str) -> float:
+    started = time.perf_counter()
+    await client.head(url, timeout=TIMEOUT_SECONDS)
+    return (time.perf_counter() - started) * 1000
+
+
+async def measure(url: str) -> tuple[float, float]:
+    """(cold_ms, warm_ms) for one fresh client."""
+    async with httpx.AsyncClient() as client:
+        cold = await head_ms(client, url)
+        warm = await head_ms(client, url)
+    return cold, warm
+
+
+async def bench(runs: int) -> dict:
+    results = {}
+    for name, url in PROVIDER_URLS.items():
+        cold, warm = [], []
+        try:
+            for _ in range(runs):
+                c, w = await measure(url)
+                cold.append(c)
+                warm.append(w)
+        except httpx.HTTPError as e:
+            print(f"  {name:<10} unreachable: {e}")
+            continue
+        results[name] = {
+            "cold_ms": round(statistics.median(cold), 1),
+            "warm_ms": round(statistics.median(warm), 1),
+        }
+    return results
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    runs = int(args[0]) if args else 5
+    record = "--no-record" not in sys.argv
+
+    print(f"\n{'='*60}")
+    print(f"First-request latency per provider ({runs} runs, median)")
+    print(f"{'='*60}")
+    results = asyncio.run(bench(runs))
+    for name, r in results.items():
+        saved = r["cold_ms"] - r["warm_ms"]
+        print(f"  {name:<10} cold {r['cold_ms']:8.1f} ms   warm {r['warm_ms']:8.1f} ms   saved {saved:8.1f} ms")
+    print(f"{'='*60}\n")
+
+    if record and results:
+        HISTORY.parent.mkdir(parents=True, exist_ok=True)
+        with HISTORY.open("a", encoding="utf-8") as f:
+            f.write(json.dumps({
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "commit": git_commit(),
+                "runs": runs,
+                "providers": results,
+            }) + "\n")
+        print(f"Recorded to {HISTORY.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Offline stand-ins for every provider VerifAI calls, for reproducible load tests.
+
+One local HTTP server speaks just enough of each provider's API for the app:
+
+    /deepinfra/v1/openai/chat/completions   OpenAI-compatible (DeepInfra)
+    /openai/v1/chat/completions             OpenAI
+    /anthropic/v1/messages                  Anthropic Messages
+    /gemini/v1beta/models/<model>:generateContent
+    /exa/search                             Exa search + contents
+    /newsapi/v2/everything                  NewsAPI
+
+Each provider answers after a latency drawn from a lognormal distribution
+(median_ms / p99_ms), fails with its own overload status at error_rate and
+with 429 + Retry-After at rate_limit_rate, and reports token usage from the
+prompt size and an output_tokens range. Model answers have the shape the
+agents expect (prose for prover/debunker, JSON for quick check and judge);
+quick_check.escalate_rate is the share of quick checks that come back unsure,
+sending the claim to the full debate. Override any of DEFAULT_PROFILE with
+--profile FILE (JSON, merged per provider); --latency-scale 0 measures the
+app's own overhead.
+
+Point the app at it with FAKE_PROVIDERS_URL (see config/settings.py):
+
+    python scripts/fake_providers.py --port 9100
+    FAKE_PROVIDERS_URL=http://127.0.0.1:9100 RATE_LIMIT_MAX=1000000 python run.py
+    python scripts/bench_load.py --concurrency 32 --requests 500
+
+Usage:
+    python scripts/fake_providers.py [--host H] [--port P] [--profile FILE] [--latency-scale X] [--seed N]
+"""
+import argparse
+import asyncio
+import copy
+import json
+import math
+import random
+import re
+import sys
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+DEFAULT_PORT = 9100
+
+# Latencies are per call, roughly what each provider shows in production logs
+DEFAULT_PROFILE = {
+    "deepinfra": {"median_ms": 900, "p99_ms": 4000, "error_rate": 0.01, "rate_limit_rate": 0.0, "output_tokens": [80, 200]},
+    "openai": {"median_ms": 700, "p99_ms": 3000, "error_rate": 0.005, "rate_limit_rate": 0.0, "output_tokens": [80, 200]},
+    "anthropic": {"median_ms": 1500, "p99_ms": 6000, "error_rate": 0.01, "rate_limit_rate": 0.0, "output_tokens": [200, 450]},
+    "gemini": {"median_ms": 600, "p99_ms": 2500, "error_rate": 0.005, "rate_limit_rate": 0.0, "output_tokens": [80, 200]},
+    "exa": {"median_ms": 1200, "p99_ms": 5000, "error_rate": 0.005, "rate_limit_rate": 0.0, "document_chars": 4000},
+    "newsapi": {"median_ms": 400, "p99_ms": 1500, "error_rate": 0.005, "rate_limit_rate": 0.0},
+    "quick_check": {"escalate_rate": 0.3},
+}
+
+# Status a provider returns when it is "down" or overloaded
+_ERROR_STATUS = {"deepinfra": 503, "openai": 503, "anthropic": 529, "gemini": 503, "exa": 500, "newsapi": 500}
+_DOMAINS = ["reuters.com", "apnews.com", "en.wikipedia.org", "nasa.gov", "nature.com", "bbc.co.uk", "example.org"]
+_SYLLABLES = ["ka", "lo", "mi", "ter", "ran", "so", "vel", "di", "num", "pra", "ex", "to", "gen", "ul", "ber"]
+_Z_99 = 2.3263  # standard normal 99th percentile
+
+
+def load_profile(path: Optional[str] = None) -> dict:
+    """DEFAULT_PROFILE, with a JSON file's settings merged in per provider."""
+    profile = copy.deepcopy(DEFAULT_PROFILE)
+    if path:
+        for provider, overrides in json.loads(Path(path).read_text(encoding="utf-8")).items():
+            profile.setdefault(provider, {}).update(overrides)
+    return profile
+
+
+def count_tokens(text: str) -> int:
+    """The app's own estimate (~4 characters per token), so quotas and costs line up."""
+    return math.ceil(len(text) / 4)
+
+
+class FakeProvider:
+    """Latency, failure and output-size draws for one provider."""
+
+    def __init__(self, name: str, settings: dict, rng: random.Random, latency_scale: float = 1.0):
+        self.name = name
+        self.settings = settings
+        self.rng = rng
+        self.latency_scale = latency_scale
+        median = settings.get("median_ms", 0) / 1000
+        p99 = max(settings.get("p99_ms", 0) / 1000, median)
+        self._mu = math.log(median) if median > 0 else None
+        self._sigma = math.log(p99 / median) / _Z_99 if median > 0 else 0.0
+
+    def latency(self) -> float:
+        """Seconds to wait before answering (lognormal around median_ms, p99 at p99_ms)."""
+        if self._mu is None:
+            return 0.0
+        return self.rng.lognormvariate(self._mu, self._sigma) * self.latency_scale
+
+    def failure(self) -> Optional[int]:
+        """HTTP status to fail this call with, or None to answer it."""
+        draw = self.rng.random()
+        if draw < self.settings.get("rate_limit_rate", 0.0):
+            return 429
+        if draw < self.settings.get("rate_limit_rate", 0.0) + self.settings.get("error_rate", 0.0):
+            return _ERROR_STATUS.get(self.name, 500)
+        return None
+
+    def output_tokens(self) -> int:
+        low, high = self.settings.get("output_tokens", [100, 100])
+        return self.rng.randint(low, high)
+
+
+def _prose(rng: random.Random, tokens: int) -> str:
+    # ~0.75 words per token; made-up words, so generated documents are not near-duplicates of each other
+    words = ("".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(1, 3))) for _ in range(max(1, int(tokens * 0.75))))
+    return " ".join(words).capitalize() + "."
+
+
+def model_answer(prompt: str, output_tokens: int, rng: random.Random, escalate_rate: float) -> str:
+    """What the agent behind `prompt` expects: quick-check JSON, judge JSON or a short argument."""
+    prediction = "PREDICTION:" in prompt
+    stances = re.search(r"source_stances must contain exactly (\d+) entries", prompt)
+    if stances:
+        unsure = rng.random() < escalate_rate
+        return json.dumps({
+            "verdict": "Likely" if prediction else "Verified",
+            "confidence_score": 0.6 if unsure else 0.93,
+            "summary": _prose(rng, 20),
+            "source_stances": ["supports"] * int(stances.group(1)),
+            "evidence_for": [{"source": "Source 1", "point": _prose(rng, 15), "weight": 1.0}],
+            "evidence_against": [],
+            "reasoning": _prose(rng, max(10, output_tokens - 60)),
+        })
+    if '"verdict"' in prompt:
+        return json.dumps({
+            "verdict": "Likely" if prediction else "Verified",
+            "confidence_score": round(rng.uniform(0.7, 0.95), 2),
+            "summary": _prose(rng, 25),
+            "evidence_for": [{"source": "Source 1", "point": _prose(rng, 15), "weight": 1.0}],
+            "evidence_against": [{"source": "Source 2", "point": _prose(rng, 15), "weight": 1.0}],
+            "reasoning": _prose(rng, max(10, output_tokens - 80)),
+        })
+    return _prose(rng, output_tokens)
+
+
+def _documents(rng: random.Random, query: str, count: int, chars: int, max_age_hours: float) -> list[dict]:
+    now = datetime.now(timezone.utc)
+    slug = re.sub(r"[^a-z0-9]+", "-", query.lower()).strip("-")[:60] or "claim"
+    documents = []
+    for i in range(count):
+        body = f"{query}. "
+        while len(body) < chars:
+            body += _prose(rng, 40) + " "
+        documents.append({
+            "url": f"https://{_DOMAINS[i % len(_DOMAINS)]}/{slug}-{i}",
+            "title": f"{query[:80]} ({i + 1})",
+            "text": body[:chars],
+            "published": now - timedelta(hours=rng.uniform(0, max_age_hours)),
+        })
+    return documents
+
+
+def create_app(profile: Optional[dict] = None, latency_scale: float = 1.0, seed: Optional[int] = None) -> FastAPI:
+    """The stand-in server; `profile` defaults to DEFAULT_PROFILE."""
+    profile = profile or load_profile()
+    rng = random.Random(seed)
+    providers = {
+        name: FakeProvider(name, settings, rng, latency_scale)
+        for name, settings in profile.items() if name in _ERROR_STATUS
+    }
+    escalate_rate = profile.get("quick_check", {}).get("escalate_rate", 0.0)
+    calls: Counter = Counter()
+    app = FastAPI(title="VerifAI fake providers")
+
+    async def simulate(name: str) -> Optional[int]:
+        """Wait out the call's latency; returns the status to fail with, if any."""
+        provider = providers[name]
+        await asyncio.sleep(provider.latency())
+        status = provider.failure()
+        calls[f"{name} {status or 200}"] += 1
+        return status
+
+    def retry_headers(status: int) -> dict:
+        return {"retry-after": "1"} if status == 429 else {}
+
+    async def chat_completions(name: str, request: Request):
+        body = await request.json()
+        status = await simulate(name)
+        if status:
+            return JSONResponse(
+                {"error": {"message": f"fake {name} failure", "type": "server_error", "code": status}},
+                status_code=status, headers=retry_headers(status)
+            )
+        prompt = "\n".join(str(m.get("content", "")) for m in body.get("messages", []))
+        output_tokens = min(providers[name].output_tokens(), body.get("max_tokens") or 10**6)
+        input_tokens = count_tokens(prompt)
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:24]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "fake"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": model_answer(prompt, output_tokens, rng, escalate_rate)},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": input_tokens,
+                "completion_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+                "prompt_tokens_details": {"cached_tokens": 0},
+            },
+        }
+
+    @app.post("/deepinfra/v1/openai/chat/completions")
+    async def deepinfra_chat(request: Request):
+        return await chat_completions("deepinfra", request)
+
+    @app.post("/openai/v1/chat/completions")
+    async def openai_chat(request: Request):
+        return await chat_completions("openai", request)
+
+    @app.post("/anthropic/v1/messages")
+    async def anthropic_messages(request: Request):
+        body = await request.json()
+        status = await simulate("anthropic")
+        if status:
+            kind = "rate_limit_error" if status == 429 else "overloaded_error"
+            return JSONResponse(
+                {"type": "error", "error": {"type": kind, "message": "fake anthropic failure"}},
+                status_code=status, headers=retry_headers(status)
+            )
+
+        def text_of(content) -> str:
+            if isinstance(content, str):
+                return content
+            return "\n".join(block.get("text", "") for block in content)
+
+        prompt = text_of(body.get("system", "")) + "\n" + "\n".join(
+            text_of(m.get("content", "")) for m in body.get("messages", [])
+        )
+        output_tokens = min(providers["anthropic"].output_tokens(), body.get("max_tokens") or 10**6)
+        return {
+            "id": f"msg_{uuid.uuid4().hex[:24]}",
+            "type": "message",
+            "role": "assistant",
+            "model": body.get("model", "fake"),
+            "content": [{"type": "text", "text": model_answer(prompt, output_tokens, rng, escalate_rate)}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {
+                "input_tokens": count_tokens(prompt),
+                "output_tokens": output_tokens,
+                "cache_creation_input_tokens": 0,
+                "cache_read_input_tokens": 0,
+            },
+        }
+
+    @app.get("/anthropic/v1/models")
+    async def anthropic_models():
+        return {"data": [], "has_more": False, "first_id": None, "last_id": None}
+
+    @app.post("/gemini/{version}/models/{model_action}")
+    async def gemini_generate(version: str, model_action: str, request: Request):
+        body = await request.json()
+        status = await simulate("gemini")
+        if status:
+            return JSONResponse(
+                {"error": {"code": status, "message": "fake gemini failure",
+                           "status": "RESOURCE_EXHAUSTED" if status == 429 else "UNAVAILABLE"}},
+                status_code=status, headers=retry_headers(status)
+            )
+        prompt = "\n".join(
+            part.get("text", "") for content in body.get("contents", []) for part in content.get("parts", [])
+        )
+        max_tokens = (body.get("generationConfig") or {}).get("maxOutputTokens") or 10**6
+        output_tokens = min(providers["gemini"].output_tokens(), max_tokens)
+        input_tokens = count_tokens(prompt)
+        return {
+            "candidates": [{
+                "content": {"role": "model", "parts": [{"text": model_answer(prompt, output_tokens, rng, escalate_rate)}]},
+                "finishReason": "STOP",
+                "index": 0,
+            }],
+            "usageMetadata": {
+                "promptTokenCount": input_tokens,
+                "candidatesTokenCount": output_tokens,
+                "totalTokenCount": input_tokens + output_tokens,
+            },
+            "modelVersion": model_action.split(":")[0],
+        }
+
+    @app.get("/gemini/{version}/models")
+    async def gemini_models(version: str):
+        return {"models": []}
+
+    @app.post("/exa/search")
+    async def exa_search(request: Request):
+        body = await request.json()
+        status = await simulate("exa")
+        if status:
+            return JSONResponse({"error": "fake exa failure"}, status_code=status, headers=retry_headers(status))
+        settings = providers["exa"].settings
+        documents = _documents(
+            rng, body.get("query", ""), int(body.get("numResults") or 5), settings.get("document_chars", 4000), 24 * 30
+        )
+        return {
+            "requestId": uuid.uuid4().hex,
+            "resolvedSearchType": "neural",
+            "results": [{
+                "id": doc["url"],
+                "url": doc["url"],
+                "title": doc["title"],
+                "score": round(1 - i * 0.05, 3),
+                "publishedDate": doc["published"].strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+                "author": None,
+                "text": doc["text"],
+            } for i, doc in enumerate(documents)],
+        }
+
+    @app.get("/newsapi/v2/everything")
+    async def newsapi_everything(q: str = "", pageSize: int = 20):
+        status = await simulate("newsapi")
+        if status:
+            return JSONResponse(
+                {"status": "error", "code": "rateLimited" if status == 429 else "unexpectedError",
+                 "message": "fake newsapi failure"},
+                status_code=status, headers=retry_headers(status)
+            )
+        documents = _documents(rng, q, min(pageSize, 20), 800, 48)
+        return {
+            "status": "ok",
+            "totalResults": len(documents),
+            "articles": [{
+                "source": {"id": None, "name": doc["url"].split("/")[2]},
+                "author": None,
+                "title": doc["title"],
+                "description": doc["text"][:200],
+                "url": doc["url"],
+                "publishedAt": doc["published"].strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "content": doc["text"],
+            } for doc in documents],
+        }
+
+    @app.get("/stats")
+    async def stats():
+        """Calls answered so far, by provider and status."""
+        return {"calls": dict(sorted(calls.items())), "latency_scale": latency_scale, "profile": profile}
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline provider stand-ins for load benchmarks")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--profile", help="JSON file overriding DEFAULT_PROFILE per provider")
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="multiply every latency (0 = answer at once)")
+    parser.add_argument("--seed", type=int, help="seed for reproducible latency/failure draws")
+    args = parser.parse_args()
+
+    import uvicorn
+
+    app = create_app(load_profile(args.profile), latency_scale=args.latency_scale, seed=args.seed)
+    print(f"Fake providers on http://{args.host}:{args.port} - start the app with "
+          f"FAKE_PROVIDERS_URL=http://{args.host}:{args.port}", file=sys.stderr)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
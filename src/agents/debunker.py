@@ -1,111 +1,35 @@
 """Debunker Agent: Finds flaws and counter-evidence."""
 import logging
-from openai import AsyncOpenAI
-from google import genai
-from google.genai import types
+from typing import Optional
 
-from config.settings import (
-    DEEPINFRA_API_KEY, DEEPINFRA_BASE_URL, OPENAI_API_KEY, OPENAI_BASE_URL,
-    DEBUNKER_MODEL, DEBUNKER_FALLBACK_MODEL, DEBUNKER_TEMPERATURE,
-    DEBUNKER_MAX_TOKENS, DEBUNKER_SYSTEM_PROMPT
-)
-from src.utils.token_tracker import token_tracker
+from src.agents.prompts import DEBUNKER, build_agent_prompt
+from src.llm import LLMUnavailable, llm_gateway
+from src.utils.deadline import Deadline
 
 logger = logging.getLogger(__name__)
 
-# Initialize clients
-deepinfra_client = AsyncOpenAI(
-    api_key=DEEPINFRA_API_KEY,
-    base_url=DEEPINFRA_BASE_URL,
-    max_retries=0
-)
-openai_client = AsyncOpenAI(
-    api_key=OPENAI_API_KEY,
-    base_url=OPENAI_BASE_URL,
-    max_retries=0
-)
-
-
-async def run_debunker_agent(claim: str, data_points: list[str], is_prediction: bool = False) -> str:
+async def run_debunker_agent(
+    claim: str,
+    data_points: list[str],
+    is_prediction: bool = False,
+    model: Optional[str] = None,
+    deadline: Optional[Deadline] = None
+) -> str:
     """
     Debunker Agent: Finds flaws and counter-evidence.
-    Primary: DeepInfra DeepSeek-V3
-    Fallback: Gemini (only if DeepInfra fails)
-
-    Handles both factual claims and predictions.
-    """
-    context = "\n\n".join([f"Source {i+1}: {text}" for i, text in enumerate(data_points)])
-
-    if is_prediction:
-        prompt = f"""You are a critical skeptic challenging this PREDICTION.
-
-PREDICTION: {claim}
-
-SOURCES (forecasts, expert opinions, trend data):
-{context}
-
-Your task: Find contradictions, uncertainty, or evidence that CHALLENGES this prediction's likelihood.
-Point out limitations in forecasts, conflicting expert opinions, or factors that could prevent it.
-Be critical but honest - only cite what the sources actually say.
-
-Return 2-3 sentences arguing AGAINST the prediction or noting its uncertainty."""
-    else:
-        prompt = f"""You are a critical skeptic trying to DEBUNK or find flaws in this claim.
+    Primary: DeepInfra DeepSeek-V3 (or the tier's `model` override)
+    Fallback: OpenAI GPT-4o-mini (only if DeepInfra fails)
 
-CLAIM: {claim}
+    Handles both factual claims and predictions. Provider calls are bounded
+    by `deadline`; the fallback is skipped when too little of it is left.
 
-SOURCES:
-{context}
-
-Your task: Find contradictions, gaps, or evidence that CHALLENGES the claim.
-Be critical but honest - only cite what the sources actually say.
-If the claim appears true, point out any limitations or caveats in the evidence.
-
-Return 2-3 sentences arguing AGAINST the claim or noting weaknesses in the evidence."""
-
-    # Try DeepInfra first
+    Raises:
+        LLMUnavailable: No model produced an argument; the debate counts it as missing.
+    """
+    prompt = build_agent_prompt(DEBUNKER, claim, data_points, is_prediction)
     try:
-        response = await deepinfra_client.chat.completions.create(
-            model=DEBUNKER_MODEL,
-            messages=[
-                {"role": "system", "content": DEBUNKER_SYSTEM_PROMPT},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=DEBUNKER_TEMPERATURE,
-            max_tokens=DEBUNKER_MAX_TOKENS
-        )
-
-        # Track token usage
-        token_tracker.set_debunker_tokens(
-            model=DEBUNKER_MODEL,
-            input_tokens=response.usage.prompt_tokens,
-            output_tokens=response.usage.completion_tokens
-        )
-
-        return response.choices[0].message.content.strip()
-    except Exception as e:
-        logger.warning("debunker.deepinfra.failed err=%s", str(e)[:200])
-
-        # Fallback to OpenAI GPT-4o-mini
-        try:
-            response = await openai_client.chat.completions.create(
-                model=DEBUNKER_FALLBACK_MODEL,
-                messages=[
-                    {"role": "system", "content": DEBUNKER_SYSTEM_PROMPT},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=DEBUNKER_TEMPERATURE,
-                max_tokens=DEBUNKER_MAX_TOKENS
-            )
-
-            # Track OpenAI usage
-            token_tracker.set_debunker_tokens(
-                model=DEBUNKER_FALLBACK_MODEL,
-                input_tokens=response.usage.prompt_tokens,
-                output_tokens=response.usage.completion_tokens
-            )
-
-            return response.choices[0].message.content.strip()
-        except Exception as openai_error:
-            logger.error("debunker.openai.failed err=%s", openai_error)
-            return "Unable to generate debunker argument."
+        result = await llm_gateway.complete(DEBUNKER, prompt, model=model, deadline=deadline)
+    except LLMUnavailable as e:
+        logger.error("debunker.failed err=%s", e)
+        raise
+    return result.text.strip()
@@ -2,19 +2,14 @@
 import json
 import re
 import logging
-import asyncio
-from anthropic import Anthropic
+from typing import Optional
 
-from config.settings import (
-    ANTHROPIC_API_KEY, JUDGE_MODEL, JUDGE_MAX_TOKENS
-)
-from src.utils.token_tracker import token_tracker
+from src.agents.prompts import JUDGE, build_judge_prompt
+from src.llm import llm_gateway
+from src.utils.deadline import Deadline
 
 logger = logging.getLogger(__name__)
 
-# Initialize client
-claude_client = Anthropic(api_key=ANTHROPIC_API_KEY)
-
 
 async def run_judge_agent(
     claim: str, 
@@ -22,128 +17,31 @@ async def run_judge_agent(
     weights: list[float], 
     prover_arg: str, 
     debunker_arg: str, 
-    is_prediction: bool = False
+    is_prediction: bool = False,
+    model: Optional[str] = None,
+    source_labels: Optional[list[str]] = None,
+    missing_arguments: Optional[list[str]] = None,
+    deadline: Optional[Deadline] = None
 ) -> dict:
     """
-    Judge Agent (Claude 3.5 Haiku): Weighs both arguments and issues final verdict.
+    Judge Agent (Claude 3.5 Haiku, or the tier's `model` override): Weighs both
+    arguments and issues final verdict.
     Handles both factual verification and prediction likelihood assessment.
+    `source_labels` name each source (domain and credibility class) beside its weight.
+    `missing_arguments` flags debaters that timed out, so the judge rules on a
+    one-sided debate knowingly. The Anthropic call is bounded by `deadline`.
     """
-    # Combine sources with weights for judge context
-    context_parts = []
-    for i, (text, weight) in enumerate(zip(data_points, weights)):
-        weight_label = " (Wikipedia - 0.5x weight)" if weight == 0.5 else " (1.0x weight)"
-        context_parts.append(f"Source {i+1}{weight_label}: {text}")
-    context = "\n\n".join(context_parts)
-
-    if is_prediction:
-        prompt = f"""You are a high-accuracy Prediction Analyst. Two experts have debated the likelihood of this prediction. Weigh both arguments and assess probability.
-
-PREDICTION: {claim}
-
-OPTIMIST'S ARGUMENT (arguing prediction is LIKELY):
-{prover_arg}
-
-SKEPTIC'S ARGUMENT (arguing prediction is UNLIKELY or UNCERTAIN):
-{debunker_arg}
-
-ORIGINAL SOURCES (forecasts, expert opinions, trend data):
-{context}
-
-TASK:
-1. Weigh both arguments against the raw sources.
-2. Check for consensus or disagreement among forecasts/experts.
-3. Wikipedia sources should be weighted at 0.5x (half weight) compared to other sources at 1.0x.
-4. Provide STRUCTURED REASONING with specific evidence points.
-
-Respond in JSON format with these exact fields:
-{{
-    "verdict": "Likely|Unlikely|Uncertain",
-    "confidence_score": 0.65,
-    "summary": "One sentence summary explaining the prediction assessment",
-    "evidence_for": [
-        {{"source": "Weather.com", "point": "80% chance of rain", "weight": 1.0}}
-    ],
-    "evidence_against": [
-        {{"source": "Local forecast", "point": "Clear skies predicted", "weight": 1.0}}
-    ],
-    "reasoning": "Detailed explanation of how forecasts/opinions were weighed and prediction likelihood assessed."
-}}
-
-IMPORTANT:
-- List ALL key evidence points from forecasts, expert opinions, and trend data
-- Include source names and their weight
-- If no contradicting forecasts, evidence_against can be empty array []"""
-    else:
-        prompt = f"""You are a high-accuracy Verification Judge. Two advocates have debated this claim. Weigh both arguments and issue a final ruling.
-
-CLAIM: {claim}
-
-PROVER'S ARGUMENT (arguing FOR the claim):
-{prover_arg}
-
-DEBUNKER'S ARGUMENT (arguing AGAINST the claim):
-{debunker_arg}
-
-ORIGINAL SOURCES:
-{context}
-
-TASK:
-1. **CRITICAL FIRST CHECK**: Detect if the claim contains NORMATIVE/PHILOSOPHICAL language:
-   - Value judgments: "inherently evil", "morally wrong", "should/shouldn't", "good/bad", "right/wrong"
-   - Subjective assessments: "beautiful", "best", "worthy", "deserves"
-   - Philosophical constructs: "justice", "freedom", "evil", "virtue" (when used as absolute moral categories)
-   
-   If detected: Set verdict to "Inconclusive" and confidence_score < 0.40 (this triggers automatic refund to protect brand integrity).
-   
-   Reasoning: VerifAI is a "Truth Settlement Layer" for FACTUAL claims. Philosophical/moral debates lack empirical consensus and cannot be objectively verified. Charging customers for subjective opinions would harm long-term trust.
-
-2. For FACTUAL claims: Weigh both arguments against the raw sources.
-3. Check for contradictions between sources.
-4. Wikipedia sources should be weighted at 0.5x (half weight) compared to other sources at 1.0x.
-5. Provide STRUCTURED REASONING with specific evidence points.
-
-Respond in JSON format with these exact fields:
-{{
-    "verdict": "Verified|Unverified|Inconclusive",
-    "confidence_score": 0.95,
-    "summary": "One sentence summary explaining the ruling",
-    "evidence_for": [
-        {{"source": "Wikipedia", "point": "Confirms Bitcoin launched January 2009", "weight": 0.5}},
-        {{"source": "Blockchain.com", "point": "Genesis block mined 2009-01-03", "weight": 1.0}}
-    ],
-    "evidence_against": [
-        {{"source": "TechBlog", "point": "Whitepaper published October 2008", "weight": 1.0}}
-    ],
-    "reasoning": "Detailed explanation of how evidence was weighed and why this verdict was reached. Include any important caveats or nuances."
-}}
-
-IMPORTANT: 
-- List ALL key evidence points from both prover and debunker arguments
-- Include source names and their weight (0.5 for Wikipedia, 1.0 for others)
-- If no contradicting evidence exists, evidence_against can be empty array []
-- Be specific about what each source says, not just "supports claim"
-- In reasoning field, explain the balance of evidence and any important context"""
+    # Same system + claim/sources prefix as the debaters; the judge's own
+    # instructions, the debate arguments and the weights form the tail
+    prompt = build_judge_prompt(
+        claim, data_points, weights, prover_arg, debunker_arg, is_prediction, source_labels, missing_arguments
+    )
 
     try:
-        # Run synchronous Anthropic call in thread pool to avoid blocking
-        response = await asyncio.to_thread(
-            lambda: claude_client.messages.create(
-                model=JUDGE_MODEL,
-                max_tokens=JUDGE_MAX_TOKENS,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
-        )
-
-        # Track token usage
-        token_tracker.set_judge_tokens(
-            model=JUDGE_MODEL,
-            input_tokens=response.usage.input_tokens,
-            output_tokens=response.usage.output_tokens
-        )
+        # Transient errors (overloaded, 5xx, connection resets) are retried while the deadline allows
+        response = await llm_gateway.complete(JUDGE, prompt, model=model, deadline=deadline)
 
-        response_text = response.content[0].text
+        response_text = response.text
         try:
             result = json.loads(response_text)
         except json.JSONDecodeError:
@@ -0,0 +1,277 @@
+"""
+Shared prompt builder for the verification agents.
+
+Every agent prompt uses the same three-part layout, so all agents in a request
+send one common prefix:
+
+1. system   - role-neutral instructions, byte-identical for every agent and request
+2. evidence - claim + numbered sources, byte-identical for every agent in a request
+3. task     - the role's instructions and output format, then the per-call tail
+              (debate arguments, source weights)
+
+DeepInfra and OpenAI cache matching prompt prefixes automatically, so calls that
+land on the same model within a request (retries, hedges, fallbacks to OpenAI
+for both the quick check and the debunker) reuse the system + evidence prefix.
+Anthropic only serves the judge, once per request, so it gets no cache
+breakpoints: a cache write there would cost 1.25x and never be read. Gemini gets
+the same order as plain text.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from config.settings import PROVER_SYSTEM_PROMPT, DEBUNKER_SYSTEM_PROMPT
+
+PROVER = "prover"
+DEBUNKER = "debunker"
+JUDGE = "judge"
+QUICK_CHECK = "quick_check"
+
+# ============================================================================
+# Shared prefix and role instructions (the first part of each task tail)
+# ============================================================================
+
+SHARED_SYSTEM = """You are one of several VerifAI agents reviewing the same claim and sources.
+The CLAIM (or PREDICTION) and its numbered SOURCES come first; your role, instructions and output format follow them.
+Refer to sources as "Source N" and only cite what they actually say."""
+
+_PROVER_CLAIM = f"""{PROVER_SYSTEM_PROMPT}
+You are a skilled advocate building the STRONGEST case to PROVE the claim is true.
+
+Your task: Find evidence in the sources that SUPPORTS the claim. Present the most convincing argument.
+Be persuasive but honest - only cite what the sources actually say.
+
+Return 2-3 sentences arguing FOR the claim."""
+
+_PROVER_PREDICTION = f"""{PROVER_SYSTEM_PROMPT}
+You are a skilled analyst building the STRONGEST case that the PREDICTION is likely to occur.
+
+Your task: Find evidence, forecasts, or expert opinions in the sources that SUPPORT this prediction being likely.
+Present the most convincing argument for why this prediction could come true.
+Be persuasive but honest - only cite what the sources actually say.
+
+Return 2-3 sentences arguing FOR the prediction's likelihood."""
+
+_DEBUNKER_CLAIM = f"""{DEBUNKER_SYSTEM_PROMPT}
+You are a critical skeptic trying to DEBUNK or find flaws in the claim.
+
+Your task: Find contradictions, gaps, or evidence in the sources that CHALLENGES the claim.
+Be critical but honest - only cite what the sources actually say.
+If the claim appears true, point out any limitations or caveats in the evidence.
+
+Return 2-3 sentences arguing AGAINST the claim or noting weaknesses in the evidence."""
+
+_DEBUNKER_PREDICTION = f"""{DEBUNKER_SYSTEM_PROMPT}
+You are a critical skeptic challenging the PREDICTION.
+
+Your task: Find contradictions, uncertainty, or evidence in the sources that CHALLENGES this prediction's likelihood.
+Point out limitations in forecasts, conflicting expert opinions, or factors that could prevent it.
+Be critical but honest - only cite what the sources actually say.
+
+Return 2-3 sentences arguing AGAINST the prediction or noting its uncertainty."""
+
+_QUICK_CHECK = """You are a fast, careful fact-checker. Decide whether the sources settle the {subject}.
+
+For EACH source, decide whether it supports the claim, refutes it, or is irrelevant.
+Only rule with high confidence when the sources clearly and consistently settle the question.
+
+Respond in JSON format with these exact fields:
+{{
+    "verdict": "{verdicts}",
+    "confidence_score": 0.9,
+    "summary": "One sentence summary explaining the ruling",
+    "source_stances": ["supports", "refutes", "irrelevant"],
+    "evidence_for": [{{"source": "Source 1", "point": "What it says", "weight": 1.0}}],
+    "evidence_against": [],
+    "reasoning": "Short explanation of how the sources settle the claim."
+}}"""
+
+_JUDGE_CLAIM = """You are a high-accuracy Verification Judge. Two advocates have debated the claim. Weigh both arguments and issue a final ruling.
+
+The CLAIM and the ORIGINAL SOURCES are above. Below them come the PROVER'S ARGUMENT (arguing FOR the claim), the DEBUNKER'S ARGUMENT (arguing AGAINST the claim) and the weight of each source.
+
+TASK:
+1. **CRITICAL FIRST CHECK**: Detect if the claim contains NORMATIVE/PHILOSOPHICAL language:
+   - Value judgments: "inherently evil", "morally wrong", "should/shouldn't", "good/bad", "right/wrong"
+   - Subjective assessments: "beautiful", "best", "worthy", "deserves"
+   - Philosophical constructs: "justice", "freedom", "evil", "virtue" (when used as absolute moral categories)
+
+   If detected: Set verdict to "Inconclusive" and confidence_score < 0.40 (this triggers automatic refund to protect brand integrity).
+
+   Reasoning: VerifAI is a "Truth Settlement Layer" for FACTUAL claims. Philosophical/moral debates lack empirical consensus and cannot be objectively verified. Charging customers for subjective opinions would harm long-term trust.
+
+2. For FACTUAL claims: Weigh both arguments against the raw sources.
+3. Check for contradictions between sources.
+4. Weight each source by the SOURCE WEIGHTS given (domain credibility and recency; 1.0x is a typical source).
+5. Provide STRUCTURED REASONING with specific evidence points.
+
+Respond in JSON format with these exact fields:
+{
+    "verdict": "Verified|Unverified|Inconclusive",
+    "confidence_score": 0.95,
+    "summary": "One sentence summary explaining the ruling",
+    "evidence_for": [
+        {"source": "Source 1", "point": "Confirms Bitcoin launched January 2009", "weight": 0.5},
+        {"source": "Source 2", "point": "Genesis block mined 2009-01-03", "weight": 1.0}
+    ],
+    "evidence_against": [
+        {"source": "Source 3", "point": "Whitepaper published October 2008", "weight": 1.0}
+    ],
+    "reasoning": "Detailed explanation of how evidence was weighed and why this verdict was reached. Include any important caveats or nuances."
+}
+
+IMPORTANT:
+- List ALL key evidence points from both prover and debunker arguments
+- Include source names and their weight
+- If no contradicting evidence exists, evidence_against can be empty array []
+- Be specific about what each source says, not just "supports claim"
+- In reasoning field, explain the balance of evidence and any important context"""
+
+_JUDGE_PREDICTION = """You are a high-accuracy Prediction Analyst. Two experts have debated the likelihood of the prediction. Weigh both arguments and assess probability.
+
+The PREDICTION and the ORIGINAL SOURCES (forecasts, expert opinions, trend data) are above. Below them come the OPTIMIST'S ARGUMENT (arguing the prediction is LIKELY), the SKEPTIC'S ARGUMENT (arguing it is UNLIKELY or UNCERTAIN) and the weight of each source.
+
+TASK:
+1. Weigh both arguments against the raw sources.
+2. Check for consensus or disagreement among forecasts/experts.
+3. Weight each source by the SOURCE WEIGHTS given (domain credibility and recency; 1.0x is a typical source).
+4. Provide STRUCTURED REASONING with specific evidence points.
+
+Respond in JSON format with these exact fields:
+{
+    "verdict": "Likely|Unlikely|Uncertain",
+    "confidence_score": 0.65,
+    "summary": "One sentence summary explaining the prediction assessment",
+    "evidence_for": [
+        {"source": "Weather.com", "point": "80% chance of rain", "weight": 1.0}
+    ],
+    "evidence_against": [
+        {"source": "Local forecast", "point": "Clear skies predicted", "weight": 1.0}
+    ],
+    "reasoning": "Detailed explanation of how forecasts/opinions were weighed and prediction likelihood assessed."
+}
+
+IMPORTANT:
+- List ALL key evidence points from forecasts, expert opinions, and trend data
+- Include source names and their weight
+- If no contradicting forecasts, evidence_against can be empty array []"""
+
+ROLE_INSTRUCTIONS = {
+    (PROVER, False): _PROVER_CLAIM,
+    (PROVER, True): _PROVER_PREDICTION,
+    (DEBUNKER, False): _DEBUNKER_CLAIM,
+    (DEBUNKER, True): _DEBUNKER_PREDICTION,
+    (QUICK_CHECK, False): _QUICK_CHECK.format(subject="CLAIM", verdicts="Verified|Unverified|Inconclusive"),
+    (QUICK_CHECK, True): _QUICK_CHECK.format(subject="PREDICTION", verdicts="Likely|Unlikely|Uncertain"),
+    (JUDGE, False): _JUDGE_CLAIM,
+    (JUDGE, True): _JUDGE_PREDICTION,
+}
+
+
+@dataclass(frozen=True)
+class AgentPrompt:
+    """One agent call laid out as a shared prefix (system + evidence) plus the role's task tail."""
+    system: str
+    evidence: str
+    task: str
+
+    def openai_messages(self) -> List[Dict[str, str]]:
+        """Chat messages for OpenAI-compatible APIs (automatic prefix caching)."""
+        return [
+            {"role": "system", "content": self.system},
+            {"role": "user", "content": f"{self.evidence}\n\n{self.task}"}
+        ]
+
+    def anthropic_request(self) -> Dict[str, Any]:
+        """`system` and `messages` kwargs for Anthropic (no cache breakpoints, see module docstring)."""
+        return {
+            "system": self.system,
+            "messages": [{
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": self.evidence},
+                    {"type": "text", "text": self.task}
+                ]
+            }]
+        }
+
+    def as_text(self) -> str:
+        """Single prompt string (Gemini), same prefix order."""
+        return f"{self.system}\n\n{self.evidence}\n\n{self.task}"
+
+
+def build_evidence_block(claim: str, data_points: list[str], is_prediction: bool = False) -> str:
+    """Claim + numbered sources, identical for every agent so it can be cached."""
+    context = "\n\n".join([f"Source {i+1}: {text}" for i, text in enumerate(data_points)])
+    if is_prediction:
+        return f"PREDICTION: {claim}\n\nSOURCES (forecasts, expert opinions, trend data):\n{context}"
+    return f"CLAIM: {claim}\n\nSOURCES:\n{context}"
+
+
+def build_agent_prompt(role: str, claim: str, data_points: list[str], is_prediction: bool = False) -> AgentPrompt:
+    """Prompt for the prover, debunker or quick check (no per-call inputs beyond the evidence)."""
+    task = ROLE_INSTRUCTIONS[(role, is_prediction)]
+    if role == QUICK_CHECK:
+        task += f"\n\nsource_stances must contain exactly {len(data_points)} entries, one per source in order."
+    return AgentPrompt(
+        system=SHARED_SYSTEM,
+        evidence=build_evidence_block(claim, data_points, is_prediction),
+        task=task
+    )
+
+
+def _missing_arguments_note(missing: Optional[list[str]], is_prediction: bool) -> str:
+    """Instruction for a debate where an advocate timed out (empty when both argued)."""
+    if not missing:
+        return ""
+    names = {PROVER: "OPTIMIST" if is_prediction else "PROVER", DEBUNKER: "SKEPTIC" if is_prediction else "DEBUNKER"}
+    sides = " and ".join(f"{names[role]}'S ARGUMENT" for role in missing)
+    return (
+        f"\nNOTE: The {sides} is MISSING (the agent timed out or failed). Do not treat the missing side as "
+        "conceding: weigh the sources directly for it, and lower confidence_score to reflect the one-sided debate.\n"
+    )
+
+
+def build_judge_prompt(
+    claim: str,
+    data_points: list[str],
+    weights: list[float],
+    prover_arg: str,
+    debunker_arg: str,
+    is_prediction: bool = False,
+    source_labels: Optional[list[str]] = None,
+    missing_arguments: Optional[list[str]] = None
+) -> AgentPrompt:
+    """
+    Judge prompt: the judge's instructions, debate arguments and source weights go in the tail.
+    `source_labels` (aligned with `weights`) name each source next to its weight;
+    `missing_arguments` lists the roles (PROVER/DEBUNKER) whose argument never arrived.
+    """
+    labels = source_labels or []
+    weight_lines = []
+    for i, weight in enumerate(weights):
+        label = f" ({labels[i]})" if i < len(labels) and labels[i] else ""
+        weight_lines.append(f"Source {i+1}: {weight:g}x weight{label}")
+    for_label, against_label = (
+        ("OPTIMIST'S ARGUMENT (arguing prediction is LIKELY)", "SKEPTIC'S ARGUMENT (arguing prediction is UNLIKELY or UNCERTAIN)")
+        if is_prediction else
+        ("PROVER'S ARGUMENT (arguing FOR the claim)", "DEBUNKER'S ARGUMENT (arguing AGAINST the claim)")
+    )
+    task = f"""{ROLE_INSTRUCTIONS[(JUDGE, is_prediction)]}
+
+{for_label}:
+{prover_arg}
+
+{against_label}:
+{debunker_arg}
+
+SOURCE WEIGHTS:
+{chr(10).join(weight_lines)}
+{_missing_arguments_note(missing_arguments, is_prediction)}
+Respond with the JSON object only."""
+    return AgentPrompt(
+        system=SHARED_SYSTEM,
+        evidence=build_evidence_block(claim, data_points, is_prediction),
+        task=task
+    )
+
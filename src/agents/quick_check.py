@@ -0,0 +1,74 @@
+"""Quick Check Agent: Single-model verdict used to settle easy claims without a debate."""
+import json
+import re
+import logging
+from typing import Optional
+
+from src.agents.prompts import QUICK_CHECK, build_agent_prompt
+from src.llm import LLMUnavailable, llm_gateway
+from src.utils.deadline import Deadline
+
+logger = logging.getLogger(__name__)
+
+VALID_STANCES = ("supports", "refutes", "irrelevant")
+
+
+def source_agreement(stances: list[str], weights: list[float], stance: str) -> float:
+    """
+    Share of total source weight taking `stance` ("supports" or "refutes").
+
+    1.0 means every source agrees; irrelevant sources count against agreement.
+    """
+    total = sum(weights)
+    if total <= 0:
+        return 0.0
+    return sum(w for s, w in zip(stances, weights) if s == stance) / total
+
+
+async def run_quick_check_agent(
+    claim: str,
+    data_points: list[str],
+    is_prediction: bool = False,
+    model: Optional[str] = None,
+    deadline: Optional[Deadline] = None
+) -> Optional[dict]:
+    """
+    Quick Check Agent: one model reads the sources and rules directly.
+    Primary: DeepInfra Llama 3.3 70B (or the tier's `model` override)
+    Fallback: OpenAI GPT-4o-mini
+
+    Returns the judge-shaped result plus a per-source `source_stances` list,
+    or None if both providers fail (the caller then escalates to the debate).
+    Calls are bounded by `deadline`; the fallback is skipped when too little is left.
+    """
+    prompt = build_agent_prompt(QUICK_CHECK, claim, data_points, is_prediction)
+    try:
+        result = await llm_gateway.complete(QUICK_CHECK, prompt, model=model, deadline=deadline)
+    except LLMUnavailable as e:
+        logger.warning("quick_check.failed err=%s", e)
+        return None
+    return _parse_result(result.text, len(data_points))
+
+
+def _parse_result(response_text: str, source_count: int) -> Optional[dict]:
+    """Parse the model's JSON, normalizing source_stances to one entry per source."""
+    try:
+        result = json.loads(response_text)
+    except json.JSONDecodeError:
+        json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
+        if not json_match:
+            return None
+        try:
+            result = json.loads(json_match.group())
+        except json.JSONDecodeError:
+            return None
+
+    stances = [str(s).lower() for s in result.get("source_stances", [])]
+    stances = [s if s in VALID_STANCES else "irrelevant" for s in stances]
+    stances += ["irrelevant"] * (source_count - len(stances))
+    result["source_stances"] = stances[:source_count]
+    try:
+        result["confidence_score"] = float(result.get("confidence_score", 0.0))
+    except (TypeError, ValueError):
+        result["confidence_score"] = 0.0
+    return result
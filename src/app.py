@@ -2,7 +2,12 @@
 Version: 1.0.2 - Dashboard UI with analytics
 """
 import os
+import asyncio
+from collections import Counter
+from contextlib import asynccontextmanager
+from typing import Optional
 from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -20,21 +25,67 @@ except ImportError:
 
 from config.settings import (
     X402_PRICE, X402_NETWORK, X402_DESCRIPTION, X402_MIME_TYPE, X402_OUTPUT_SCHEMA,
-    MERCHANT_WALLET_ADDRESS, SERVICE_BASE_URL
+    MERCHANT_WALLET_ADDRESS, SERVICE_BASE_URL, SESSION_PRICE, SESSION_CREDITS_PER_PURCHASE,
+    DEFAULT_TIER, VERIFICATION_TIERS, PROVIDER_PREWARM_ENABLED, CONNECTION_WARMUP_ENABLED, DEADLINE_HEADER,
+    FAKE_PROVIDERS_URL
 )
-from src.middleware import setup_logging, rate_limit_and_log
+from src.middleware import (
+    setup_logging, rate_limit_and_log, authenticate_session, admission_control, admission_stats,
+    as_verified_payer
+)
+from src.llm import llm_gateway
 from src.services import verify_claim_logic
+from src.services.evidence_index import evidence_index
+from src.utils.adaptive_timeouts import adaptive_timeouts
+from src.utils.bulkheads import provider_bulkheads
+from src.utils.connection_warmup import connection_warmer
+from src.utils.deadline import Deadline
+from src.utils.executor_metrics import executor_metrics
+from src.utils.http_clients import http_clients
+from src.utils.provider_clients import provider_clients
+from src.utils.quotas import quota_manager
+from src.utils.retry import retry_metrics
+from src.services.sessions import session_store
+from src.services.settlement import settlement_queue, extract_payer
 from src.services.verification import verify_news_claim_logic
 from performance_log import PerformanceLogger
 
 # Setup logging
 logger = setup_logging()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifecycle: background workers start with the server and are
+    drained on shutdown.
+    """
+    # Pooled keep-alive clients for every outbound integration
+    await http_clients.start()
+    # Provider SDKs import lazily; build them and open provider connections in the
+    # background (/ready turns 200 once that is done), then keep the pools warm
+    if CONNECTION_WARMUP_ENABLED:
+        prewarm_task = asyncio.create_task(connection_warmer.run())
+    elif PROVIDER_PREWARM_ENABLED:
+        prewarm_task = asyncio.create_task(provider_clients.prewarm())
+    else:
+        prewarm_task = None
+    # Bulk settlement runs in the background, off the request path
+    settlement_task = asyncio.create_task(settlement_queue.run_periodic())
+    yield
+    if prewarm_task:
+        prewarm_task.cancel()
+    settlement_task.cancel()
+    await settlement_queue.flush()
+    await http_clients.aclose()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="VerifAI agent-x402",
     description="Paid AI verification service using x402 payment protocol with multi-agent debate",
-    version="1.0.2"
+    version="1.0.2",
+    lifespan=lifespan
 )
 
 # Mount static files (CSS, images, etc.)
@@ -83,7 +134,8 @@ async def add_rate_limit_and_log(request, call_next):
 # x402 Payment wall - Let x402 auto-detect resource URL (now with HTTPS)
 # This tells the internet: 'You must pay 0.05 USDC on Base Sepolia to see the result'
 # EXCLUDED PATHS: /dashboard, /analytics, /static, /health, /metrics (free access)
-if HAS_X402:
+# Off against the offline provider stand-ins: fake verdicts must not be paid for
+if HAS_X402 and not FAKE_PROVIDERS_URL:
     payment_middleware = require_payment(
         price=X402_PRICE,
         pay_to_address=MERCHANT_WALLET_ADDRESS,
@@ -92,17 +144,46 @@ if HAS_X402:
         mime_type=X402_MIME_TYPE,
         output_schema=X402_OUTPUT_SCHEMA
     )
+    # Latency tiers are priced separately (?tier=fast|standard|thorough)
+    tier_payment_middlewares = {
+        tier: require_payment(
+            price=config["price"],
+            pay_to_address=MERCHANT_WALLET_ADDRESS,
+            network=X402_NETWORK,
+            description=f"{X402_DESCRIPTION} ({tier} tier)",
+            mime_type=X402_MIME_TYPE,
+            output_schema=X402_OUTPUT_SCHEMA
+        )
+        for tier, config in VERIFICATION_TIERS.items()
+    }
+    # Prepaid session purchase: one payment buys SESSION_CREDITS_PER_PURCHASE verifications
+    session_payment_middleware = require_payment(
+        price=SESSION_PRICE,
+        pay_to_address=MERCHANT_WALLET_ADDRESS,
+        network=X402_NETWORK,
+        description=f"VerifAI prepaid session ({SESSION_CREDITS_PER_PURCHASE} verifications)",
+        mime_type=X402_MIME_TYPE
+    )
     
     @app.middleware("http")
     async def conditional_payment_wall(request, call_next):
         """Apply x402 payment only to /verify endpoint, not dashboard/metrics."""
         path = request.url.path
         
+        # Already paid for via a prepaid session token (see authenticate_session)
+        if getattr(request.state, "session_id", None):
+            return await call_next(request)
+        
+        if path == "/sessions":
+            return await session_payment_middleware(request, call_next)
+        
         # Exempt these paths from payment
         exempt_paths = [
-            "/", "/health", "/dashboard", "/analytics", 
-            "/metrics/economics", "/metrics/logs",
-            "/.well-known/x402.json"
+            "/", "/health", "/ready", "/dashboard", "/analytics", 
+            "/metrics/economics", "/metrics/logs", "/metrics/settlement", "/metrics/evidence", "/metrics/executor", "/metrics/http",
+            "/metrics/providers", "/metrics/timeouts", "/metrics/admission", "/metrics/quotas", "/metrics/retries",
+            "/metrics/llm",
+            "/.well-known/x402.json", "/sessions/balance"
         ]
         exempt_prefixes = ["/static"]
         
@@ -115,11 +196,120 @@ if HAS_X402:
             # Skip payment for exempt paths
             return await call_next(request)
         else:
-            # Require payment for /verify and other paths
-            return await payment_middleware(request, call_next)
+            # Require payment for /verify and other paths, priced by latency tier
+            tier = request.query_params.get("tier", DEFAULT_TIER)
+            tier_middleware = tier_payment_middlewares.get(tier, payment_middleware)
+            # Past verification, provider calls queue fairly under the payer's wallet
+            return await tier_middleware(request, as_verified_payer(call_next))
+elif FAKE_PROVIDERS_URL:
+    logger.warning("fake_providers.enabled url=%s - payment middleware disabled", FAKE_PROVIDERS_URL)
 else:
     logger.warning("x402 module not available - payment middleware disabled")
 
+
+# Prepaid session tokens - registered last so it runs BEFORE the payment wall
+@app.middleware("http")
+async def session_auth(request, call_next):
+    return await authenticate_session(request, call_next)
+
+
+# Admission control - registered after everything else so it is the outermost
+# layer: overloaded requests get 503 + Retry-After before any payment is asked for
+@app.middleware("http")
+async def admit_request(request, call_next):
+    return await admission_control(request, call_next)
+
+
+def _charge_session(request: Request, count: int = 1) -> Optional[JSONResponse]:
+    """
+    Deduct prepaid credits for a session-authenticated request.
+    
+    Returns a 402 response if the session balance is too low, otherwise None
+    (also None for regular x402-paid requests).
+    """
+    session_id = getattr(request.state, "session_id", None)
+    if session_id is None:
+        return None
+    if not session_store.consume(session_id, count):
+        return JSONResponse(
+            status_code=402,
+            content={
+                "error": "Insufficient session credits",
+                "credits_required": count,
+                "credits_remaining": session_store.balance(session_id)
+            }
+        )
+    return None
+
+
+def _payment_status(result: dict) -> str:
+    """A result's settle/refund status; an Error verdict without one is refunded."""
+    if result.get("payment_status"):
+        return result["payment_status"]
+    return "refunded_due_to_system_error" if result.get("verdict") == "Error" else "settled"
+
+
+def _credit_session_refunds(request: Request, results: list[dict], credits_each: int = 1) -> Optional[dict]:
+    """Credit refunded_* verifications back to the session and report the new balance."""
+    session_id = getattr(request.state, "session_id", None)
+    if session_id is None:
+        return None
+    refunded = credits_each * sum(1 for r in results if _payment_status(r).startswith("refunded"))
+    session_store.refund(session_id, refunded)
+    return {
+        "credits_refunded": refunded,
+        "credits_remaining": session_store.balance(session_id)
+    }
+
+
+def _validate_tier(tier: str) -> Optional[JSONResponse]:
+    """400 response for an unknown latency tier, else None."""
+    if tier in VERIFICATION_TIERS:
+        return None
+    return JSONResponse(
+        status_code=400,
+        content={"error": f"Unknown tier '{tier}'. Choose one of: {', '.join(VERIFICATION_TIERS)}"}
+    )
+
+
+def _request_deadline(request: Request, tier: str) -> tuple[Optional[Deadline], Optional[JSONResponse]]:
+    """
+    Deadline for this request: the tier's deadline_seconds, shortened by the
+    client's X-Request-Timeout header (seconds) if given.
+    
+    Returns:
+        (deadline, None), or (None, 400 response) for an invalid header
+    """
+    try:
+        return Deadline.from_client(request.headers.get(DEADLINE_HEADER), VERIFICATION_TIERS[tier]["deadline_seconds"]), None
+    except ValueError as e:
+        return None, JSONResponse(status_code=400, content={"error": f"Invalid {DEADLINE_HEADER} header: {e}"})
+
+
+async def _record_settlement(request: Request, claim: str, payment_status: str, amount_usdc: float):
+    """
+    Journal the settle/refund decision for one x402-paid request.
+    
+    One X-PAYMENT pays for the whole request, so a batch is journaled once.
+    Session-paid requests are skipped: their refunds are credited back to the
+    session and the session purchase itself is the settled payment. So is
+    everything in fake-provider mode, where nothing was paid.
+    """
+    if FAKE_PROVIDERS_URL or getattr(request.state, "session_id", None):
+        return
+    payment_header = request.headers.get("x-payment")
+    try:
+        await settlement_queue.record(
+            payment_status=payment_status,
+            amount_usdc=amount_usdc,
+            payer=extract_payer(payment_header),
+            claim=claim,
+            payment_header=payment_header
+        )
+    except Exception as e:
+        logger.error("settlement.record.failed err=%s", e)
+
+
 # ============================================================================
 # Endpoints
 # ============================================================================
@@ -146,6 +336,7 @@ async def root(request: Request):
         "description": "Multi-agent AI fact-checking with x402 payment",
         "endpoints": {
             "verify": "/verify?claim={your_claim}",
+            "sessions": "/sessions",
             "dashboard": "/dashboard",
             "analytics": "/analytics",
             "health": "/health",
@@ -154,13 +345,14 @@ async def root(request: Request):
         },
         "payment": {
             "price": "0.05 USDC",
-            "network": "base-sepolia"
+            "network": "base-sepolia",
+            "tiers": {tier: f"{config['price']} USDC" for tier, config in VERIFICATION_TIERS.items()}
         }
     }
 
 
 @app.get("/verify")
-async def verify(request: Request, claim: str):
+async def verify(request: Request, claim: str, tier: str = DEFAULT_TIER):
     """
     Verify a claim using multi-agent debate.
     
@@ -175,14 +367,31 @@ async def verify(request: Request, claim: str):
     Args:
         request: FastAPI request object (for Accept header)
         claim: The claim to verify
+        tier: Latency tier - fast (<5s, quick check only), standard, or thorough (always full debate)
         
     Returns:
         Verification result in requested format
     """
-    logger.info("endpoint.verify.called claim=%s", claim)
+    logger.info("endpoint.verify.called claim=%s tier=%s", claim, tier)
+    
+    invalid = _validate_tier(tier)
+    if invalid:
+        return invalid
+    tier_config = VERIFICATION_TIERS[tier]
+    deadline, invalid = _request_deadline(request, tier)
+    if invalid:
+        return invalid
+    
+    insufficient = _charge_session(request, tier_config["session_credits"])
+    if insufficient:
+        return insufficient
     
     # Get verification result
-    result = await verify_claim_logic(claim)
+    result = await verify_claim_logic(claim, tier, deadline)
+    await _record_settlement(request, claim, _payment_status(result), float(tier_config["price"]))
+    session_info = _credit_session_refunds(request, [result], tier_config["session_credits"])
+    if session_info:
+        result["session"] = session_info
     
     # Check what format the client wants (content negotiation)
     accept_header = request.headers.get("accept", "application/json").lower()
@@ -303,7 +512,7 @@ async def verify_batch(request: Request):
     - 5-9 claims: 10% discount
     - 10+ claims: 15% discount
     
-    Example request:
+    Example request (optional ?tier=fast|standard|thorough applies to every claim):
     {
         "claims": ["Earth is round", "Water is wet", "Sky is blue"]
     }
@@ -337,10 +546,27 @@ async def verify_batch(request: Request):
                 content={"error": "Maximum 100 claims per batch. Please reduce batch size."}
             )
         
-        logger.info("batch.processing count=%d", len(claims))
+        tier = request.query_params.get("tier", DEFAULT_TIER)
+        invalid = _validate_tier(tier)
+        if invalid:
+            return invalid
+        tier_config = VERIFICATION_TIERS[tier]
+        # One deadline for the whole batch: every claim must be answered by then
+        deadline, invalid = _request_deadline(request, tier)
+        if invalid:
+            return invalid
         
-        # Process all claims in parallel
-        tasks = [verify_claim_logic(claim) for claim in claims]
+        logger.info("batch.processing count=%d tier=%s", len(claims), tier)
+        
+        # Session-paid batches consume the tier's credits per claim up front
+        insufficient = _charge_session(request, len(claims) * tier_config["session_credits"])
+        if insufficient:
+            return insufficient
+        
+        # Process all claims in parallel. Their provider calls queue under this
+        # request's tenant (src/utils/fair_queue.py), so under contention the
+        # whole batch gets one payer's fair share of provider slots
+        tasks = [verify_claim_logic(claim, tier, deadline) for claim in claims]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
         # Convert exceptions to error results
@@ -359,9 +585,10 @@ async def verify_batch(request: Request):
                 result["claim"] = claims[i]
                 processed_results.append(result)
         
-        # Calculate totals
-        base_cost = len(claims) * 0.05
-        refunded_count = sum(1 for r in processed_results if r.get("payment_status", "").startswith("refunded"))
+        # Calculate totals at the tier's per-claim price
+        price = float(tier_config["price"])
+        base_cost = round(len(claims) * price, 6)
+        refunded_count = sum(1 for r in processed_results if _payment_status(r).startswith("refunded"))
         successful_count = len(claims) - refunded_count
         
         # Bulk discount: 10% off for 5+ claims, 15% off for 10+ claims
@@ -371,15 +598,15 @@ async def verify_batch(request: Request):
         elif len(claims) >= 5:
             discount_percent = 10
         
-        discount_amount = (successful_count * 0.05) * (discount_percent / 100)
-        final_cost = (successful_count * 0.05) - discount_amount
+        discount_amount = round((successful_count * price) * (discount_percent / 100), 6)
+        final_cost = round((successful_count * price) - discount_amount, 6)
         
         logger.info(
             "batch.done total=%d successful=%d cost=%.4f discount=%.4f",
             len(claims), successful_count, final_cost, discount_amount
         )
         
-        return {
+        response = {
             "total_claims": len(claims),
             "successful_verifications": successful_count,
             "base_cost": base_cost,
@@ -388,6 +615,17 @@ async def verify_batch(request: Request):
             "final_cost": final_cost,
             "results": processed_results
         }
+        # One payment covers the batch: settle what it cost, or refund it whole
+        batch_claim = f"batch of {len(claims)}: {claims[0]}"
+        if successful_count:
+            await _record_settlement(request, batch_claim, "settled", final_cost)
+        else:
+            refund_status = Counter(_payment_status(r) for r in processed_results).most_common(1)[0][0]
+            await _record_settlement(request, batch_claim, refund_status, base_cost)
+        session_info = _credit_session_refunds(request, processed_results, tier_config["session_credits"])
+        if session_info:
+            response["session"] = session_info
+        return response
     except Exception as e:
         logger.error("batch.failed err=%s", e)
         return JSONResponse(
@@ -397,7 +635,7 @@ async def verify_batch(request: Request):
 
 
 @app.get("/verify/news")
-async def verify_news(request: Request, claim: str):
+async def verify_news(request: Request, claim: str, tier: str = DEFAULT_TIER):
     """
     Real-time news verification endpoint optimized for breaking news and current events.
     
@@ -408,17 +646,33 @@ async def verify_news(request: Request, claim: str):
     - Shows age of newest source
     
     Example:
-    GET /verify/news?claim=Elon Musk bought Twitter
+    GET /verify/news?claim=Elon Musk bought Twitter&tier=fast
     
     Response includes:
     - Standard verification result (verdict, confidence, evidence)
     - sources: Array with publication dates and age in hours
     - newest_source_age_hours: Age of most recent source
     """
-    logger.info("endpoint.verify_news.called claim=%s", claim)
+    logger.info("endpoint.verify_news.called claim=%s tier=%s", claim, tier)
+    
+    invalid = _validate_tier(tier)
+    if invalid:
+        return invalid
+    tier_config = VERIFICATION_TIERS[tier]
+    deadline, invalid = _request_deadline(request, tier)
+    if invalid:
+        return invalid
+    
+    insufficient = _charge_session(request, tier_config["session_credits"])
+    if insufficient:
+        return insufficient
     
     # Get verification result with news-specific search
-    result = await verify_news_claim_logic(claim)
+    result = await verify_news_claim_logic(claim, tier, deadline)
+    await _record_settlement(request, claim, _payment_status(result), float(tier_config["price"]))
+    session_info = _credit_session_refunds(request, [result], tier_config["session_credits"])
+    if session_info:
+        result["session"] = session_info
     
     # Content negotiation (same as /verify)
     accept_header = request.headers.get("accept", "application/json").lower()
@@ -599,10 +853,79 @@ async def verify_batch_old(request: Request):
         )
 
 
+@app.post("/sessions")
+async def create_session():
+    """
+    Buy a prepaid verification session.
+    
+    Requires a single x402 payment of SESSION_PRICE. Returns a signed session
+    token good for SESSION_CREDITS_PER_PURCHASE verifications; send it as the
+    X-Session-Token header on /verify, /verify/news or /verify/batch to skip
+    per-request payment. Refunded verifications are credited back.
+    """
+    session = session_store.create(SESSION_CREDITS_PER_PURCHASE)
+    return {
+        **session,
+        "price_usdc": SESSION_PRICE,
+        "header": "X-Session-Token"
+    }
+
+
+@app.get("/sessions/balance")
+async def session_balance(request: Request):
+    """Remaining credits for the session identified by the X-Session-Token header."""
+    session_id = getattr(request.state, "session_id", None)
+    if session_id is None:
+        return JSONResponse(
+            status_code=401,
+            content={"error": "Missing X-Session-Token header"}
+        )
+    return {
+        "session_id": session_id,
+        "credits_remaining": session_store.balance(session_id)
+    }
+
+
+@app.get("/.well-known/x402.json")
+async def x402_manifest():
+    """
+    x402 service manifest, with per-tier pricing filled in from
+    VERIFICATION_TIERS so advertised prices never drift from what we charge.
+    """
+    import json
+    
+    with open("x402.json", "r") as f:
+        manifest = json.load(f)
+    manifest["pricing"]["tiers"] = {
+        tier: {
+            "amount": config["price"],
+            "deadline_seconds": config["deadline_seconds"],
+            "debate": config["debate"],
+            "sources": config["num_results"]
+        }
+        for tier, config in VERIFICATION_TIERS.items()
+    }
+    manifest["pricing"]["default_tier"] = DEFAULT_TIER
+    return manifest
+
+
 @app.get("/health")
 async def health():
-    """Health check endpoint."""
-    return {"status": "healthy", "service": "VerifAI agent-x402"}
+    """Health check endpoint (`fake_providers`: running against scripts/fake_providers.py)."""
+    return {"status": "healthy", "service": "VerifAI agent-x402", "fake_providers": bool(FAKE_PROVIDERS_URL)}
+
+
+@app.get("/ready")
+async def ready():
+    """
+    Readiness: 200 once provider clients are built and their connections
+    warmed, 503 while that is still running (point the load balancer here).
+    """
+    status_code = 200 if connection_warmer.ready else 503
+    return JSONResponse(
+        status_code=status_code,
+        content={"status": "ready" if connection_warmer.ready else "warming", "warmup": connection_warmer.stats()}
+    )
 
 
 @app.get("/metrics/economics")
@@ -637,6 +960,122 @@ async def metrics_economics():
         }
 
 
+@app.get("/metrics/settlement")
+async def metrics_settlement():
+    """
+    Settlement queue depth: pending settle/refund decisions awaiting the next
+    bulk run, plus flush health.
+    """
+    return {
+        "status": "ok",
+        "settlement": settlement_queue.stats()
+    }
+
+
+@app.get("/metrics/evidence")
+async def metrics_evidence():
+    """
+    Local evidence index: documents stored and how often claims were answered
+    from it instead of Exa/NewsAPI.
+    """
+    return {
+        "status": "ok",
+        "evidence_index": evidence_index.stats()
+    }
+
+
+@app.get("/metrics/executor")
+async def metrics_executor():
+    """
+    Default thread-pool occupancy: blocking SDK calls running or queued.
+    Sustained queued > 0 means the pool is saturated.
+    """
+    return {
+        "status": "ok",
+        "executor": executor_metrics.stats()
+    }
+
+
+@app.get("/metrics/http")
+async def metrics_http():
+    """
+    Outbound HTTP pools: requests sent and open/idle connections per upstream.
+    """
+    return {
+        "status": "ok",
+        "http": http_clients.stats()
+    }
+
+
+@app.get("/metrics/providers")
+async def metrics_providers():
+    """
+    Provider SDK clients: which are built yet (lazy/prewarmed) and their init cost.
+    """
+    return {
+        "status": "ok",
+        "providers": provider_clients.stats()
+    }
+
+
+@app.get("/metrics/timeouts")
+async def metrics_timeouts():
+    """
+    Adaptive provider timeouts: current value and latency percentiles per provider/model.
+    """
+    return {
+        "status": "ok",
+        "timeouts": adaptive_timeouts.stats()
+    }
+
+
+@app.get("/metrics/admission")
+async def metrics_admission():
+    """
+    Admission control and bulkheads: in-flight verifications, queue depth,
+    queue wait and shed counts per pool (autoscaling signals), plus provider
+    slot utilization and wait per traffic class.
+    """
+    return {
+        "status": "ok",
+        "admission": admission_stats(),
+        "provider_slots": provider_bulkheads.stats()
+    }
+
+
+@app.get("/metrics/quotas")
+async def metrics_quotas():
+    """
+    Provider quotas: RPM/TPM bucket levels, quota waits, exhaustion and 429s per provider/model.
+    """
+    return {
+        "status": "ok",
+        "quotas": quota_manager.stats()
+    }
+
+
+@app.get("/metrics/retries")
+async def metrics_retries():
+    """
+    Provider call retries: attempts, recoveries and why failures were not retried, per provider.
+    """
+    return {
+        "status": "ok",
+        "retries": retry_metrics.stats()
+    }
+
+
+@app.get("/metrics/llm")
+async def metrics_llm():
+    """
+    LLM gateway: calls, fallbacks and hedges per agent role; tokens and cost per provider/model.
+    """
+    return {
+        "status": "ok",
+        "llm": llm_gateway.stats()
+    }
+
+
 @app.get("/metrics/logs")
 async def metrics_logs(limit: int = 10):
     """
@@ -797,7 +1236,7 @@ async def health_check():
         "service": "VerifAI agent-x402",
         "version": "1.0.2",
         "payment": {
-            "enabled": HAS_X402,
+            "enabled": HAS_X402 and not FAKE_PROVIDERS_URL,
             "network": X402_NETWORK,
             "price": X402_PRICE
         }
@@ -0,0 +1,11 @@
+"""LLM gateway: role-based model routing for the agents (see src/llm/gateway.py)."""
+from src.llm.adapters import LLMResult, ProviderAdapter
+from src.llm.gateway import LLMGateway, LLMUnavailable, llm_gateway
+
+__all__ = [
+    "LLMGateway",
+    "LLMResult",
+    "LLMUnavailable",
+    "ProviderAdapter",
+    "llm_gateway",
+]
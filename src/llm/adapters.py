@@ -0,0 +1,198 @@
+"""
+Provider adapters for the LLM gateway.
+
+An adapter turns one gateway call (an AgentPrompt plus the route's sampling
+settings) into its provider's SDK request and normalizes the response into an
+LLMResult, so the gateway never sees provider-specific shapes. Every adapter
+is async end to end; none needs a worker thread. A new provider is added by
+writing an adapter, registering its client builder in provider_clients and
+naming it in an LLM_ROUTES chain.
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional
+
+if TYPE_CHECKING:  # the agents import the gateway, not the other way round
+    from src.agents.prompts import AgentPrompt
+
+
+@dataclass
+class LLMResult:
+    """One completed model call, in provider-neutral terms."""
+    text: str
+    provider: str
+    model: str
+    input_tokens: int = 0  # every prompt token, cached or not
+    output_tokens: int = 0
+    cached_input_tokens: int = 0
+    cache_write_tokens: int = 0
+    usage: Any = None  # the SDK's usage object, settled against the provider's quota
+    latency_seconds: float = 0.0
+    cost_usd: float = 0.0
+
+
+@dataclass(frozen=True)
+class CallSettings:
+    """Sampling settings a route applies to every model in its chain."""
+    max_tokens: int
+    temperature: Optional[float] = None  # None = provider default
+    json: bool = False
+
+
+class ProviderAdapter:
+    """Base class: one provider's request/response translation."""
+
+    provider = ""
+
+    async def complete(
+        self, client: Any, model: str, prompt: "AgentPrompt", settings: CallSettings, timeout: Dict[str, float]
+    ) -> LLMResult:
+        """Run one call. `timeout` is `timeout_kwargs(...)` ({} or {"timeout": seconds})."""
+        raise NotImplementedError
+
+    def stream(
+        self, client: Any, model: str, prompt: "AgentPrompt", settings: CallSettings,
+        timeout: Dict[str, float], result: LLMResult
+    ) -> AsyncIterator[str]:
+        """Yield text deltas; token counts and usage are filled into `result` once known."""
+        raise NotImplementedError
+
+
+def openai_cached_tokens(usage: Any) -> int:
+    """Prompt tokens served from the provider's prefix cache (OpenAI-compatible usage)."""
+    details = getattr(usage, "prompt_tokens_details", None)
+    return (getattr(details, "cached_tokens", 0) or 0) if details else 0
+
+
+def _openai_usage(result: LLMResult, usage: Any):
+    if usage is None:
+        return
+    result.usage = usage
+    result.input_tokens = usage.prompt_tokens
+    result.output_tokens = usage.completion_tokens
+    result.cached_input_tokens = openai_cached_tokens(usage)
+
+
+class OpenAICompatibleAdapter(ProviderAdapter):
+    """Chat Completions APIs: DeepInfra and OpenAI (automatic prefix caching)."""
+
+    def __init__(self, provider: str):
+        self.provider = provider
+
+    def _request(self, model: str, prompt: "AgentPrompt", settings: CallSettings, timeout: Dict[str, float]) -> dict:
+        request = {"model": model, "messages": prompt.openai_messages(), "max_tokens": settings.max_tokens, **timeout}
+        if settings.temperature is not None:
+            request["temperature"] = settings.temperature
+        if settings.json:
+            request["response_format"] = {"type": "json_object"}
+        return request
+
+    async def complete(self, client, model, prompt, settings, timeout):
+        response = await client.chat.completions.create(**self._request(model, prompt, settings, timeout))
+        result = LLMResult(text=response.choices[0].message.content or "", provider=self.provider, model=model)
+        _openai_usage(result, response.usage)
+        return result
+
+    async def stream(self, client, model, prompt, settings, timeout, result):
+        chunks = await client.chat.completions.create(
+            **self._request(model, prompt, settings, timeout), stream=True, stream_options={"include_usage": True}
+        )
+        async for chunk in chunks:
+            # The last chunk carries usage and no choices
+            if chunk.choices and chunk.choices[0].delta.content:
+                result.text += chunk.choices[0].delta.content
+                yield chunk.choices[0].delta.content
+            _openai_usage(result, getattr(chunk, "usage", None))
+
+
+def _anthropic_usage(result: LLMResult, usage: Any):
+    # Anthropic's input_tokens excludes cache reads/writes
+    cache_read = getattr(usage, "cache_read_input_tokens", 0) or 0
+    cache_write = getattr(usage, "cache_creation_input_tokens", 0) or 0
+    result.usage = usage
+    result.input_tokens = usage.input_tokens + cache_read + cache_write
+    result.output_tokens = usage.output_tokens
+    result.cached_input_tokens = cache_read
+    result.cache_write_tokens = cache_write
+
+
+class AnthropicAdapter(ProviderAdapter):
+    """Messages API (no cache breakpoints: it only serves the judge, once per request)."""
+
+    provider = "anthropic"
+
+    def _request(self, model: str, prompt: "AgentPrompt", settings: CallSettings, timeout: Dict[str, float]) -> dict:
+        request = {"model": model, "max_tokens": settings.max_tokens, **prompt.anthropic_request(), **timeout}
+        if settings.temperature is not None:
+            request["temperature"] = settings.temperature
+        return request
+
+    async def complete(self, client, model, prompt, settings, timeout):
+        response = await client.messages.create(**self._request(model, prompt, settings, timeout))
+        text = "".join(getattr(block, "text", "") for block in response.content)
+        result = LLMResult(text=text, provider=self.provider, model=model)
+        _anthropic_usage(result, response.usage)
+        return result
+
+    async def stream(self, client, model, prompt, settings, timeout, result):
+        async with client.messages.stream(**self._request(model, prompt, settings, timeout)) as stream:
+            async for text in stream.text_stream:
+                result.text += text
+                yield text
+            message = await stream.get_final_message()
+        _anthropic_usage(result, message.usage)
+
+
+def _gemini_usage(result: LLMResult, usage: Any):
+    if usage is None:
+        return
+    result.usage = usage
+    result.input_tokens = usage.prompt_token_count or 0
+    result.output_tokens = usage.candidates_token_count or 0
+    result.cached_input_tokens = getattr(usage, "cached_content_token_count", 0) or 0
+
+
+class GeminiAdapter(ProviderAdapter):
+    """google-genai's async client (`client.aio`); the prompt goes as one text block."""
+
+    provider = "gemini"
+
+    @staticmethod
+    def _config(settings: CallSettings, timeout: Dict[str, float]):
+        from google.genai import types  # imported with the Gemini client, on first use
+
+        config = {"max_output_tokens": settings.max_tokens}
+        if settings.temperature is not None:
+            config["temperature"] = settings.temperature
+        if settings.json:
+            config["response_mime_type"] = "application/json"
+        if "timeout" in timeout:
+            config["http_options"] = types.HttpOptions(timeout=max(1, int(timeout["timeout"] * 1000)))  # ms
+        return types.GenerateContentConfig(**config)
+
+    async def complete(self, client, model, prompt, settings, timeout):
+        response = await client.aio.models.generate_content(
+            model=model, contents=prompt.as_text(), config=self._config(settings, timeout)
+        )
+        result = LLMResult(text=response.text or "", provider=self.provider, model=model)
+        _gemini_usage(result, response.usage_metadata)
+        return result
+
+    async def stream(self, client, model, prompt, settings, timeout, result):
+        chunks = await client.aio.models.generate_content_stream(
+            model=model, contents=prompt.as_text(), config=self._config(settings, timeout)
+        )
+        async for chunk in chunks:
+            if chunk.text:
+                result.text += chunk.text
+                yield chunk.text
+            _gemini_usage(result, chunk.usage_metadata)
+
+
+def default_adapters() -> Dict[str, ProviderAdapter]:
+    return {
+        "deepinfra": OpenAICompatibleAdapter("deepinfra"),
+        "openai": OpenAICompatibleAdapter("openai"),
+        "anthropic": AnthropicAdapter(),
+        "gemini": GeminiAdapter(),
+    }
@@ -0,0 +1,302 @@
+"""
+LLM gateway: one entry point for every agent's model calls.
+
+`llm_gateway.complete(role, prompt, ...)` looks the role up in LLM_ROUTES and
+walks its chain of (provider, model). Each attempt runs through the same
+stack, whatever the provider:
+
+    provider_clients    lazily built, pooled SDK client
+    provider_bulkheads  a provider slot (interactive/bulk, fair across tenants)
+    quota_manager       RPM/TPM reservation, settled with the actual usage
+    adaptive_timeouts   per provider/model timeout, capped by the deadline
+    retry_call          transient errors retried while the deadline allows
+
+A failed model falls back to the next one in the chain unless the deadline
+has less than DEADLINE_MIN_FALLBACK_SECONDS left. With LLM_HEDGING_ENABLED,
+"hedge" routes also start the next model early when the current one runs
+past its p95 latency. Token usage goes to the request's token_tracker entry
+for the role, and token and cost totals accumulate for /metrics/llm.
+`stream` yields the answer as it is generated, with the same stack.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import AsyncExitStack
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+from config.settings import (
+    LLM_ROUTES, LLM_HEDGING_ENABLED, LLM_HEDGE_PERCENTILE, LLM_HEDGE_MIN_DELAY_SECONDS,
+    DEADLINE_MIN_FALLBACK_SECONDS
+)
+from performance_log import PerformanceLogger
+from src.llm.adapters import CallSettings, LLMResult, ProviderAdapter, default_adapters
+from src.utils.adaptive_timeouts import adaptive_timeouts
+from src.utils.bulkheads import provider_bulkheads
+from src.utils.deadline import Deadline, timeout_kwargs
+from src.utils.provider_clients import ProviderClients, provider_clients
+from src.utils.quotas import estimate_tokens, quota_manager
+from src.utils.retry import retry_call
+from src.utils.token_tracker import token_tracker
+
+logger = logging.getLogger(__name__)
+
+
+class LLMUnavailable(Exception):
+    """Every model in the role's chain failed (or the deadline left no time to try the rest)."""
+
+    def __init__(self, role: str, errors: List[Tuple[str, BaseException]]):
+        detail = "; ".join(f"{provider}: {str(error)[:200] or type(error).__name__}" for provider, error in errors)
+        super().__init__(f"{role}: {detail or 'no model was tried'}")
+        self.role = role
+        self.errors = errors
+
+
+class LLMRoute:
+    """A role's model chain and call settings (one LLM_ROUTES entry)."""
+
+    def __init__(
+        self,
+        chain: Sequence[Tuple[str, str]],
+        max_tokens: int,
+        temperature: Optional[float] = None,
+        json: bool = False,
+        hedge: bool = False
+    ):
+        self.chain = list(chain)
+        self.settings = CallSettings(max_tokens=max_tokens, temperature=temperature, json=json)
+        self.hedge = hedge
+
+    def models(self, model: Optional[str] = None) -> List[Tuple[str, str]]:
+        """The chain, with `model` (a tier override) replacing the primary model."""
+        if not model:
+            return list(self.chain)
+        return [(self.chain[0][0], model)] + self.chain[1:]
+
+
+class LLMGateway:
+    """Routes role-based calls to model chains through the shared performance stack."""
+
+    def __init__(
+        self,
+        routes: Dict[str, dict] = LLM_ROUTES,
+        adapters: Optional[Dict[str, ProviderAdapter]] = None,
+        clients: ProviderClients = provider_clients,
+        hedging: bool = LLM_HEDGING_ENABLED,
+        hedge_percentile: float = LLM_HEDGE_PERCENTILE,
+        hedge_min_delay: float = LLM_HEDGE_MIN_DELAY_SECONDS
+    ):
+        self.routes = {role: LLMRoute(**route) for role, route in routes.items()}
+        self.adapters = adapters if adapters is not None else default_adapters()
+        self.clients = clients
+        self.hedging = hedging
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_delay = hedge_min_delay
+        self._roles: Dict[str, dict] = {}
+        self._models: Dict[str, dict] = {}
+
+    def _role_counts(self, role: str) -> dict:
+        return self._roles.setdefault(
+            role, {"calls": 0, "failed": 0, "fallbacks": 0, "hedged": 0, "hedge_wins": 0}
+        )
+
+    # ------------------------------------------------------------------
+    # One attempt: client, slot, quota, timeout, adapter
+    # ------------------------------------------------------------------
+
+    async def _call(
+        self, provider: str, model: str, prompt: Any, settings: CallSettings, tokens: int, deadline: Optional[Deadline]
+    ) -> LLMResult:
+        adapter = self.adapters[provider]
+        client = await self.clients.aget(provider)
+        started = time.perf_counter()
+        async with provider_bulkheads.slot(provider), quota_manager.reserve(provider, model, tokens, deadline) as quota:
+            with adaptive_timeouts.track(provider, model, cap=deadline.remaining() if deadline else None) as timeout:
+                result = await adapter.complete(client, model, prompt, settings, timeout_kwargs(deadline, timeout))
+            quota.settle(result.usage)
+        result.latency_seconds = time.perf_counter() - started
+        return result
+
+    async def _attempt(
+        self, provider: str, model: str, prompt: Any, settings: CallSettings, tokens: int, deadline: Optional[Deadline]
+    ) -> LLMResult:
+        # Transient errors are retried on the same provider while the deadline allows
+        return await retry_call(lambda: self._call(provider, model, prompt, settings, tokens, deadline), provider, deadline)
+
+    def _hedge_delay(self, provider: str, model: str) -> Optional[float]:
+        """How long to wait before hedging a call (None = not enough latency history yet)."""
+        latency = adaptive_timeouts.latency(provider, model, self.hedge_percentile)
+        return None if latency is None else max(self.hedge_min_delay, latency)
+
+    async def _run(
+        self, role: str, target: Tuple[str, str], backup: Optional[Tuple[str, str]],
+        prompt: Any, settings: CallSettings, tokens: int, deadline: Optional[Deadline]
+    ) -> Tuple[Optional[LLMResult], List[Tuple[Tuple[str, str], BaseException]]]:
+        """
+        Call `target`; with a `backup`, hedge to it once target outlives its hedge delay.
+
+        Returns:
+            (first successful result or None, [((provider, model), error) for each failed call])
+        """
+        delay = self._hedge_delay(*target) if backup else None
+        if delay is None or (deadline is not None and not deadline.has(delay + DEADLINE_MIN_FALLBACK_SECONDS)):
+            try:
+                return await self._attempt(*target, prompt, settings, tokens, deadline), []
+            except Exception as e:
+                return None, [(target, e)]
+
+        tasks = {asyncio.create_task(self._attempt(*target, prompt, settings, tokens, deadline)): target}
+        failures: List[Tuple[Tuple[str, str], BaseException]] = []
+        try:
+            done, _ = await asyncio.wait(set(tasks), timeout=delay)
+            if not done:
+                self._role_counts(role)["hedged"] += 1
+                logger.info("%s.hedge.started after=%.2f primary=%s backup=%s", role, delay, target[0], backup[0])
+                tasks[asyncio.create_task(self._attempt(*backup, prompt, settings, tokens, deadline))] = backup
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if tasks[task] is backup:
+                            self._role_counts(role)["hedge_wins"] += 1
+                        return task.result(), failures
+                    failures.append((tasks[task], task.exception()))
+            return None, failures
+        finally:
+            # The losing (or abandoned) call is cancelled, releasing its slot and quota
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    # ------------------------------------------------------------------
+    # Accounting
+    # ------------------------------------------------------------------
+
+    def _account(self, role: str, result: LLMResult):
+        result.cost_usd = PerformanceLogger.calculate_cost(
+            result.model, result.input_tokens, result.output_tokens,
+            cached_input_tokens=result.cached_input_tokens, cache_write_tokens=result.cache_write_tokens
+        )
+        token_tracker.set_tokens(
+            role, result.model, result.input_tokens, result.output_tokens,
+            cached_input_tokens=result.cached_input_tokens, cache_write_tokens=result.cache_write_tokens
+        )
+        totals = self._models.setdefault(f"{result.provider}/{result.model}", {
+            "calls": 0, "input_tokens": 0, "output_tokens": 0, "cached_input_tokens": 0,
+            "cache_write_tokens": 0, "cost_usd": 0.0,
+        })
+        totals["calls"] += 1
+        totals["input_tokens"] += result.input_tokens
+        totals["output_tokens"] += result.output_tokens
+        totals["cached_input_tokens"] += result.cached_input_tokens
+        totals["cache_write_tokens"] += result.cache_write_tokens
+        totals["cost_usd"] += result.cost_usd
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def complete(
+        self, role: str, prompt: Any, model: Optional[str] = None, deadline: Optional[Deadline] = None
+    ) -> LLMResult:
+        """
+        Answer `prompt` (an AgentPrompt) with the role's model chain.
+
+        Args:
+            role: An LLM_ROUTES key ("prover", "debunker", "judge", "quick_check")
+            model: The tier's model for the role, replacing the chain's primary
+            deadline: Request deadline bounding every attempt
+
+        Raises:
+            LLMUnavailable: If no model in the chain produced an answer
+        """
+        route = self.routes[role]
+        chain = route.models(model)
+        tokens = estimate_tokens(prompt.as_text()) + route.settings.max_tokens  # reserved against the TPM quota
+        counts = self._role_counts(role)
+        counts["calls"] += 1
+        errors: List[Tuple[str, BaseException]] = []
+        index = 0
+        while index < len(chain):
+            if index and deadline and not deadline.has(DEADLINE_MIN_FALLBACK_SECONDS):
+                logger.warning("%s.fallback.skipped remaining=%.2f", role, deadline.remaining())
+                break
+            if index:
+                counts["fallbacks"] += 1
+            backup = chain[index + 1] if self.hedging and route.hedge and index + 1 < len(chain) else None
+            result, failures = await self._run(role, chain[index], backup, prompt, route.settings, tokens, deadline)
+            for (failed_provider, failed_model), error in failures:
+                logger.warning("%s.%s.failed model=%s err=%s", role, failed_provider, failed_model, str(error)[:200])
+                errors.append((failed_provider, error))
+            if result is None:
+                index += len(failures)  # a failed hedge used up the backup too
+                continue
+            self._account(role, result)
+            return result
+        counts["failed"] += 1
+        raise LLMUnavailable(role, errors)
+
+    async def stream(
+        self, role: str, prompt: Any, model: Optional[str] = None, deadline: Optional[Deadline] = None
+    ) -> AsyncIterator[str]:
+        """
+        `complete`, yielding text as it arrives. A model that fails before its
+        first chunk falls back to the next one; once text has been yielded, a
+        failure is raised to the caller (retrying would repeat the answer).
+        """
+        route = self.routes[role]
+        chain = route.models(model)
+        tokens = estimate_tokens(prompt.as_text()) + route.settings.max_tokens
+        counts = self._role_counts(role)
+        counts["calls"] += 1
+        errors: List[Tuple[str, BaseException]] = []
+        for index, (provider, chain_model) in enumerate(chain):
+            if index and deadline and not deadline.has(DEADLINE_MIN_FALLBACK_SECONDS):
+                logger.warning("%s.fallback.skipped remaining=%.2f", role, deadline.remaining())
+                break
+            if index:
+                counts["fallbacks"] += 1
+            result = LLMResult(text="", provider=provider, model=chain_model)
+            started = time.perf_counter()
+            try:
+                client = await self.clients.aget(provider)
+                async with AsyncExitStack() as stack:
+                    await stack.enter_async_context(provider_bulkheads.slot(provider))
+                    quota = await stack.enter_async_context(
+                        quota_manager.reserve(provider, chain_model, tokens, deadline)
+                    )
+                    # Time to the whole answer varies with its length: only the deadline bounds a stream
+                    chunks = self.adapters[provider].stream(
+                        client, chain_model, prompt, route.settings, timeout_kwargs(deadline), result
+                    )
+                    async for text in chunks:
+                        yield text
+                    quota.settle(result.usage)
+            except Exception as e:
+                if result.text:
+                    counts["failed"] += 1
+                    raise
+                logger.warning("%s.%s.failed model=%s err=%s", role, provider, chain_model, str(e)[:200])
+                errors.append((provider, e))
+                continue
+            result.latency_seconds = time.perf_counter() - started
+            self._account(role, result)
+            return
+        counts["failed"] += 1
+        raise LLMUnavailable(role, errors)
+
+    def stats(self) -> dict:
+        """Calls, fallbacks and hedges per role; tokens and cost per provider/model."""
+        return {
+            "hedging_enabled": self.hedging,
+            "roles": {role: dict(counts) for role, counts in sorted(self._roles.items())},
+            "models": {
+                name: {**totals, "cost_usd": round(totals["cost_usd"], 6)}
+                for name, totals in sorted(self._models.items())
+            },
+        }
+
+
+# Global gateway used by every agent
+llm_gateway = LLMGateway()
@@ -1,9 +1,15 @@
 """Middleware module initialization."""
 from src.middleware.rate_limit import rate_limit_and_log
 from src.middleware.logging_setup import setup_logging, get_logger
+from src.middleware.session_auth import authenticate_session
+from src.middleware.admission import admission_control, admission_stats, as_verified_payer
 
 __all__ = [
     "rate_limit_and_log",
     "setup_logging",
     "get_logger",
+    "authenticate_session",
+    "admission_control",
+    "admission_stats",
+    "as_verified_payer",
 ]
@@ -0,0 +1,256 @@
+"""
+Admission control: shed verification load before payment and work begin.
+
+Each verification endpoint belongs to a pool (ADMISSION_PATH_POOLS): single
+verifications are "interactive", /verify/batch is "bulk". Every request
+holds one of its pool's max_in_flight slots while it runs; when all are
+taken it waits in the pool's bounded FIFO queue for up to
+max_queue_wait_seconds. It is rejected straight away with 503 and
+Retry-After when the queue is full, or when the expected wait (queue
+position x average service time / slots) is already past that limit: under a
+provider slowdown, requests are turned away before the client pays rather
+than paid for, timed out and refunded. Separate pools are bulkheads - a
+backlog of batches never queues single verifications.
+
+The pool name is also the request's traffic class for provider-slot
+reservations (src/utils/bulkheads.py), and the client IP its tenant for fair
+queuing (src/utils/fair_queue.py) until a session or verified x402 payment
+identifies the payer.
+
+Registered as the outermost middleware so a shed request never reaches the
+x402 payment wall. In-flight count, queue depth and queue wait per pool are
+exposed at /metrics/admission as autoscaling signals.
+"""
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from typing import Optional
+
+from fastapi.responses import JSONResponse
+
+from config.settings import ADMISSION_CONTROL_ENABLED, ADMISSION_POOLS, ADMISSION_PATH_POOLS
+from src.services.settlement import extract_payer
+from src.utils.bulkheads import traffic_class
+from src.utils.fair_queue import tenant
+
+logger = logging.getLogger(__name__)
+
+# Weight of the newest request in the average service time
+_SERVICE_TIME_ALPHA = 0.2
+
+
+class Overloaded(Exception):
+    """Raised by `AdmissionController.acquire` when a request is shed."""
+
+    def __init__(self, reason: str, retry_after: float):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """Concurrency limit with a bounded, time-limited FIFO queue."""
+
+    def __init__(self, max_in_flight: int, max_queue: int, max_queue_wait: float, service_time: float):
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.max_queue_wait = max_queue_wait
+        self.avg_service_time = service_time  # seeded, then a moving average
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._waiters: deque = deque()  # futures of queued requests, oldest first
+        self.admitted = 0
+        self.shed = {"queue_full": 0, "expected_wait": 0, "queue_timeout": 0}
+        self.total_queue_wait = 0.0
+        self.max_observed_queue_wait = 0.0
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def expected_wait(self, position: Optional[int] = None) -> float:
+        """Seconds until the request at queue `position` (default: a new arrival) gets a slot."""
+        if position is None:
+            position = self.queued + 1
+        return position * self.avg_service_time / self.max_in_flight
+
+    def _retry_after(self) -> float:
+        return max(1.0, self.expected_wait())
+
+    def _reject(self, reason: str) -> Overloaded:
+        self.shed[reason] += 1
+        return Overloaded(reason, self._retry_after())
+
+    async def acquire(self) -> float:
+        """
+        Take a slot, waiting in the queue if needed.
+
+        Returns:
+            Seconds spent queued
+
+        Raises:
+            Overloaded: If the request is shed (queue full, wait too long)
+        """
+        if self.in_flight < self.max_in_flight and not self._waiters:
+            self._admit(0.0)
+            return 0.0
+        if self.queued >= self.max_queue:
+            raise self._reject("queue_full")
+        if self.expected_wait() > self.max_queue_wait:
+            raise self._reject("expected_wait")
+
+        started = time.perf_counter()
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout=self.max_queue_wait)
+        except asyncio.TimeoutError:
+            if not waiter.done():
+                raise self._reject("queue_timeout")
+        except BaseException:
+            # Client went away while queued: hand a slot we were given to the next in line
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        finally:
+            waiter.cancel()  # no-op once a slot was handed over
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+        queue_wait = time.perf_counter() - started
+        self._admit(queue_wait, counted=True)
+        return queue_wait
+
+    def _admit(self, queue_wait: float, counted: bool = False):
+        if not counted:
+            self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        self.admitted += 1
+        self.total_queue_wait += queue_wait
+        self.max_observed_queue_wait = max(self.max_observed_queue_wait, queue_wait)
+
+    def release(self, service_time: Optional[float] = None):
+        """Free a slot, handing it directly to the oldest queued request."""
+        if service_time is not None:
+            self.avg_service_time += _SERVICE_TIME_ALPHA * (service_time - self.avg_service_time)
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)  # slot passes on; in_flight unchanged
+                return
+        self.in_flight -= 1
+
+    def stats(self) -> dict:
+        """Autoscaling signals: occupancy, queue depth, waits and shed counts."""
+        return {
+            "max_in_flight": self.max_in_flight,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "queued": self.queued,
+            "max_queue": self.max_queue,
+            "utilization": round(self.in_flight / self.max_in_flight, 3),
+            "avg_service_seconds": round(self.avg_service_time, 3),
+            "expected_wait_seconds": round(self.expected_wait(), 3),
+            "admitted": self.admitted,
+            "shed": dict(self.shed),
+            "avg_queue_wait_ms": round(self.total_queue_wait / self.admitted * 1000, 2) if self.admitted else 0.0,
+            "max_queue_wait_ms": round(self.max_observed_queue_wait * 1000, 2),
+        }
+
+
+# One controller per pool, shared by that pool's endpoints
+admission_pools = {
+    name: AdmissionController(
+        max_in_flight=pool["max_in_flight"],
+        max_queue=pool["max_queue"],
+        max_queue_wait=pool["max_queue_wait_seconds"],
+        service_time=pool["service_seconds"]
+    )
+    for name, pool in ADMISSION_POOLS.items()
+}
+
+
+def admission_stats() -> dict:
+    """Per-pool admission signals."""
+    return {
+        "enabled": ADMISSION_CONTROL_ENABLED,
+        "pools": {name: controller.stats() for name, controller in admission_pools.items()},
+    }
+
+
+def request_tenant(request) -> str:
+    """
+    Fair-queuing key at admission: the client IP.
+
+    Admission runs before the session token is checked and before x402
+    verifies X-PAYMENT, so no identity claimed in a header is trusted here;
+    session auth and the payment wall re-key the request once they have.
+    """
+    return f"ip:{request.client.host if request.client else 'unknown'}"
+
+
+def as_verified_payer(call_next):
+    """
+    Wrap the payment wall's `call_next` so the request queues under its payer.
+
+    x402 only calls `call_next` after verifying the X-PAYMENT signature, so
+    from there on the payer wallet (and its FAIR_QUEUE_WEIGHTS weight) is real.
+    """
+    async def call_next_as_payer(request):
+        payer = extract_payer(request.headers.get("X-PAYMENT"))
+        if not payer:
+            return await call_next(request)
+        token = tenant.set(payer.lower())
+        try:
+            return await call_next(request)
+        finally:
+            tenant.reset(token)
+
+    return call_next_as_payer
+
+
+async def admission_control(request, call_next):
+    """
+    Admit verification requests into their pool's in-flight slots.
+
+    Shed requests get 503 with Retry-After (whole seconds) before any payment
+    is requested; everything else passes through untouched.
+    """
+    pool = ADMISSION_PATH_POOLS.get(request.url.path)
+    if not ADMISSION_CONTROL_ENABLED or pool is None:
+        return await call_next(request)
+    controller = admission_pools[pool]
+
+    try:
+        queue_wait = await controller.acquire()
+    except Overloaded as e:
+        retry_after = math.ceil(e.retry_after)
+        logger.warning(
+            "admission.shed path=%s pool=%s reason=%s in_flight=%d queued=%d retry_after=%d",
+            request.url.path, pool, e.reason, controller.in_flight, controller.queued, retry_after
+        )
+        return JSONResponse(
+            {"detail": "Service overloaded, retry later", "reason": e.reason, "retry_after": retry_after},
+            status_code=503,
+            headers={"Retry-After": str(retry_after)}
+        )
+
+    if queue_wait:
+        logger.info("admission.queued path=%s pool=%s wait_ms=%.0f", request.url.path, pool, queue_wait * 1000)
+    # Provider calls made for this request draw on the pool's slot reservation
+    # and queue fairly under the client IP (re-keyed once the payer is verified)
+    class_token = traffic_class.set(pool)
+    tenant_token = tenant.set(request_tenant(request))
+    started = time.perf_counter()
+    response = None
+    try:
+        response = await call_next(request)
+        return response
+    finally:
+        traffic_class.reset(class_token)
+        tenant.reset(tenant_token)
+        # Only completed verifications inform the service time; a 402 from the
+        # payment wall or a validation error returns in milliseconds
+        ok = response is not None and response.status_code < 400
+        controller.release(time.perf_counter() - started if ok else None)
@@ -0,0 +1,42 @@
+"""Session authentication middleware: Prepaid credit tokens in place of per-request x402."""
+import logging
+from fastapi.responses import JSONResponse
+
+from config.settings import SESSION_TOKEN_HEADER
+from src.services.sessions import session_store
+from src.utils.fair_queue import tenant
+
+logger = logging.getLogger(__name__)
+
+# Endpoints that accept a session token instead of an x402 payment
+SESSION_AUTH_PATHS = {"/verify", "/verify/news", "/verify/batch", "/sessions/balance"}
+
+
+async def authenticate_session(request, call_next):
+    """
+    Resolve the X-Session-Token header to a prepaid session.
+
+    On success the session id is stored on `request.state.session_id`; the
+    payment wall skips x402 for such requests and the endpoint deducts
+    credits. An invalid or expired token is rejected outright rather than
+    silently falling through to the payment wall.
+    """
+    token = request.headers.get(SESSION_TOKEN_HEADER)
+    if not token or request.url.path not in SESSION_AUTH_PATHS:
+        return await call_next(request)
+
+    session_id = session_store.authenticate(token)
+    if session_id is None:
+        logger.warning("session.auth.failed path=%s", request.url.path)
+        return JSONResponse(
+            {"detail": "Invalid or expired session token"},
+            status_code=401,
+        )
+
+    request.state.session_id = session_id
+    # A verified identity: the session's provider calls queue under it, not the IP
+    token = tenant.set(f"session:{session_id}")
+    try:
+        return await call_next(request)
+    finally:
+        tenant.reset(token)
@@ -0,0 +1,99 @@
+"""
+Near-duplicate source elimination.
+
+Exa often returns syndicated copies of the same article. Every copy costs its
+full text in the prompt of each agent, so sources whose word-shingle sets
+overlap above DEDUPE_SIMILARITY_THRESHOLD (Jaccard) are collapsed into one:
+the first (highest-ranked) copy keeps its text and the other URLs are merged
+into its citation.
+"""
+
+import logging
+import re
+import zlib
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from config.settings import DEDUPE_SHINGLE_SIZE, DEDUPE_SIMILARITY_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+# Rough prompt-token estimate for English text (no tokenizer dependency)
+CHARS_PER_TOKEN = 4
+
+_WORD_RE = re.compile(r"\w+")
+
+
+@dataclass
+class DedupeResult:
+    """Unique sources (aligned lists) plus what was merged away."""
+    sources: List[str]
+    text_blobs: List[str]
+    keep: List[int]  # indices of the kept sources in the original lists
+    duplicates: Dict[str, List[str]] = field(default_factory=dict)  # kept URL -> merged copies
+    tokens_saved: int = 0  # estimated prompt tokens saved per agent call
+
+    def select(self, values: list) -> list:
+        """Filter another list aligned with the original sources (e.g. published dates)."""
+        return [values[i] for i in self.keep if i < len(values)]
+
+
+def shingle_hashes(text: str, size: int = DEDUPE_SHINGLE_SIZE) -> set:
+    """Set of crc32 hashes of the text's lowercase word `size`-grams."""
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < size:
+        return {zlib.crc32(" ".join(words).encode())} if words else set()
+    return {zlib.crc32(" ".join(words[i:i + size]).encode()) for i in range(len(words) - size + 1)}
+
+
+def jaccard(a: set, b: set) -> float:
+    """Jaccard similarity of two shingle sets (0.0 when either is empty)."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def dedupe_sources(
+    sources: List[str],
+    text_blobs: List[str],
+    threshold: float = DEDUPE_SIMILARITY_THRESHOLD
+) -> DedupeResult:
+    """
+    Collapse near-identical source texts, keeping the first copy of each.
+
+    Args:
+        sources: Source URLs, in search rank order
+        text_blobs: Source texts aligned with `sources`
+        threshold: Jaccard similarity at or above which two texts are copies
+
+    Returns:
+        DedupeResult with the unique sources and the merged citations
+    """
+    result = DedupeResult(sources=[], text_blobs=[], keep=[])
+    kept_shingles: List[set] = []
+    saved_chars = 0
+
+    for i, (url, text) in enumerate(zip(sources, text_blobs)):
+        shingles = shingle_hashes(text)
+        match = next(
+            (k for k, kept in enumerate(kept_shingles) if jaccard(shingles, kept) >= threshold),
+            None
+        )
+        if match is None:
+            result.sources.append(url)
+            result.text_blobs.append(text)
+            result.keep.append(i)
+            kept_shingles.append(shingles)
+        else:
+            result.duplicates.setdefault(result.sources[match], []).append(url)
+            saved_chars += len(text) + len(f"Source {i+1}: \n\n")
+
+    result.tokens_saved = saved_chars // CHARS_PER_TOKEN
+    if result.duplicates:
+        logger.info(
+            "sources.deduped kept=%d dropped=%d tokens_saved_per_prompt=%d",
+            len(result.sources),
+            len(sources) - len(result.sources),
+            result.tokens_saved,
+        )
+    return result
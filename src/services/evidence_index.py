@@ -0,0 +1,204 @@
+"""
+Persistent local evidence index.
+
+Every document Exa or NewsAPI returns is stored (full text, URL, retrieval
+time, published date) in an on-disk SQLite FTS5 inverted index. Before going
+to the network, search asks the index for documents on the claim; when enough
+fresh documents cover the claim's terms, the request is answered locally with
+no Exa/NewsAPI latency.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional
+
+from config.settings import (
+    EVIDENCE_INDEX_PATH, EVIDENCE_INDEX_RETENTION_DAYS, EVIDENCE_INDEX_MIN_TERM_COVERAGE
+)
+from src.services.passages import terms
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    url TEXT UNIQUE NOT NULL,
+    text TEXT NOT NULL,
+    retrieved_at REAL NOT NULL,
+    published_at REAL,
+    origin TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS documents_retrieved_at ON documents(retrieved_at);
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(text, content='documents', content_rowid='id');
+CREATE TRIGGER IF NOT EXISTS documents_ai AFTER INSERT ON documents BEGIN
+    INSERT INTO documents_fts(rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS documents_ad AFTER DELETE ON documents BEGIN
+    INSERT INTO documents_fts(documents_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+CREATE TRIGGER IF NOT EXISTS documents_au AFTER UPDATE ON documents BEGIN
+    INSERT INTO documents_fts(documents_fts, rowid, text) VALUES ('delete', old.id, old.text);
+    INSERT INTO documents_fts(rowid, text) VALUES (new.id, new.text);
+END;
+"""
+
+
+@dataclass
+class IndexedDocument:
+    """A stored source document."""
+    url: str
+    text: str
+    retrieved_at: datetime
+    published_at: Optional[datetime]
+
+
+def _to_timestamp(value: Optional[datetime]) -> Optional[float]:
+    """Epoch seconds; naive datetimes are UTC (utcnow() throughout the codebase)."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _from_timestamp(value: Optional[float]) -> Optional[datetime]:
+    """Naive UTC datetime, matching what the search functions return."""
+    if value is None:
+        return None
+    return datetime.fromtimestamp(value, tz=timezone.utc).replace(tzinfo=None)
+
+
+class EvidenceIndex:
+    """On-disk inverted index of retrieved source documents."""
+
+    def __init__(self, db_path: str, retention_days: float = EVIDENCE_INDEX_RETENTION_DAYS):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.retention_seconds = retention_days * 86400
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self.hits = 0
+        self.misses = 0
+        self.prune()
+
+    def add(
+        self,
+        urls: List[str],
+        texts: List[str],
+        published_dates: Optional[List[Optional[datetime]]] = None,
+        origin: str = "exa"
+    ) -> int:
+        """
+        Store (or refresh) documents, keeping the full text so passages can be
+        re-extracted for future claims.
+
+        Returns:
+            Number of documents written
+        """
+        now = time.time()
+        dates = published_dates or [None] * len(urls)
+        rows = [
+            (url, text, now, _to_timestamp(published), origin)
+            for url, text, published in zip(urls, texts, dates)
+            if url and text and text.strip()
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """INSERT INTO documents (url, text, retrieved_at, published_at, origin)
+                   VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT(url) DO UPDATE SET
+                       text = excluded.text,
+                       retrieved_at = excluded.retrieved_at,
+                       published_at = COALESCE(excluded.published_at, documents.published_at),
+                       origin = excluded.origin""",
+                rows
+            )
+        return len(rows)
+
+    def lookup(
+        self,
+        claim: str,
+        limit: int,
+        max_age_seconds: float,
+        published_within_seconds: Optional[float] = None,
+        min_term_coverage: float = EVIDENCE_INDEX_MIN_TERM_COVERAGE
+    ) -> Optional[List[IndexedDocument]]:
+        """
+        Answer a claim from the index if coverage is fresh and sufficient.
+
+        Args:
+            claim: The claim to search for
+            limit: Number of documents needed (the tier's num_results)
+            max_age_seconds: Only documents retrieved this recently count as fresh
+            published_within_seconds: If set, documents must also have been
+                published this recently (news claims)
+            min_term_coverage: Fraction of the claim's terms each document must contain
+
+        Returns:
+            `limit` documents ranked by BM25, or None (caller goes to the network)
+        """
+        query_terms = set(terms(claim))
+        if not query_terms:
+            return None
+
+        now = time.time()
+        sql = """SELECT d.url, d.text, d.retrieved_at, d.published_at
+                 FROM documents_fts JOIN documents d ON d.id = documents_fts.rowid
+                 WHERE documents_fts MATCH ? AND d.retrieved_at >= ?"""
+        params: list = [" OR ".join(f'"{t}"' for t in sorted(query_terms)), now - max_age_seconds]
+        if published_within_seconds is not None:
+            sql += " AND d.published_at >= ?"
+            params.append(now - published_within_seconds)
+        sql += " ORDER BY bm25(documents_fts) LIMIT ?"
+        params.append(limit * 4)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        documents = []
+        for url, text, retrieved_at, published_at in rows:
+            coverage = len(query_terms & set(terms(text))) / len(query_terms)
+            if coverage >= min_term_coverage:
+                documents.append(IndexedDocument(url, text, _from_timestamp(retrieved_at), _from_timestamp(published_at)))
+            if len(documents) == limit:
+                break
+
+        if len(documents) < limit:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return documents
+
+    def prune(self) -> int:
+        """Drop documents older than the retention window."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM documents WHERE retrieved_at < ?",
+                (time.time() - self.retention_seconds,)
+            )
+        if cursor.rowcount:
+            logger.info("evidence_index.pruned count=%d", cursor.rowcount)
+        return cursor.rowcount
+
+    def stats(self) -> dict:
+        """Index size and hit rate."""
+        with self._lock:
+            documents = self._conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "documents": documents,
+            "lookups": lookups,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+# Global evidence index shared by all requests
+evidence_index = EvidenceIndex(EVIDENCE_INDEX_PATH)
@@ -0,0 +1,127 @@
+"""
+Relevance-ranked passage extraction.
+
+Instead of keeping the first N characters of each page (usually navigation
+boilerplate or a lede that never touches the claim), every document is split
+into sentence-aligned chunks, the chunks are scored against the claim with
+BM25 (IDF computed over all chunks retrieved for the request), and each
+source's character budget is filled with its best chunks, in document order.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import List
+
+from config.settings import PASSAGE_CHUNK_CHARS, PASSAGE_SEPARATOR
+
+# BM25 parameters (standard defaults)
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+_WORD_RE = re.compile(r"\w+")
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+|\n+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by did do does for from has have in is it its of on or "
+    "that the their this to was were will with who what when where which why how".split()
+)
+
+
+def terms(text: str) -> List[str]:
+    """Lowercase word terms with stopwords removed (shared with the evidence index)."""
+    return [w for w in _WORD_RE.findall(text.lower()) if w not in _STOPWORDS]
+
+
+def chunk_text(text: str, chunk_chars: int = PASSAGE_CHUNK_CHARS) -> List[str]:
+    """Split text into sentence-aligned chunks of roughly `chunk_chars` characters."""
+    chunks, current = [], ""
+    for sentence in _SENTENCE_RE.split(text):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        # Hard-wrap run-on "sentences" (tables, nav menus) so one can't eat the budget
+        while len(sentence) > chunk_chars:
+            if current:
+                chunks.append(current)
+                current = ""
+            cut = sentence.rfind(" ", 0, chunk_chars)
+            cut = cut if cut > 0 else chunk_chars
+            chunks.append(sentence[:cut])
+            sentence = sentence[cut:].strip()
+        if current and len(current) + 1 + len(sentence) > chunk_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}".strip()
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def bm25_scores(query: str, chunks: List[str]) -> List[float]:
+    """BM25 score of each chunk for the query terms."""
+    query_terms = set(terms(query))
+    chunk_terms = [Counter(terms(chunk)) for chunk in chunks]
+    if not query_terms or not chunks:
+        return [0.0] * len(chunks)
+
+    avg_len = sum(sum(tf.values()) for tf in chunk_terms) / len(chunks) or 1.0
+    doc_freq = {t: sum(1 for tf in chunk_terms if t in tf) for t in query_terms}
+    idf = {
+        t: math.log(1 + (len(chunks) - df + 0.5) / (df + 0.5))
+        for t, df in doc_freq.items()
+    }
+
+    scores = []
+    for tf in chunk_terms:
+        length = sum(tf.values())
+        score = 0.0
+        for t in query_terms:
+            f = tf.get(t, 0)
+            if f:
+                score += idf[t] * f * (BM25_K1 + 1) / (f + BM25_K1 * (1 - BM25_B + BM25_B * length / avg_len))
+        scores.append(score)
+    return scores
+
+
+def extract_passages(claim: str, documents: List[str], max_chars: int) -> List[str]:
+    """
+    Fill each document's `max_chars` budget with its most claim-relevant passages.
+
+    Args:
+        claim: The claim being verified (the BM25 query)
+        documents: Full source texts
+        max_chars: Character budget per source (MAX_SOURCE_TEXT_LENGTH / tier setting)
+
+    Returns:
+        One excerpt per document, aligned with `documents`. Documents already
+        within budget, or with no chunk matching the claim, keep their leading text.
+    """
+    doc_chunks = [chunk_text(doc) if len(doc) > max_chars else [] for doc in documents]
+    all_chunks = [chunk for chunks in doc_chunks for chunk in chunks]
+    all_scores = bm25_scores(claim, all_chunks)
+
+    excerpts, offset = [], 0
+    for doc, chunks in zip(documents, doc_chunks):
+        scores = all_scores[offset:offset + len(chunks)]
+        offset += len(chunks)
+        if not chunks or max(scores, default=0.0) <= 0.0:
+            excerpts.append(doc[:max_chars])
+            continue
+
+        # Greedy: best chunks first while they fit, then restore document order
+        chosen, used = [], 0
+        for i in sorted(range(len(chunks)), key=lambda i: scores[i], reverse=True):
+            if scores[i] <= 0.0:
+                break
+            cost = len(chunks[i]) + (len(PASSAGE_SEPARATOR) if chosen else 0)
+            if used + cost <= max_chars:
+                chosen.append(i)
+                used += cost
+        if not chosen:
+            # Best chunk alone is over budget: keep its head
+            best = max(range(len(chunks)), key=lambda i: scores[i])
+            excerpts.append(chunks[best][:max_chars])
+            continue
+        excerpts.append(PASSAGE_SEPARATOR.join(chunks[i] for i in sorted(chosen)))
+    return excerpts
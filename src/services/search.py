@@ -1,28 +1,73 @@
 """Search service: Exa integration for web source retrieval."""
 import asyncio
 import logging
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from typing import Optional
-from exa_py import Exa
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
-from config.settings import EXA_API_KEY, NEWSAPI_KEY, EXA_NUM_RESULTS, MAX_SOURCE_TEXT_LENGTH
+from config.settings import (
+    NEWSAPI_KEY, NEWSAPI_URL, EXA_NUM_RESULTS, MAX_SOURCE_TEXT_LENGTH,
+    PASSAGE_EXTRACTION_ENABLED, EXA_MAX_DOCUMENT_CHARS, EVIDENCE_INDEX_ENABLED,
+    EVIDENCE_INDEX_MAX_AGE_HOURS, EVIDENCE_INDEX_NEWS_MAX_AGE_MINUTES, NEWS_FRESH_WINDOW_HOURS,
+    NEWS_RRF_K, NEWS_EARLY_RETURN_ENABLED, NEWS_EARLY_RETURN_MIN_FRESH_SOURCES
+)
+from src.services.credibility import domain_credibility, recency_multipliers
+from src.services.evidence_index import IndexedDocument, evidence_index
+from src.services.passages import extract_passages
+from src.utils.adaptive_timeouts import adaptive_timeouts
+from src.utils.bulkheads import provider_bulkheads
+from src.utils.executor_metrics import to_thread
+from src.utils.http_clients import http_clients
+from src.utils.provider_clients import provider_clients
 
 logger = logging.getLogger(__name__)
 
-# Initialize Exa client
-exa = Exa(api_key=EXA_API_KEY)
 
-# NewsAPI client (lazy initialization)
-_newsapi_client = None
+def _excerpt(claim: str, documents: list[str], max_text_length: int) -> list[str]:
+    """Cut each document down to its text budget (claim-relevant passages when enabled)."""
+    if not PASSAGE_EXTRACTION_ENABLED:
+        return [doc[:max_text_length] for doc in documents]
+    return extract_passages(claim, documents, max_text_length)
 
 
-async def search_and_retrieve_sources(claim: str, timeout_seconds: int = 20) -> tuple[list[str], list[str]]:
+async def _index_lookup(claim: str, num_results: int, **freshness) -> Optional[list[IndexedDocument]]:
+    """Query the local evidence index; any index error is treated as a miss."""
+    if not EVIDENCE_INDEX_ENABLED:
+        return None
+    try:
+        return await to_thread(evidence_index.lookup, claim, num_results, **freshness)
+    except Exception as e:
+        logger.warning("evidence_index.lookup.failed err=%s", str(e)[:200])
+        return None
+
+
+async def _index_add(urls: list[str], documents: list[str], published_dates=None, origin: str = "exa"):
+    """Persist retrieved documents; never fails the request."""
+    if not EVIDENCE_INDEX_ENABLED:
+        return
+    try:
+        await to_thread(evidence_index.add, urls, documents, published_dates, origin)
+    except Exception as e:
+        logger.warning("evidence_index.add.failed err=%s", str(e)[:200])
+
+
+async def search_and_retrieve_sources(
+    claim: str,
+    timeout_seconds: int = 20,
+    num_results: int = EXA_NUM_RESULTS,
+    max_text_length: int = MAX_SOURCE_TEXT_LENGTH
+) -> tuple[list[str], list[str]]:
     """
-    Retrieve web sources and content using Exa API.
+    Retrieve web sources and content, from the local evidence index when it
+    has fresh coverage of the claim, otherwise from the Exa API.
     
     Args:
         claim: The claim to search for
         timeout_seconds: Timeout for the search operation
+        num_results: Number of sources to retrieve
+        max_text_length: Characters of text kept per source (the most
+            claim-relevant passages, see src/services/passages.py)
         
     Returns:
         Tuple of (sources_urls, text_blobs)
@@ -30,22 +75,29 @@ async def search_and_retrieve_sources(claim: str, timeout_seconds: int = 20) ->
     Raises:
         Exception: If search fails
     """
+    indexed = await _index_lookup(claim, num_results, max_age_seconds=EVIDENCE_INDEX_MAX_AGE_HOURS * 3600)
+    if indexed:
+        logger.info("sources.index_hit count=%d", len(indexed))
+        return [doc.url for doc in indexed], _excerpt(claim, [doc.text for doc in indexed], max_text_length)
+
     try:
-        search_results = await asyncio.wait_for(
-            asyncio.to_thread(
-                exa.search_and_contents,
-                claim,
-                num_results=EXA_NUM_RESULTS,
-                text=True
-            ),
-            timeout=timeout_seconds
-        )
+        exa = await provider_clients.aget("exa")
+        async with provider_bulkheads.slot("exa"):
+            with adaptive_timeouts.track("exa", "search", cap=timeout_seconds) as timeout:
+                search_results = await asyncio.wait_for(
+                    exa.search_and_contents(
+                        claim,
+                        num_results=num_results,
+                        # Full page (bounded) so passages can come from anywhere in it
+                        text={"max_characters": EXA_MAX_DOCUMENT_CHARS} if PASSAGE_EXTRACTION_ENABLED else True
+                    ),
+                    timeout=timeout
+                )
         
         sources = [res.url for res in search_results.results]
-        text_blobs = [
-            res.text[:MAX_SOURCE_TEXT_LENGTH] if res.text else ""
-            for res in search_results.results
-        ]
+        documents = [res.text or "" for res in search_results.results]
+        text_blobs = _excerpt(claim, documents, max_text_length)
+        await _index_add(sources, documents)
         
         logger.info("sources.retrieved count=%d", len(sources))
         return sources, text_blobs
@@ -58,89 +110,219 @@ async def search_and_retrieve_sources(claim: str, timeout_seconds: int = 20) ->
         raise
 
 
-async def search_news_sources(claim: str, timeout_seconds: int = 20) -> tuple[list[str], list[str], list[datetime]]:
+@dataclass
+class NewsDocument:
+    """One retrieved news article, before fusion."""
+    url: str
+    text: str
+    published_at: Optional[datetime]  # naive UTC; None when the provider gave no date
+    origin: str
+
+
+def _to_naive_utc(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO-8601 timestamp ("...Z" or offset) into naive UTC, like utcnow()."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form for deduplication: no scheme, www., fragment, tracking params or trailing slash."""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower().removeprefix("www.")
+    query = urlencode([(k, v) for k, v in parse_qsl(parts.query) if not k.lower().startswith("utm_")])
+    return urlunsplit(("", host, parts.path.rstrip("/"), query, ""))
+
+
+def reciprocal_rank_fusion(rankings: list[list[NewsDocument]], k: int = NEWS_RRF_K) -> list[NewsDocument]:
     """
-    Retrieve real-time news sources using NewsAPI + Exa.
+    Merge provider rankings by reciprocal rank fusion: score = sum 1 / (k + rank).
+
+    Articles returned by several providers (same normalized URL) are merged:
+    the longest text is kept and the earliest known publication date wins.
+    """
+    scores: dict[str, float] = {}
+    merged: dict[str, NewsDocument] = {}
+    for ranking in rankings:
+        for rank, doc in enumerate(ranking, start=1):
+            key = normalize_url(doc.url)
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
+            existing = merged.get(key)
+            if existing is None:
+                merged[key] = NewsDocument(doc.url, doc.text, doc.published_at, doc.origin)
+                continue
+            if len(doc.text) > len(existing.text):
+                existing.text = doc.text
+            dates = [d for d in (existing.published_at, doc.published_at) if d]
+            existing.published_at = min(dates) if dates else None
+    return [merged[key] for key in sorted(scores, key=scores.get, reverse=True)]
+
+
+async def _fetch_newsapi(claim: str, timeout_seconds: float, num_results: int) -> list[NewsDocument]:
+    """Articles from the last 48 hours on NewsAPI, newest first."""
+    from_date = (datetime.utcnow() - timedelta(hours=NEWS_FRESH_WINDOW_HOURS)).strftime('%Y-%m-%d')
+    # Shared keep-alive client: no new TCP/TLS handshake per request
+    async with provider_bulkheads.slot("newsapi"):
+        with adaptive_timeouts.track("newsapi", "everything", cap=timeout_seconds) as timeout:
+            response = await http_clients.get("newsapi").get(
+                NEWSAPI_URL,
+                params={
+                    "q": claim,
+                    "from": from_date,
+                    "sortBy": "publishedAt",
+                    "pageSize": num_results,
+                    "apiKey": NEWSAPI_KEY,
+                    "language": "en"
+                },
+                timeout=timeout
+            )
+    response.raise_for_status()
+    return [
+        NewsDocument(
+            url=art["url"],
+            text=(art.get("title") or "") + " " + (art.get("description") or "") + " " + (art.get("content") or ""),
+            published_at=_to_naive_utc(art.get("publishedAt")),
+            origin="newsapi"
+        )
+        for art in response.json().get("articles", [])
+        if art.get("url")
+    ]
+
+
+async def _fetch_exa_news(claim: str, timeout_seconds: float, num_results: int) -> list[NewsDocument]:
+    """Exa results with their real publication dates (None when Exa has none)."""
+    exa = await provider_clients.aget("exa")
+    async with provider_bulkheads.slot("exa"):
+        with adaptive_timeouts.track("exa", "news", cap=timeout_seconds) as timeout:
+            search_results = await asyncio.wait_for(
+                exa.search_and_contents(
+                    claim,
+                    num_results=num_results,
+                    text={"max_characters": EXA_MAX_DOCUMENT_CHARS} if PASSAGE_EXTRACTION_ENABLED else True
+                ),
+                timeout=timeout
+            )
+    return [
+        NewsDocument(
+            url=res.url,
+            text=res.text or "",
+            published_at=_to_naive_utc(getattr(res, "published_date", None)),
+            origin="exa"
+        )
+        for res in search_results.results
+    ]
+
+
+def _fresh_count(docs: list[NewsDocument]) -> int:
+    cutoff = datetime.utcnow() - timedelta(hours=NEWS_FRESH_WINDOW_HOURS)
+    return sum(1 for doc in docs if doc.published_at and doc.published_at >= cutoff)
+
+
+async def search_news_sources(
+    claim: str,
+    timeout_seconds: int = 20,
+    num_results: int = EXA_NUM_RESULTS,
+    max_text_length: int = MAX_SOURCE_TEXT_LENGTH
+) -> tuple[list[str], list[str], list[Optional[datetime]]]:
+    """
+    Retrieve real-time news sources from NewsAPI and Exa concurrently.
     
-    Prioritizes recent news articles (last 48 hours) for breaking news verification.
-    Falls back to Exa if NewsAPI is unavailable.
+    Both providers are queried at once and their rankings merged by reciprocal
+    rank fusion, deduplicated by URL. Once NEWS_EARLY_RETURN_MIN_FRESH_SOURCES
+    articles from the last 48 hours have arrived, the slower provider is
+    cancelled, so a NewsAPI outage costs max(NewsAPI, Exa) rather than their sum.
+    Served from the local evidence index when it holds enough articles retrieved
+    in the last EVIDENCE_INDEX_NEWS_MAX_AGE_MINUTES.
     
     Args:
         claim: The news claim to search for
         timeout_seconds: Timeout for the search operation
+        num_results: Number of sources to retrieve
+        max_text_length: Characters of text kept per source
         
     Returns:
-        Tuple of (sources_urls, text_blobs, published_dates)
+        Tuple of (sources_urls, text_blobs, published_dates); a date is None
+        when neither provider reported one
         
     Raises:
-        Exception: If search fails
+        Exception: If every provider fails
     """
-    from datetime import datetime as dt, timedelta
+    indexed = await _index_lookup(
+        claim,
+        num_results,
+        max_age_seconds=EVIDENCE_INDEX_NEWS_MAX_AGE_MINUTES * 60,
+        published_within_seconds=NEWS_FRESH_WINDOW_HOURS * 3600
+    )
+    if indexed:
+        logger.info("news.sources.index_hit count=%d", len(indexed))
+        return (
+            [doc.url for doc in indexed],
+            _excerpt(claim, [doc.text for doc in indexed], max_text_length),
+            [doc.published_at for doc in indexed]
+        )
     
+    fetchers = {"exa": _fetch_exa_news(claim, timeout_seconds, num_results)}
+    if NEWSAPI_KEY:
+        fetchers["newsapi"] = _fetch_newsapi(claim, timeout_seconds, num_results)
+    tasks = {asyncio.create_task(coro): name for name, coro in fetchers.items()}
+    
+    rankings: dict[str, list[NewsDocument]] = {}
+    pending = set(tasks)
+    # One budget for the whole fan-out, not a fresh timeout per provider
+    loop = asyncio.get_running_loop()
+    give_up_at = loop.time() + timeout_seconds
     try:
-        # Try NewsAPI first (real-time news)
-        if NEWSAPI_KEY:
-            try:
-                import httpx
-                
-                # Search last 48 hours for breaking news
-                from_date = (dt.utcnow() - timedelta(hours=48)).strftime('%Y-%m-%d')
-                
-                async with httpx.AsyncClient(timeout=timeout_seconds) as client:
-                    response = await client.get(
-                        "https://newsapi.org/v2/everything",
-                        params={
-                            "q": claim,
-                            "from": from_date,
-                            "sortBy": "publishedAt",
-                            "pageSize": EXA_NUM_RESULTS,
-                            "apiKey": NEWSAPI_KEY,
-                            "language": "en"
-                        }
-                    )
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        articles = data.get("articles", [])
-                        
-                        if articles:
-                            sources = [art["url"] for art in articles if art.get("url")]
-                            text_blobs = [
-                                (art.get("title", "") + " " + art.get("description", "") + " " + art.get("content", ""))[:MAX_SOURCE_TEXT_LENGTH]
-                                for art in articles
-                            ]
-                            published_dates = [
-                                dt.fromisoformat(art["publishedAt"].replace("Z", "+00:00")) if art.get("publishedAt") else dt.utcnow()
-                                for art in articles
-                            ]
-                            
-                            logger.info("newsapi.sources.retrieved count=%d", len(sources))
-                            return sources, text_blobs, published_dates
-            except Exception as newsapi_error:
-                logger.warning("newsapi.failed err=%s, falling back to exa", str(newsapi_error)[:200])
-        
-        # Fallback to Exa (general web search)
-        sources, text_blobs = await search_and_retrieve_sources(claim, timeout_seconds)
-        published_dates = [dt.utcnow()] * len(sources)  # No dates from Exa
-        
-        logger.info("exa.sources.retrieved count=%d (no newsapi)", len(sources))
-        return sources, text_blobs, published_dates
-        
-    except Exception as e:
-        logger.error("news.sources.fetch.failed err=%s", str(e)[:200])
-        raise
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, timeout=max(0.0, give_up_at - loop.time()), return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                logger.error("news.sources.timeout providers=%s", ",".join(tasks[t] for t in pending))
+                break
+            for task in done:
+                name = tasks[task]
+                try:
+                    rankings[name] = task.result()
+                    logger.info("news.provider.done provider=%s count=%d", name, len(rankings[name]))
+                except Exception as e:
+                    logger.warning("news.provider.failed provider=%s err=%s", name, str(e)[:200])
+            fused = reciprocal_rank_fusion(list(rankings.values()))
+            if NEWS_EARLY_RETURN_ENABLED and pending and _fresh_count(fused) >= NEWS_EARLY_RETURN_MIN_FRESH_SOURCES:
+                logger.info("news.sources.early_return fresh=%d skipped=%s", _fresh_count(fused), ",".join(tasks[t] for t in pending))
+                break
+    finally:
+        for task in pending:
+            task.cancel()
+    
+    if not rankings:
+        logger.error("news.sources.fetch.failed all providers failed")
+        raise Exception("News source retrieval failed for every provider")
+    
+    docs = reciprocal_rank_fusion(list(rankings.values()))[:num_results]
+    sources = [doc.url for doc in docs]
+    documents = [doc.text for doc in docs]
+    published_dates = [doc.published_at for doc in docs]
+    for origin, ranking in rankings.items():
+        await _index_add([d.url for d in ranking], [d.text for d in ranking], [d.published_at for d in ranking], origin=origin)
+    
+    logger.info("news.sources.retrieved count=%d providers=%s", len(sources), ",".join(sorted(rankings)))
+    return sources, _excerpt(claim, documents, max_text_length), published_dates
 
 
 def calculate_source_weights(sources: list[str], published_dates: Optional[list[datetime]] = None) -> list[float]:
     """
     Calculate weights for sources based on domain credibility and recency.
     
-    Base weights:
-    - Wikipedia: 0.5x (encyclopedic, not primary source)
-    - News sites: 1.0x
-    - Other: 1.0x
+    Base weights come from the domain credibility table
+    (config/domain_credibility.json); unlisted domains get 1.0x.
     
-    Recency multipliers (for news verification):
+    Recency multipliers (for news verification, RECENCY_MULTIPLIERS):
     - Last 24 hours: 1.5x
     - Last 7 days: 1.2x
     - Older: 1.0x
@@ -152,25 +334,9 @@ def calculate_source_weights(sources: list[str], published_dates: Optional[list[
     Returns:
         List of weights corresponding to each source
     """
-    weights = []
-    now = datetime.utcnow()
-    
-    for i, url in enumerate(sources):
-        # Base weight
-        if "wikipedia.org" in url.lower():
-            base_weight = 0.5
-        else:
-            base_weight = 1.0
-        
-        # Recency multiplier (if dates provided)
-        recency_multiplier = 1.0
-        if published_dates and i < len(published_dates) and published_dates[i]:
-            age = now - published_dates[i]
-            if age <= timedelta(hours=24):
-                recency_multiplier = 1.5  # Breaking news
-            elif age <= timedelta(days=7):
-                recency_multiplier = 1.2  # Recent news
-        
-        weights.append(base_weight * recency_multiplier)
-    
-    return weights
+    dates = list(published_dates or [])[:len(sources)]
+    dates += [None] * (len(sources) - len(dates))
+    return [
+        domain_credibility.weight(url) * recency
+        for url, recency in zip(sources, recency_multipliers(dates))
+    ]
@@ -0,0 +1,112 @@
+"""Session service: Prepaid verification credits behind a signed session token."""
+import base64
+import hashlib
+import hmac
+import logging
+import secrets
+import threading
+import time
+from typing import Dict, Optional
+
+from config.settings import SESSION_SECRET, SESSION_TTL_SECONDS
+
+logger = logging.getLogger(__name__)
+
+TOKEN_VERSION = "v1"
+
+
+class SessionStore:
+    """
+    In-memory ledger of prepaid verification credits.
+
+    Tokens have the form ``v1.<session_id>.<expires_at>.<signature>`` where the
+    signature is an HMAC-SHA256 over the first three fields. Authenticating a
+    request is therefore a constant-time HMAC check plus a dict lookup - no
+    x402 round trip. Balances live in process memory (the service runs a
+    single gunicorn worker), so a restart forfeits unused credits.
+    """
+
+    def __init__(self, secret: str, ttl_seconds: int = SESSION_TTL_SECONDS):
+        self._secret = secret.encode()
+        self._ttl_seconds = ttl_seconds
+        self._credits: Dict[str, int] = {}
+        self._expires_at: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _sign(self, payload: str) -> str:
+        digest = hmac.new(self._secret, payload.encode(), hashlib.sha256).digest()
+        return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+    def create(self, credits: int) -> dict:
+        """
+        Open a new session holding `credits` verification credits.
+
+        Returns:
+            Dictionary with session_token, session_id, credits and expires_at
+        """
+        session_id = secrets.token_urlsafe(16)
+        expires_at = int(time.time()) + self._ttl_seconds
+        payload = f"{TOKEN_VERSION}.{session_id}.{expires_at}"
+        token = f"{payload}.{self._sign(payload)}"
+
+        with self._lock:
+            self._purge_expired()
+            self._credits[session_id] = credits
+            self._expires_at[session_id] = expires_at
+
+        logger.info("session.created id=%s credits=%d", session_id, credits)
+        return {
+            "session_token": token,
+            "session_id": session_id,
+            "credits": credits,
+            "expires_at": expires_at,
+        }
+
+    def authenticate(self, token: str) -> Optional[str]:
+        """Return the session id for a valid, unexpired token, else None."""
+        try:
+            version, session_id, expires_at, signature = token.split(".")
+        except ValueError:
+            return None
+        if version != TOKEN_VERSION:
+            return None
+
+        expected = self._sign(f"{version}.{session_id}.{expires_at}")
+        if not hmac.compare_digest(signature, expected):
+            return None
+        if int(expires_at) < time.time() or session_id not in self._credits:
+            return None
+        return session_id
+
+    def consume(self, session_id: str, count: int = 1) -> bool:
+        """Atomically deduct `count` credits. Returns False if the balance is too low."""
+        with self._lock:
+            balance = self._credits.get(session_id, 0)
+            if balance < count:
+                return False
+            self._credits[session_id] = balance - count
+        return True
+
+    def refund(self, session_id: str, count: int = 1):
+        """Credit back verifications that ended in a refunded_* payment status."""
+        if count <= 0:
+            return
+        with self._lock:
+            if session_id in self._credits:
+                self._credits[session_id] += count
+        logger.info("session.refunded id=%s credits=%d", session_id, count)
+
+    def balance(self, session_id: str) -> int:
+        """Remaining credits for a session (0 if unknown or expired)."""
+        return self._credits.get(session_id, 0)
+
+    def _purge_expired(self):
+        now = time.time()
+        expired = [sid for sid, exp in self._expires_at.items() if exp < now]
+        for sid in expired:
+            self._credits.pop(sid, None)
+            self._expires_at.pop(sid, None)
+
+
+# Global instance shared by the middleware and endpoints
+session_store = SessionStore(SESSION_SECRET)
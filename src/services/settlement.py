@@ -0,0 +1,334 @@
+"""Settlement service: Durable queue of settle/refund decisions flushed in bulk."""
+import asyncio
+import base64
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from config.settings import (
+    SETTLEMENT_JOURNAL_FILE, SETTLEMENT_BATCH_SIZE, SETTLEMENT_FLUSH_INTERVAL_SECONDS,
+    SETTLEMENT_FACILITATOR_URL, SETTLEMENT_MAX_REJECTIONS, SETTLEMENT_DEAD_LETTER_FILE
+)
+from src.utils.executor_metrics import to_thread
+from src.utils.http_clients import http_clients
+
+logger = logging.getLogger(__name__)
+
+
+def extract_payer(payment_header: Optional[str]) -> Optional[str]:
+    """
+    Pull the payer wallet address out of a base64 X-PAYMENT header.
+
+    Returns None if the header is missing or not a decodable x402 payload.
+    """
+    if not payment_header:
+        return None
+    try:
+        payment = json.loads(base64.b64decode(payment_header))
+        return payment["payload"]["authorization"]["from"]
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+class LocalFacilitator:
+    """
+    Stand-in facilitator for development and tests.
+
+    Accepts every batch and appends it to a JSONL file so bulk runs can be
+    inspected without touching the chain.
+    """
+
+    def __init__(self, batch_log_path: str = "logs/settlement_batches.jsonl"):
+        self.batch_log_path = Path(batch_log_path)
+
+    async def submit_batch(self, batch_id: str, entries: List[Dict]) -> List[str]:
+        self.batch_log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.batch_log_path, "a") as f:
+            f.write(json.dumps({
+                "batch_id": batch_id,
+                "submitted_at": time.time(),
+                "entries": entries
+            }) + "\n")
+        return [entry["id"] for entry in entries]
+
+
+class HttpFacilitator:
+    """Posts bulk settlement runs to a facilitator endpoint."""
+
+    def __init__(self, url: str, timeout_seconds: int = 30):
+        self.url = url.rstrip("/")
+        self.timeout_seconds = timeout_seconds
+
+    async def submit_batch(self, batch_id: str, entries: List[Dict]) -> List[str]:
+        response = await http_clients.get("facilitator").post(
+            f"{self.url}/settle/batch",
+            json={"batch_id": batch_id, "settlements": entries},
+            timeout=self.timeout_seconds
+        )
+        response.raise_for_status()
+        data = response.json()
+        # Facilitator reports which entries it accepted; default to all on a bare 200
+        return data.get("settled", [entry["id"] for entry in entries])
+
+
+class SettlementQueue:
+    """
+    Append-only journal of payment decisions with periodic bulk flushing.
+
+    `record()` is called on the request path and only appends one line to the
+    journal, off the event loop. `flush()` runs in the background, offers each
+    pending decision to the facilitator once per run in batches of up to
+    `batch_size`, and journals completions and rejections. A decision rejected
+    `max_rejections` times is moved to the dead-letter file so it cannot hold
+    up the queue. After each run the journal is rewritten to hold only the
+    decisions still pending, and on startup it is replayed so they survive a
+    restart.
+    """
+
+    def __init__(
+        self,
+        journal_path: str,
+        facilitator,
+        batch_size: int = SETTLEMENT_BATCH_SIZE,
+        max_rejections: int = SETTLEMENT_MAX_REJECTIONS,
+        dead_letter_path: Optional[str] = None
+    ):
+        self.journal_path = Path(journal_path)
+        self.dead_letter_path = Path(dead_letter_path) if dead_letter_path else (
+            self.journal_path.with_name(Path(SETTLEMENT_DEAD_LETTER_FILE).name)
+        )
+        self.facilitator = facilitator
+        self.batch_size = batch_size
+        self.max_rejections = max_rejections
+        self._pending: Dict[str, Dict] = {}
+        self._flush_lock = asyncio.Lock()
+        self._write_lock = threading.Lock()
+        # Appends in flight hold off compaction, which waits for them to land
+        self._journal_state = asyncio.Condition()
+        self._appends_in_flight = 0
+        self._compacting = False
+        self.batches_submitted = 0
+        self.entries_completed = 0
+        self.entries_failed = 0
+        self.last_flush_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._replay()
+
+    def _replay(self):
+        """
+        Rebuild pending decisions from the journal (enqueued minus completed
+        and failed, with rejections counted).
+
+        Lines that do not decode, such as one torn by a crash mid-append, are
+        skipped.
+        """
+        if not self.journal_path.exists():
+            return
+        skipped = 0
+        with open(self.journal_path, "r") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    event = json.loads(line)
+                    if event["event"] == "enqueued":
+                        self._pending[event["entry"]["id"]] = event["entry"]
+                    elif event["event"] in ("completed", "failed"):
+                        for entry_id in event["ids"]:
+                            self._pending.pop(entry_id, None)
+                    elif event["event"] == "rejected":
+                        for entry_id in event["ids"]:
+                            if entry_id in self._pending:
+                                self._pending[entry_id]["rejections"] = self._pending[entry_id].get("rejections", 0) + 1
+                except (ValueError, KeyError, TypeError, AttributeError):
+                    skipped += 1
+        if skipped:
+            logger.warning("settlement.replay.skipped lines=%d journal=%s", skipped, self.journal_path)
+        if self._pending:
+            logger.info("settlement.replayed pending=%d", len(self._pending))
+
+    def _append_sync(self, path: Path, lines: List[Dict]):
+        text = "".join(json.dumps(line) + "\n" for line in lines)
+        with self._write_lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "a") as f:
+                f.write(text)
+
+    def _rewrite_sync(self, entries: List[Dict]):
+        """Replace the journal with one enqueued line per entry (temp file + os.replace)."""
+        with self._write_lock:
+            if not entries:
+                self.journal_path.unlink(missing_ok=True)
+                return
+            tmp_path = self.journal_path.with_name(self.journal_path.name + ".tmp")
+            with open(tmp_path, "w") as f:
+                for entry in entries:
+                    f.write(json.dumps({"event": "enqueued", "entry": entry}) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.journal_path)
+
+    async def _append(self, event: Dict):
+        await to_thread(self._append_sync, self.journal_path, [event])
+
+    async def record(
+        self,
+        payment_status: str,
+        amount_usdc: float,
+        payer: Optional[str] = None,
+        claim: str = "",
+        payment_header: Optional[str] = None
+    ) -> str:
+        """
+        Journal one settle or refund decision.
+
+        Args:
+            payment_status: "settled" or any "refunded_*" status from verification
+            amount_usdc: Amount to settle or refund
+            payer: Payer wallet address (from the X-PAYMENT header)
+            claim: Claim text, truncated for the journal
+            payment_header: Raw X-PAYMENT header, needed by the facilitator to settle
+
+        Returns:
+            Entry id
+        """
+        entry = {
+            "id": uuid.uuid4().hex,
+            "action": "refund" if payment_status.startswith("refunded") else "settle",
+            "payment_status": payment_status,
+            "amount_usdc": amount_usdc,
+            "payer": payer,
+            "claim": claim[:100],
+            "payment_header": payment_header,
+            "recorded_at": time.time()
+        }
+        async with self._journal_state:
+            await self._journal_state.wait_for(lambda: not self._compacting)
+            self._appends_in_flight += 1
+        try:
+            await self._append({"event": "enqueued", "entry": entry})
+            self._pending[entry["id"]] = entry
+        finally:
+            async with self._journal_state:
+                self._appends_in_flight -= 1
+                self._journal_state.notify_all()
+        return entry["id"]
+
+    async def _reject(self, batch_id: str, rejected: List[Dict]):
+        """Count a rejection for each entry; dead-letter those out of tries, requeue the rest at the back."""
+        await self._append({"event": "rejected", "batch_id": batch_id, "ids": [entry["id"] for entry in rejected]})
+        failed = []
+        for entry in rejected:
+            entry["rejections"] = entry.get("rejections", 0) + 1
+            del self._pending[entry["id"]]
+            if entry["rejections"] >= self.max_rejections:
+                failed.append(entry)
+            else:
+                self._pending[entry["id"]] = entry
+        if failed:
+            await to_thread(self._append_sync, self.dead_letter_path, [
+                {"failed_at": time.time(), "batch_id": batch_id, "entry": entry} for entry in failed
+            ])
+            await self._append({"event": "failed", "batch_id": batch_id, "ids": [entry["id"] for entry in failed]})
+            self.entries_failed += len(failed)
+            logger.error(
+                "settlement.dead_letter count=%d rejections=%d file=%s",
+                len(failed), self.max_rejections, self.dead_letter_path
+            )
+
+    async def _compact(self):
+        """Rewrite the journal down to the pending entries once in-flight appends have landed."""
+        async with self._journal_state:
+            self._compacting = True
+            await self._journal_state.wait_for(lambda: self._appends_in_flight == 0)
+        try:
+            await to_thread(self._rewrite_sync, list(self._pending.values()))
+        finally:
+            async with self._journal_state:
+                self._compacting = False
+                self._journal_state.notify_all()
+
+    async def flush(self) -> int:
+        """
+        Submit pending decisions in bulk. Returns the number completed.
+
+        Each pending decision is offered once per run. If the facilitator is
+        unreachable the run stops and the rest wait for the next one; entries
+        it rejects are counted and moved behind the others.
+        """
+        async with self._flush_lock:
+            completed = 0
+            journal_changed = False
+            queued = list(self._pending)
+            for start in range(0, len(queued), self.batch_size):
+                entries = [self._pending[i] for i in queued[start:start + self.batch_size] if i in self._pending]
+                if not entries:
+                    continue
+                batch_id = uuid.uuid4().hex
+                try:
+                    settled_ids = await self.facilitator.submit_batch(batch_id, entries)
+                except Exception as e:
+                    self.last_error = str(e)[:200]
+                    logger.error("settlement.flush.failed batch=%s err=%s", batch_id, self.last_error)
+                    break
+
+                settled = set(settled_ids)
+                await self._append({"event": "completed", "batch_id": batch_id, "ids": list(settled)})
+                journal_changed = True
+                for entry_id in settled:
+                    self._pending.pop(entry_id, None)
+                self.batches_submitted += 1
+                self.entries_completed += len(settled)
+                completed += len(settled)
+                self.last_error = None
+                logger.info("settlement.batch.done batch=%s count=%d", batch_id, len(settled))
+
+                rejected = [entry for entry in entries if entry["id"] not in settled]
+                if rejected:
+                    logger.warning("settlement.batch.rejected batch=%s count=%d", batch_id, len(rejected))
+                    await self._reject(batch_id, rejected)
+
+            self.last_flush_at = time.time()
+            if journal_changed:
+                await self._compact()
+            return completed
+
+    async def run_periodic(self, interval_seconds: int = SETTLEMENT_FLUSH_INTERVAL_SECONDS):
+        """Background loop: flush every `interval_seconds` until cancelled."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error("settlement.periodic.failed err=%s", e)
+
+    def stats(self) -> Dict:
+        """Queue depth and flush health for the metrics endpoint."""
+        pending = list(self._pending.values())
+        oldest = min((entry["recorded_at"] for entry in pending), default=None)
+        return {
+            "queue_depth": len(pending),
+            "pending_settle": sum(1 for entry in pending if entry["action"] == "settle"),
+            "pending_refund": sum(1 for entry in pending if entry["action"] == "refund"),
+            "pending_refund_usdc": round(sum(entry["amount_usdc"] for entry in pending if entry["action"] == "refund"), 4),
+            "pending_rejected": sum(1 for entry in pending if entry.get("rejections")),
+            "oldest_pending_age_seconds": round(time.time() - oldest, 1) if oldest else None,
+            "batches_submitted": self.batches_submitted,
+            "entries_completed": self.entries_completed,
+            "entries_failed": self.entries_failed,
+            "last_flush_at": self.last_flush_at,
+            "last_error": self.last_error
+        }
+
+
+# Global instance: real facilitator if configured, local stand-in otherwise
+settlement_queue = SettlementQueue(
+    SETTLEMENT_JOURNAL_FILE,
+    HttpFacilitator(SETTLEMENT_FACILITATOR_URL) if SETTLEMENT_FACILITATOR_URL else LocalFacilitator(),
+    dead_letter_path=SETTLEMENT_DEAD_LETTER_FILE
+)
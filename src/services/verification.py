@@ -3,24 +3,357 @@ import asyncio
 import logging
 import time
 from datetime import datetime
+from typing import Optional
 
 from config.settings import (
     EXA_SEARCH_TIMEOUT_SECONDS, DEBATE_TIMEOUT_SECONDS,
-    PREDICTION_KEYWORDS, CONFIDENCE_THRESHOLD_FOR_MANUAL_REVIEW,
-    CONFIDENCE_FLOOR_FOR_REFUND
+    CONFIDENCE_THRESHOLD_FOR_MANUAL_REVIEW,
+    CONFIDENCE_FLOOR_FOR_REFUND, QUICK_CHECK_ENABLED, QUICK_CHECK_TIMEOUT_SECONDS,
+    QUICK_CHECK_MIN_CONFIDENCE, QUICK_CHECK_MIN_SOURCE_AGREEMENT,
+    QUICK_CHECK_ESCALATE_PREDICTIONS, DEFAULT_TIER, VERIFICATION_TIERS, DEDUPE_ENABLED,
+    DEADLINE_SAFETY_MARGIN_SECONDS, DEADLINE_MIN_QUICK_CHECK_SECONDS, DEADLINE_MIN_DEBATE_SECONDS,
+    DEADLINE_MIN_JUDGE_SECONDS
 )
 from src.services.search import search_and_retrieve_sources, search_news_sources, calculate_source_weights
+from src.services.credibility import domain_credibility
+from src.services.dedupe import DedupeResult, dedupe_sources
 from src.agents.prover import run_prover_agent
 from src.agents.debunker import run_debunker_agent
 from src.agents.judge import run_judge_agent
+from src.agents.quick_check import run_quick_check_agent, source_agreement
+from src.agents.prompts import PROVER, DEBUNKER
 from performance_log import PerformanceLogger
 from src.utils.token_tracker import token_tracker
-from src.utils.philosophical_filter import is_philosophical_claim, get_philosophical_response
+from src.utils.claim_classifier import classify_claim
+from src.utils.deadline import Deadline
+from src.utils.philosophical_filter import get_philosophical_response
 
 logger = logging.getLogger(__name__)
 
+QUICK_CHECK_PATH = "quick_check"
+FULL_DEBATE_PATH = "full_debate"
 
-async def verify_claim_logic(claim: str) -> dict:
+
+def _quick_check_settles(quick_result: dict, weights: list[float]) -> tuple[bool, str]:
+    """
+    Decide whether a tier-1 quick check is strong enough to skip the debate.
+    
+    Settles only a definite verdict with high model confidence AND most of the
+    source weight on the same side as that verdict.
+    
+    Returns:
+        (settles, reason) - reason explains an escalation, for logging
+    """
+    if quick_result is None:
+        return False, "quick_check_failed"
+
+    verdict = quick_result.get("verdict")
+    if verdict not in ("Verified", "Unverified"):
+        return False, f"verdict={verdict}"
+
+    confidence = quick_result["confidence_score"]
+    if confidence < QUICK_CHECK_MIN_CONFIDENCE:
+        return False, f"confidence={confidence:.2f}"
+
+    stance = "supports" if verdict == "Verified" else "refutes"
+    agreement = source_agreement(quick_result["source_stances"], weights, stance)
+    quick_result["source_agreement"] = round(agreement, 2)
+    if agreement < QUICK_CHECK_MIN_SOURCE_AGREEMENT:
+        return False, f"source_agreement={agreement:.2f}"
+
+    return True, ""
+
+
+def _degraded_result(reason: str, quick_result: Optional[dict]) -> dict:
+    """
+    Best answer available when the deadline cuts the pipeline short: the quick
+    check's ruling if there is one, else an Inconclusive placeholder (which
+    the confidence floor refunds). Always flagged for manual review by the caller.
+    """
+    result = dict(quick_result) if quick_result else {
+        "verdict": "Inconclusive",
+        "confidence_score": 0.0,
+        "summary": "Not enough time left within the request deadline to complete verification."
+    }
+    result["degraded_reason"] = reason
+    return result
+
+
+async def _run_quick_check(
+    claim: str,
+    text_blobs: list[str],
+    is_prediction: bool,
+    model: str,
+    deadline: Deadline,
+    log_prefix: str = ""
+) -> Optional[dict]:
+    """Quick check bounded by its own timeout and the request deadline (None on timeout)."""
+    try:
+        return await asyncio.wait_for(
+            run_quick_check_agent(claim, text_blobs, is_prediction, model=model, deadline=deadline),
+            timeout=deadline.budget(QUICK_CHECK_TIMEOUT_SECONDS, reserve=DEADLINE_SAFETY_MARGIN_SECONDS),
+        )
+    except asyncio.TimeoutError:
+        logger.warning("%squick_check.timeout remaining=%.2f", log_prefix, deadline.remaining())
+        return None
+
+
+async def _run_debate(agents: dict, timeout: float, log_prefix: str = "") -> tuple[dict, list[str]]:
+    """
+    Run the debaters concurrently, tracking each one on its own.
+
+    An agent that finishes in time keeps its argument even if the other one
+    times out (only the stragglers are cancelled). A missing argument is
+    replaced by a placeholder naming the role.
+
+    Args:
+        agents: Role -> agent coroutine
+        timeout: Seconds to wait for all of them
+
+    Returns:
+        (role -> argument, roles whose argument is missing because they timed out or failed)
+    """
+    tasks = {role: asyncio.ensure_future(coro) for role, coro in agents.items()}
+    try:
+        done, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+    finally:
+        # Also reached when the caller is cancelled (outer backstop, client disconnect)
+        for task in tasks.values():
+            if not task.done():
+                task.cancel()
+
+    arguments, missing = {}, []
+    for role, task in tasks.items():
+        if task in pending:
+            logger.warning("%s%s.timeout", log_prefix, role)
+        elif task.exception() is not None:
+            logger.warning("%s%s.failed err=%s", log_prefix, role, task.exception())
+        else:
+            arguments[role] = task.result()
+            continue
+        arguments[role] = f"[No {role} argument: the {role} agent timed out or failed.]"
+        missing.append(role)
+    return arguments, missing
+
+
+async def _run_tiered_verification(
+    claim: str,
+    text_blobs: list[str],
+    weights: list[float],
+    is_prediction: bool,
+    tier_config: dict,
+    log_prefix: str = "",
+    source_labels: Optional[list[str]] = None,
+    deadline: Optional[Deadline] = None
+) -> tuple[dict, str, str, bool, str]:
+    """
+    Tier 1: a single cheap model call. Tier 2 (escalation): full Prover/Debunker
+    debate followed by the Judge, only when the quick check cannot settle the claim.
+    
+    The client's latency tier decides how far this goes: "never" answers from
+    the quick check alone, "always" skips straight to the debate.
+    
+    Every stage is bounded by the request `deadline`. When too little time is
+    left to start the debate or the judge, the quick check's answer (or an
+    Inconclusive placeholder) is returned with `degraded_reason` set and
+    manual_review on, instead of running past the deadline.
+    
+    Returns:
+        (judge_result, prover_argument, debunker_argument, manual_review, verification_path)
+        
+    Raises:
+        asyncio.TimeoutError: If neither debater produced an argument in time
+            and there is no quick check answer to fall back on
+    """
+    deadline = deadline or Deadline(tier_config["deadline_seconds"])
+    debate_mode = tier_config["debate"]
+    models = tier_config["models"]
+    run_quick_check = debate_mode == "never" or (
+        debate_mode == "escalate"
+        and QUICK_CHECK_ENABLED
+        and not (is_prediction and QUICK_CHECK_ESCALATE_PREDICTIONS)
+    )
+    # The debate needs time for itself and the judge after it
+    debate_time = DEADLINE_MIN_DEBATE_SECONDS + DEADLINE_MIN_JUDGE_SECONDS
+    deadline_skip = "N/A - Skipped (request deadline)"
+    quick_instead_of_debate = (
+        not run_quick_check
+        and not deadline.has(debate_time)
+        and deadline.has(DEADLINE_MIN_QUICK_CHECK_SECONDS)
+    )
+
+    quick_result = None
+    if run_quick_check or quick_instead_of_debate:
+        quick_result = await _run_quick_check(
+            claim, text_blobs, is_prediction, models["quick_check"], deadline, log_prefix
+        )
+        if quick_instead_of_debate:
+            # Too late for the tier's debate: a flagged quick answer beats none
+            logger.warning("%sdebate.skipped reason=deadline (quick check instead)", log_prefix)
+            return _degraded_result("deadline_before_debate", quick_result), deadline_skip, deadline_skip, True, QUICK_CHECK_PATH
+
+        settles, reason = _quick_check_settles(quick_result, weights)
+        if debate_mode == "never" and not settles:
+            # Fast tier: no escalation - return the quick answer flagged for review
+            logger.info("%squick_check.unsettled reason=%s (fast tier, no escalation)", log_prefix, reason)
+            skipped = "N/A - Fast tier (quick check only)"
+            result = quick_result or {
+                "verdict": "Inconclusive",
+                "confidence_score": 0.0,
+                "summary": "Quick check unavailable."
+            }
+            return result, skipped, skipped, True, QUICK_CHECK_PATH
+        if settles:
+            logger.info(
+                "%squick_check.settled verdict=%s confidence=%.2f agreement=%.2f",
+                log_prefix,
+                quick_result["verdict"],
+                quick_result["confidence_score"],
+                quick_result["source_agreement"],
+            )
+            skipped = "N/A - Settled by quick check (sources agree)"
+            return quick_result, skipped, skipped, False, QUICK_CHECK_PATH
+        logger.info("%squick_check.escalate reason=%s", log_prefix, reason)
+
+    if not deadline.has(debate_time):
+        logger.warning("%sdebate.skipped reason=deadline remaining=%.2f", log_prefix, deadline.remaining())
+        return _degraded_result("deadline_before_debate", quick_result), deadline_skip, deadline_skip, True, QUICK_CHECK_PATH
+
+    # Tier 2: Run Prover and Debunker in parallel, leaving time for the judge
+    logger.info("%sdebate.start remaining=%.2f", log_prefix, deadline.remaining())
+    arguments, missing = await _run_debate(
+        {
+            PROVER: run_prover_agent(claim, text_blobs, is_prediction, model=models["prover"], deadline=deadline),
+            DEBUNKER: run_debunker_agent(claim, text_blobs, is_prediction, model=models["debunker"], deadline=deadline),
+        },
+        timeout=deadline.budget(DEBATE_TIMEOUT_SECONDS, reserve=DEADLINE_MIN_JUDGE_SECONDS),
+        log_prefix=log_prefix,
+    )
+    prover_argument, debunker_argument = arguments[PROVER], arguments[DEBUNKER]
+
+    if len(missing) == len(arguments):
+        # Nothing to judge: fall back on the quick check, else report the timeout
+        if quick_result is None:
+            raise asyncio.TimeoutError()
+        logger.warning("%sdebate.failed (falling back to quick check)", log_prefix)
+        skipped = "N/A - Debate timed out"
+        return _degraded_result("debate_timeout", quick_result), skipped, skipped, True, QUICK_CHECK_PATH
+
+    manual_review = bool(missing)
+
+    logger.info(
+        "%sdebate.done prover_len=%d debunker_len=%d missing=%s",
+        log_prefix,
+        len(prover_argument),
+        len(debunker_argument),
+        ",".join(missing) or "none",
+    )
+
+    # Judge reviews both arguments and raw sources, within what is left of the deadline
+    try:
+        result = await asyncio.wait_for(
+            run_judge_agent(
+                claim,
+                text_blobs,
+                weights,
+                prover_argument,
+                debunker_argument,
+                is_prediction,
+                model=models["judge"],
+                source_labels=source_labels,
+                missing_arguments=missing,
+                deadline=deadline,
+            ),
+            timeout=deadline.budget(reserve=DEADLINE_SAFETY_MARGIN_SECONDS),
+        )
+    except asyncio.TimeoutError:
+        logger.warning("%sjudge.timeout", log_prefix)
+        return _degraded_result("judge_timeout", quick_result), prover_argument, debunker_argument, True, FULL_DEBATE_PATH
+    if missing:
+        result["degraded_reason"] = "missing_argument:" + ",".join(missing)
+    return result, prover_argument, debunker_argument, manual_review, FULL_DEBATE_PATH
+
+
+def _dedupe(sources: list[str], text_blobs: list[str]) -> DedupeResult:
+    """Collapse syndicated copies before they reach the agents (no-op when disabled)."""
+    if not DEDUPE_ENABLED:
+        return DedupeResult(sources=sources, text_blobs=text_blobs, keep=list(range(len(sources))))
+    return dedupe_sources(sources, text_blobs)
+
+
+def _dedupe_tokens_saved(deduped: DedupeResult, tokens: dict, log_prefix: str = "") -> int:
+    """Prompt tokens saved across every agent call this request actually made."""
+    agent_calls = sum(1 for agent in ("quick_check", "prover", "debunker", "judge") if tokens.get(agent))
+    saved = deduped.tokens_saved * agent_calls
+    if saved:
+        logger.info("%sdedupe.tokens_saved=%d agent_calls=%d", log_prefix, saved, agent_calls)
+    return saved
+
+
+def _audit_trail(verification_path: str, result: dict, prover_argument: str, debunker_argument: str, summary: str) -> str:
+    """Human-readable trail of how the verdict was reached."""
+    if verification_path == QUICK_CHECK_PATH:
+        return f"Quick check ({result.get('source_agreement', 0):.0%} source agreement, no debate needed). Verdict: {summary}"
+    return f"Multi-agent debate: Prover ({prover_argument[:80]}...) vs Debunker ({debunker_argument[:80]}...). Judge: {summary}"
+
+
+def _deadline_exceeded_response(claim: str, tier: str, claim_type: str, start_time: float, deadline: Deadline) -> dict:
+    """Refunded error result for a verification that blew its tier deadline."""
+    execution_time = time.perf_counter() - start_time
+    try:
+        tokens = token_tracker.get_all()
+        PerformanceLogger.log_request(
+            claim=claim,
+            verdict="Error",
+            confidence_score=0.0,
+            prover_tokens=tokens['prover'],
+            debunker_tokens=tokens['debunker'],
+            judge_tokens=tokens['judge'],
+            execution_time=execution_time,
+            was_refunded=True,
+            quick_check_tokens=tokens['quick_check'],
+            tier=tier,
+            revenue_usdc=float(VERIFICATION_TIERS[tier]["price"])
+        )
+    except Exception as log_error:
+        logger.warning("performance_log.failed err=%s", log_error)
+    return {
+        "verdict": "Error",
+        "confidence_score": 0.0,
+        "reason": "Deadline exceeded",
+        "summary": f"Verification did not finish within the request deadline ({deadline.seconds:g}s).",
+        "audit_trail": "Tier deadline exceeded",
+        "claim_type": claim_type,
+        "tier": tier,
+        "manual_review": True,
+        "payment_status": "refunded_due_to_timeout"
+    }
+
+
+async def verify_claim_logic(claim: str, tier: str = DEFAULT_TIER, deadline: Optional[Deadline] = None) -> dict:
+    """
+    Verify a claim within the request deadline.
+    
+    Args:
+        claim: The claim to verify
+        tier: "fast", "standard" or "thorough" (see VERIFICATION_TIERS)
+        deadline: Request deadline from the endpoint (default: the tier's deadline_seconds)
+        
+    Returns:
+        Dictionary with verification result (see _verify_claim)
+    """
+    deadline = deadline or Deadline(VERIFICATION_TIERS[tier]["deadline_seconds"])
+    start_time = time.perf_counter()
+    token_tracker.reset()
+    try:
+        # Stages budget themselves against the deadline; this is only the backstop
+        return await asyncio.wait_for(_verify_claim(claim, tier, start_time, deadline), timeout=deadline.remaining())
+    except asyncio.TimeoutError:
+        logger.error("verify.deadline_exceeded tier=%s deadline=%.1f", tier, deadline.seconds)
+        return _deadline_exceeded_response(claim, tier, "unknown", start_time, deadline)
+
+
+async def _verify_claim(claim: str, tier: str, start_time: float, deadline: Deadline) -> dict:
     """
     Multi-agent fact verification system using three specialized agents:
     - Prover (DeepInfra Llama 3.3 70B): Finds supporting evidence
@@ -29,26 +362,31 @@ async def verify_claim_logic(claim: str) -> dict:
 
     Now handles both factual claims AND predictions (weather, events, trends)
     Implements HITL thresholding, circuit-breaker style fallbacks, and structured logging.
+
+    Tiered: a single-model quick check runs first and settles easy claims
+    (high confidence, sources agree); only unsettled claims escalate to the
+    full debate. The path taken is returned as `verification_path`.
     
     Args:
         claim: The claim to verify
+        tier: Latency tier name (model set, retrieval breadth, debate policy)
+        start_time: perf_counter() timestamp when the request started
+        deadline: Request deadline shared by search, agents and judge
         
     Returns:
         Dictionary with verification result including verdict, confidence_score, citations, and metadata
     """
     # Verification logic for VerifAI agent-x402 service
-    start_time = time.perf_counter()
-    logger.info("verify.start claim=%s", claim)
-
-    # Reset token tracking for this request
-    token_tracker.reset()
+    tier_config = VERIFICATION_TIERS[tier]
+    logger.info("verify.start claim=%s tier=%s", claim, tier)
     manual_review = False
 
     try:
-        # STEP 0: Philosophical Claim Pre-Filter
+        # STEP 0: Classify the claim in a single pass (normative / prediction / news)
         # Catches normative/value judgments before expensive multi-agent debate
-        is_philosophical, filter_reason = is_philosophical_claim(claim)
-        if is_philosophical:
+        classification = classify_claim(claim)
+        if classification.is_philosophical:
+            filter_reason = classification.filter_reason
             logger.info("verify.pre_filtered reason=%s", filter_reason)
             response = get_philosophical_response(claim, filter_reason)
             
@@ -64,7 +402,10 @@ async def verify_claim_logic(claim: str) -> dict:
                     judge_tokens={"input": 0, "output": 0, "model": "N/A"},
                     search_count=0,
                     execution_time=execution_time,
-                    was_refunded=True  # Always refund philosophical claims
+                    was_refunded=True,  # Always refund philosophical claims
+                    verification_path="pre_filtered",
+                    tier=tier,
+                    revenue_usdc=float(tier_config["price"])
                 )
             except Exception as log_error:
                 logger.warning("performance_log.failed err=%s", log_error)
@@ -72,14 +413,24 @@ async def verify_claim_logic(claim: str) -> dict:
             return response
         
         # Detect if this is a prediction or factual claim
-        is_prediction = any(keyword in claim.lower() for keyword in PREDICTION_KEYWORDS)
-        logger.info("claim.type=%s", "prediction" if is_prediction else "factual")
+        is_prediction = classification.is_prediction
+        logger.info(
+            "claim.type=%s labels=%s",
+            "prediction" if is_prediction else "factual",
+            ",".join(sorted(classification.labels)) or "none",
+        )
 
         # 1. Gather sources (fail safe if Exa is down)
         try:
             sources, text_blobs = await search_and_retrieve_sources(
                 claim,
-                timeout_seconds=EXA_SEARCH_TIMEOUT_SECONDS
+                # Leave at least enough of the deadline for a quick check
+                timeout_seconds=deadline.budget(
+                    EXA_SEARCH_TIMEOUT_SECONDS,
+                    reserve=DEADLINE_MIN_QUICK_CHECK_SECONDS + DEADLINE_SAFETY_MARGIN_SECONDS
+                ),
+                num_results=tier_config["num_results"],
+                max_text_length=tier_config["max_source_text_length"]
             )
         except Exception as exa_error:
             logger.error("sources.fetch.failed err=%s", exa_error)
@@ -90,20 +441,23 @@ async def verify_claim_logic(claim: str) -> dict:
                 "summary": "Unable to verify claim because sources could not be retrieved.",
                 "audit_trail": f"Source fetch error: {exa_error}",
                 "claim_type": "prediction" if is_prediction else "factual",
-                "manual_review": True
+                "manual_review": True,
+                "payment_status": "refunded_due_to_system_error"
             }
 
+        # Collapse syndicated copies so each is only paid for once per prompt
+        deduped = _dedupe(sources, text_blobs)
+        sources, text_blobs = deduped.sources, deduped.text_blobs
         weights = calculate_source_weights(sources)
+        source_labels = [domain_credibility.label(url) for url in sources]
 
-        # 2. Run Prover and Debunker in parallel with timeouts
-        logger.info("debate.start")
-        prover_task = run_prover_agent(claim, text_blobs, is_prediction)
-        debunker_task = run_debunker_agent(claim, text_blobs, is_prediction)
-
+        # 2-3. Quick check, escalating to the Prover/Debunker debate + Judge when unsettled
         try:
-            prover_argument, debunker_argument = await asyncio.wait_for(
-                asyncio.gather(prover_task, debunker_task, return_exceptions=True),
-                timeout=DEBATE_TIMEOUT_SECONDS,
+            result, prover_argument, debunker_argument, manual_review, verification_path = (
+                await _run_tiered_verification(
+                    claim, text_blobs, weights, is_prediction, tier_config,
+                    source_labels=source_labels, deadline=deadline
+                )
             )
         except asyncio.TimeoutError:
             logger.error("debate.timeout")
@@ -114,35 +468,10 @@ async def verify_claim_logic(claim: str) -> dict:
                 "summary": "Unable to verify claim because model calls timed out.",
                 "audit_trail": "Debate timeout",
                 "claim_type": "prediction" if is_prediction else "factual",
-                "manual_review": True
+                "manual_review": True,
+                "payment_status": "refunded_due_to_timeout"
             }
 
-        manual_review = False
-        if isinstance(prover_argument, Exception):
-            logger.warning("prover.failed err=%s", prover_argument)
-            prover_argument = "Unable to generate prover argument."
-            manual_review = True
-        if isinstance(debunker_argument, Exception):
-            logger.warning("debunker.failed err=%s", debunker_argument)
-            debunker_argument = "Unable to generate debunker argument."
-            manual_review = True
-
-        logger.info(
-            "debate.done prover_len=%d debunker_len=%d",
-            len(prover_argument),
-            len(debunker_argument),
-        )
-
-        # 3. Judge reviews both arguments and raw sources
-        result = await run_judge_agent(
-            claim,
-            text_blobs,
-            weights,
-            prover_argument,
-            debunker_argument,
-            is_prediction,
-        )
-
         verdict = result.get("verdict", "Error")
         confidence = result.get("confidence_score", 0.0)
         summary = result.get("summary", "Analysis complete")
@@ -165,11 +494,12 @@ async def verify_claim_logic(claim: str) -> dict:
 
         duration_ms = (time.perf_counter() - start_time) * 1000
         logger.info(
-            "verify.done verdict=%s confidence=%.2f ms=%.1f manual_review=%s",
+            "verify.done verdict=%s confidence=%.2f ms=%.1f manual_review=%s path=%s",
             verdict,
             confidence,
             duration_ms,
             manual_review,
+            verification_path,
         )
 
         # Log performance metrics
@@ -185,7 +515,12 @@ async def verify_claim_logic(claim: str) -> dict:
                 judge_tokens=tokens['judge'],
                 search_count=len(sources),
                 execution_time=execution_time,
-                was_refunded=should_refund  # Track refund decisions
+                was_refunded=should_refund,  # Track refund decisions
+                quick_check_tokens=tokens['quick_check'],
+                verification_path=verification_path,
+                tier=tier,
+                revenue_usdc=float(tier_config["price"]),
+                dedupe_tokens_saved=_dedupe_tokens_saved(deduped, tokens)
             )
         except Exception as log_error:
             logger.warning("performance_log.failed err=%s", log_error)
@@ -197,13 +532,17 @@ async def verify_claim_logic(claim: str) -> dict:
             "evidence_for": result.get("evidence_for", []),
             "evidence_against": result.get("evidence_against", []),
             "citations": sources,
+            "merged_citations": deduped.duplicates,  # kept URL -> syndicated copies merged into it
             "claim_type": "prediction" if is_prediction else "factual",
-            "audit_trail": f"Multi-agent debate: Prover ({prover_argument[:80]}...) vs Debunker ({debunker_argument[:80]}...). Judge: {summary}",
+            "audit_trail": _audit_trail(verification_path, result, prover_argument, debunker_argument, summary),
             "summary": summary,
             "debate": {
                 "prover": prover_argument,
                 "debunker": debunker_argument
             },
+            "verification_path": verification_path,
+            "degraded_reason": result.get("degraded_reason"),  # set when the deadline cut a stage short
+            "tier": tier,
             "manual_review": manual_review,
             "payment_status": "refunded_due_to_uncertainty" if should_refund else "settled"
         }
@@ -222,7 +561,29 @@ async def verify_claim_logic(claim: str) -> dict:
         }
 
 
-async def verify_news_claim_logic(claim: str) -> dict:
+async def verify_news_claim_logic(claim: str, tier: str = DEFAULT_TIER, deadline: Optional[Deadline] = None) -> dict:
+    """
+    Verify a news claim within the request deadline.
+    
+    Args:
+        claim: The news claim to verify
+        tier: "fast", "standard" or "thorough" (see VERIFICATION_TIERS)
+        deadline: Request deadline from the endpoint (default: the tier's deadline_seconds)
+        
+    Returns:
+        Dictionary with verification result (see _verify_news_claim)
+    """
+    deadline = deadline or Deadline(VERIFICATION_TIERS[tier]["deadline_seconds"])
+    start_time = time.perf_counter()
+    token_tracker.reset()
+    try:
+        return await asyncio.wait_for(_verify_news_claim(claim, tier, start_time, deadline), timeout=deadline.remaining())
+    except asyncio.TimeoutError:
+        logger.error("verify.news.deadline_exceeded tier=%s deadline=%.1f", tier, deadline.seconds)
+        return _deadline_exceeded_response(claim, tier, "news", start_time, deadline)
+
+
+async def _verify_news_claim(claim: str, tier: str, start_time: float, deadline: Deadline) -> dict:
     """
     Specialized news verification using real-time sources with recency weighting.
     
@@ -233,22 +594,23 @@ async def verify_news_claim_logic(claim: str) -> dict:
     
     Args:
         claim: The news claim to verify
+        tier: Latency tier name (model set, retrieval breadth, debate policy)
+        start_time: perf_counter() timestamp when the request started
+        deadline: Request deadline shared by search, agents and judge
         
     Returns:
         Dictionary with verification result plus source publication dates
     """
-    start_time = time.perf_counter()
-    logger.info("verify.news.start claim=%s", claim)
-
-    token_tracker.reset()
+    tier_config = VERIFICATION_TIERS[tier]
+    logger.info("verify.news.start claim=%s tier=%s", claim, tier)
     manual_review = False
 
     try:
         # Pre-filter philosophical claims
-        is_philosophical, filter_reason = is_philosophical_claim(claim)
-        if is_philosophical:
-            logger.info("verify.news.pre_filtered reason=%s", filter_reason)
-            return get_philosophical_response(claim, filter_reason)
+        classification = classify_claim(claim)
+        if classification.is_philosophical:
+            logger.info("verify.news.pre_filtered reason=%s", classification.filter_reason)
+            return get_philosophical_response(claim, classification.filter_reason)
         
         # News claims are typically factual, not predictions
         is_prediction = False
@@ -258,7 +620,13 @@ async def verify_news_claim_logic(claim: str) -> dict:
         try:
             sources, text_blobs, published_dates = await search_news_sources(
                 claim,
-                timeout_seconds=EXA_SEARCH_TIMEOUT_SECONDS
+                # Leave at least enough of the deadline for a quick check
+                timeout_seconds=deadline.budget(
+                    EXA_SEARCH_TIMEOUT_SECONDS,
+                    reserve=DEADLINE_MIN_QUICK_CHECK_SECONDS + DEADLINE_SAFETY_MARGIN_SECONDS
+                ),
+                num_results=tier_config["num_results"],
+                max_text_length=tier_config["max_source_text_length"]
             )
         except Exception as news_error:
             logger.error("news.sources.fetch.failed err=%s", news_error)
@@ -269,21 +637,26 @@ async def verify_news_claim_logic(claim: str) -> dict:
                 "summary": "Unable to verify news claim because sources could not be retrieved.",
                 "audit_trail": f"News fetch error: {news_error}",
                 "claim_type": "news",
-                "manual_review": True
+                "manual_review": True,
+                "payment_status": "refunded_due_to_system_error"
             }
 
+        # Collapse syndicated copies (common for breaking news) before weighting
+        deduped = _dedupe(sources, text_blobs)
+        sources, text_blobs = deduped.sources, deduped.text_blobs
+        published_dates = deduped.select(published_dates)
+
         # Calculate weights with recency boost
         weights = calculate_source_weights(sources, published_dates)
+        source_labels = [domain_credibility.label(url) for url in sources]
 
-        # 2. Run multi-agent debate
-        logger.info("news.debate.start")
-        prover_task = run_prover_agent(claim, text_blobs, is_prediction)
-        debunker_task = run_debunker_agent(claim, text_blobs, is_prediction)
-
+        # 2-3. Quick check, escalating to the multi-agent debate + Judge when unsettled
         try:
-            prover_argument, debunker_argument = await asyncio.wait_for(
-                asyncio.gather(prover_task, debunker_task, return_exceptions=True),
-                timeout=DEBATE_TIMEOUT_SECONDS,
+            result, prover_argument, debunker_argument, manual_review, verification_path = (
+                await _run_tiered_verification(
+                    claim, text_blobs, weights, is_prediction, tier_config,
+                    log_prefix="news.", source_labels=source_labels, deadline=deadline
+                )
             )
         except asyncio.TimeoutError:
             logger.error("news.debate.timeout")
@@ -292,35 +665,10 @@ async def verify_news_claim_logic(claim: str) -> dict:
                 "confidence_score": 0.0,
                 "summary": "News verification timed out",
                 "claim_type": "news",
-                "manual_review": True
+                "manual_review": True,
+                "payment_status": "refunded_due_to_timeout"
             }
 
-        if isinstance(prover_argument, Exception):
-            logger.warning("news.prover.failed err=%s", prover_argument)
-            prover_argument = "Unable to generate supporting argument."
-            manual_review = True
-
-        if isinstance(debunker_argument, Exception):
-            logger.warning("news.debunker.failed err=%s", debunker_argument)
-            debunker_argument = "Unable to generate contradicting argument."
-            manual_review = True
-
-        logger.info(
-            "news.debate.done prover_len=%d debunker_len=%d",
-            len(prover_argument),
-            len(debunker_argument),
-        )
-
-        # 3. Judge evaluation
-        result = await run_judge_agent(
-            claim,
-            text_blobs,
-            weights,
-            prover_argument,
-            debunker_argument,
-            is_prediction,
-        )
-
         verdict = result.get("verdict", "Error")
         confidence = result.get("confidence_score", 0.0)
         summary = result.get("summary", "News analysis complete")
@@ -336,11 +684,12 @@ async def verify_news_claim_logic(claim: str) -> dict:
 
         duration_ms = (time.perf_counter() - start_time) * 1000
         logger.info(
-            "verify.news.done verdict=%s confidence=%.2f ms=%.1f manual_review=%s",
+            "verify.news.done verdict=%s confidence=%.2f ms=%.1f manual_review=%s path=%s",
             verdict,
             confidence,
             duration_ms,
             manual_review,
+            verification_path,
         )
 
         # Log performance
@@ -356,7 +705,12 @@ async def verify_news_claim_logic(claim: str) -> dict:
                 judge_tokens=tokens['judge'],
                 search_count=len(sources),
                 execution_time=execution_time,
-                was_refunded=should_refund
+                was_refunded=should_refund,
+                quick_check_tokens=tokens['quick_check'],
+                verification_path=verification_path,
+                tier=tier,
+                revenue_usdc=float(tier_config["price"]),
+                dedupe_tokens_saved=_dedupe_tokens_saved(deduped, tokens, log_prefix="news.")
             )
         except Exception as log_error:
             logger.warning("performance_log.failed err=%s", log_error)
@@ -365,8 +719,8 @@ async def verify_news_claim_logic(claim: str) -> dict:
         sources_with_dates = [
             {
                 "url": sources[i],
-                "published": published_dates[i].isoformat() if i < len(published_dates) else None,
-                "age_hours": int((datetime.utcnow() - published_dates[i]).total_seconds() / 3600) if i < len(published_dates) else None,
+                "published": published_dates[i].isoformat() if i < len(published_dates) and published_dates[i] else None,
+                "age_hours": int((datetime.utcnow() - published_dates[i]).total_seconds() / 3600) if i < len(published_dates) and published_dates[i] else None,
                 "weight": weights[i] if i < len(weights) else 1.0
             }
             for i in range(len(sources))
@@ -379,6 +733,7 @@ async def verify_news_claim_logic(claim: str) -> dict:
             "evidence_for": result.get("evidence_for", []),
             "evidence_against": result.get("evidence_against", []),
             "sources": sources_with_dates,  # Enhanced with timestamps
+            "merged_citations": deduped.duplicates,
             "claim_type": "news",
             "newest_source_age_hours": min((s["age_hours"] for s in sources_with_dates if s["age_hours"] is not None), default=None),
             "audit_trail": f"News verification: {len(sources)} sources (newest: {min((s['age_hours'] for s in sources_with_dates if s['age_hours'] is not None), default='N/A')}h old)",
@@ -387,6 +742,9 @@ async def verify_news_claim_logic(claim: str) -> dict:
                 "prover": prover_argument,
                 "debunker": debunker_argument
             },
+            "verification_path": verification_path,
+            "degraded_reason": result.get("degraded_reason"),  # set when the deadline cut a stage short
+            "tier": tier,
             "manual_review": manual_review,
             "payment_status": "refunded_due_to_uncertainty" if should_refund else "settled"
         }
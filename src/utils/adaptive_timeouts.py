@@ -0,0 +1,164 @@
+"""
+Adaptive per-provider timeouts.
+
+Every provider call records its latency under (provider, model). The timeout
+for the next call is ADAPTIVE_TIMEOUT_P99_MULTIPLIER x the p99 of the recent
+window, clamped to the provider's [floor, ceiling] from ADAPTIVE_TIMEOUT_BOUNDS:
+a healthy provider that suddenly hangs is cut off after a few seconds instead
+of the full static timeout, and a provider that is slow across the board gets
+more room (up to the ceiling) instead of timing out spuriously.
+
+Calls that time out are recorded at the time they took, so a run of timeouts
+raises p99 and therefore the next timeout. Until a key has
+ADAPTIVE_TIMEOUT_MIN_SAMPLES observations its timeout is the ceiling (the
+previous static value).
+"""
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
+
+from config.settings import (
+    ADAPTIVE_TIMEOUTS_ENABLED, ADAPTIVE_TIMEOUT_BOUNDS, ADAPTIVE_TIMEOUT_P99_MULTIPLIER,
+    ADAPTIVE_TIMEOUT_WINDOW, ADAPTIVE_TIMEOUT_MIN_SAMPLES
+)
+
+
+def is_timeout(error: BaseException) -> bool:
+    """asyncio/httpx/SDK timeout errors, matched by type name so no SDK import is needed."""
+    return isinstance(error, (asyncio.TimeoutError, TimeoutError)) or "Timeout" in type(error).__name__
+
+
+class LatencyWindow:
+    """The last `size` latencies of one (provider, model), with nearest-rank percentiles."""
+
+    def __init__(self, size: int = ADAPTIVE_TIMEOUT_WINDOW):
+        self._samples: deque = deque(maxlen=size)
+        self._sorted: Optional[list] = None  # cached until the next sample
+        self.total = 0
+        self.timeouts = 0
+
+    def record(self, seconds: float, timed_out: bool = False):
+        self._samples.append(seconds)
+        self._sorted = None
+        self.total += 1
+        self.timeouts += timed_out
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, q: float) -> float:
+        """q-th percentile (0-100) of the window; 0.0 when empty."""
+        if not self._samples:
+            return 0.0
+        if self._sorted is None:
+            self._sorted = sorted(self._samples)
+        rank = max(1, math.ceil(q / 100 * len(self._sorted)))
+        return self._sorted[rank - 1]
+
+
+class AdaptiveTimeouts:
+    """Latency windows and derived timeouts for every provider/model seen."""
+
+    def __init__(
+        self,
+        bounds: Dict[str, Tuple[float, float]] = ADAPTIVE_TIMEOUT_BOUNDS,
+        multiplier: float = ADAPTIVE_TIMEOUT_P99_MULTIPLIER,
+        window: int = ADAPTIVE_TIMEOUT_WINDOW,
+        min_samples: int = ADAPTIVE_TIMEOUT_MIN_SAMPLES,
+        enabled: bool = ADAPTIVE_TIMEOUTS_ENABLED
+    ):
+        self.bounds = bounds
+        self.multiplier = multiplier
+        self.window = window
+        self.min_samples = min_samples
+        self.enabled = enabled
+        self._windows: Dict[Tuple[str, str], LatencyWindow] = {}
+        self._lock = threading.RLock()  # callers are all on the event loop; kept so stats() is safe from any thread
+
+    def _bounds(self, provider: str) -> Tuple[float, float]:
+        return self.bounds.get(provider, self.bounds["default"])
+
+    def record(self, provider: str, model: str, seconds: float, timed_out: bool = False):
+        """Add one call's latency (for a timed-out call, the time it was given)."""
+        with self._lock:
+            window = self._windows.get((provider, model))
+            if window is None:
+                window = self._windows[(provider, model)] = LatencyWindow(self.window)
+            window.record(seconds, timed_out)
+
+    def timeout(self, provider: str, model: str = "", cap: Optional[float] = None) -> float:
+        """
+        Timeout for the next call to `provider`/`model`.
+
+        Args:
+            cap: Hard upper limit from the caller (e.g. the request deadline's budget)
+
+        Returns:
+            clamp(multiplier x p99, floor, ceiling), or the ceiling while the
+            window is too small or adaptation is disabled; never above `cap`
+        """
+        floor, ceiling = self._bounds(provider)
+        timeout = ceiling
+        if self.enabled:
+            with self._lock:
+                window = self._windows.get((provider, model))
+                if window is not None and len(window) >= self.min_samples:
+                    timeout = min(ceiling, max(floor, self.multiplier * window.percentile(99)))
+        return min(timeout, cap) if cap is not None else timeout
+
+    def latency(self, provider: str, model: str, q: float) -> Optional[float]:
+        """The q-th percentile latency of `provider`/`model` (None until min_samples are in)."""
+        with self._lock:
+            window = self._windows.get((provider, model))
+            if window is None or len(window) < self.min_samples:
+                return None
+            return window.percentile(q)
+
+    @contextmanager
+    def track(self, provider: str, model: str = "", cap: Optional[float] = None):
+        """
+        Time the enclosed call and yield the timeout to give it (see `timeout`).
+
+        Successes are recorded. A timeout is recorded, at the timeout the call
+        was given, only when the adaptive timeout was the limit: one cut short
+        by `cap` (e.g. the request deadline) says nothing about the provider.
+        Other errors and cancellation (deadline, straggler cleanup) are not
+        recorded.
+        """
+        timeout = self.timeout(provider, model, cap=cap)
+        started = time.perf_counter()
+        try:
+            yield timeout
+        except BaseException as e:
+            if is_timeout(e) and timeout >= self.timeout(provider, model):
+                self.record(provider, model, timeout, timed_out=True)
+            raise
+        self.record(provider, model, time.perf_counter() - started)
+
+    def stats(self) -> dict:
+        """Current timeout and latency percentiles per provider/model (for debugging)."""
+        stats = {}
+        with self._lock:
+            for (provider, model), window in sorted(self._windows.items()):
+                floor, ceiling = self._bounds(provider)
+                stats[f"{provider}/{model}" if model else provider] = {
+                    "timeout_seconds": round(self.timeout(provider, model), 3),
+                    "floor_seconds": floor,
+                    "ceiling_seconds": ceiling,
+                    "samples": len(window),
+                    "calls": window.total,
+                    "timeouts": window.timeouts,
+                    "p50_seconds": round(window.percentile(50), 3),
+                    "p95_seconds": round(window.percentile(95), 3),
+                    "p99_seconds": round(window.percentile(99), 3),
+                }
+        return {"enabled": self.enabled, "multiplier": self.multiplier, "providers": stats}
+
+
+# Global controller shared by all agents and search
+adaptive_timeouts = AdaptiveTimeouts()
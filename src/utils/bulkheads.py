@@ -0,0 +1,147 @@
+"""
+Provider-slot bulkheads for interactive and bulk traffic.
+
+Single verifications (/verify, /verify/news) are interactive; /verify/batch
+is bulk. Admission control tags each request with its class in the
+`traffic_class` context variable, which follows the request into every task
+it spawns. Every provider call then takes one of that provider's slots:
+
+    async with provider_bulkheads.slot("deepinfra"):
+        ...
+
+Each provider has `capacity` slots, `reserved` of which only interactive
+calls may use, so a 100-claim batch can occupy at most capacity - reserved
+slots and single verifications always find room. Waiting calls are granted
+freed slots in weighted fair order across tenants (src/utils/fair_queue.py),
+within what their class may use.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Dict, Tuple
+
+from config.settings import BULKHEAD_PROVIDER_SLOTS
+from src.utils.fair_queue import DeficitRoundRobin, tenant, tenant_waits
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+TRAFFIC_CLASSES = (INTERACTIVE, BULK)
+
+# Set per request by admission control; calls outside a request count as interactive
+traffic_class: ContextVar[str] = ContextVar("traffic_class", default=INTERACTIVE)
+
+
+class ProviderSlots:
+    """Slots of one provider, with a share reserved for interactive calls."""
+
+    def __init__(self, capacity: int, reserved: int):
+        self.capacity = capacity
+        self.reserved = min(reserved, capacity - 1)  # bulk always keeps at least one slot
+        self.in_use = {cls: 0 for cls in TRAFFIC_CLASSES}
+        self._waiters = DeficitRoundRobin()  # (class, future) per tenant
+        self.acquired = {cls: 0 for cls in TRAFFIC_CLASSES}
+        self.total_wait = {cls: 0.0 for cls in TRAFFIC_CLASSES}
+        self.max_wait = {cls: 0.0 for cls in TRAFFIC_CLASSES}
+
+    def _fits(self, cls: str) -> bool:
+        if sum(self.in_use.values()) >= self.capacity:
+            return False
+        return cls == INTERACTIVE or self.in_use[BULK] < self.capacity - self.reserved
+
+    async def acquire(self, cls: str, tenant_key: str = "internal") -> float:
+        """Take a slot for `cls`, waiting in `tenant_key`'s fair-queue if none is free; returns seconds waited."""
+        # Cancelled waiters still queued do not count as a line to stand in
+        if self._fits(cls) and not any(c == cls and not w.done() for c, w in self._waiters):
+            self.in_use[cls] += 1
+            self.acquired[cls] += 1
+            tenant_waits.record(tenant_key, 0.0)
+            return 0.0
+        started = time.perf_counter()
+        entry = (cls, asyncio.get_running_loop().create_future())
+        waiter = entry[1]
+        self._waiters.push(tenant_key, entry)
+        try:
+            await waiter
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                self.release(cls)  # granted just as we were cancelled: pass it on
+            else:
+                self._waiters.remove(tenant_key, entry)
+            raise
+        wait = time.perf_counter() - started
+        self.total_wait[cls] += wait
+        self.max_wait[cls] = max(self.max_wait[cls], wait)
+        self.acquired[cls] += 1
+        tenant_waits.record(tenant_key, wait)
+        return wait
+
+    def release(self, cls: str):
+        """Free a slot and grant free slots to waiters, fairly across tenants."""
+        self.in_use[cls] -= 1
+        while True:
+            # Cancelled waiters not yet removed are popped and dropped
+            entry = self._waiters.pop(lambda e: e[1].done() or self._fits(e[0]))
+            if entry is None:
+                return
+            waiting_cls, waiter = entry
+            if not waiter.done():
+                self.in_use[waiting_cls] += 1
+                waiter.set_result(None)
+
+    def stats(self) -> dict:
+        in_use = sum(self.in_use.values())
+        return {
+            "capacity": self.capacity,
+            "reserved_interactive": self.reserved,
+            "in_use": in_use,
+            "utilization": round(in_use / self.capacity, 3),
+            "classes": {
+                cls: {
+                    "in_use": self.in_use[cls],
+                    "waiting": sum(1 for c, w in self._waiters if c == cls and not w.done()),
+                    "acquired": self.acquired[cls],
+                    "avg_wait_ms": round(self.total_wait[cls] / self.acquired[cls] * 1000, 2) if self.acquired[cls] else 0.0,
+                    "max_wait_ms": round(self.max_wait[cls] * 1000, 2),
+                }
+                for cls in TRAFFIC_CLASSES
+            },
+        }
+
+
+class ProviderBulkheads:
+    """ProviderSlots per provider, created on first use from BULKHEAD_PROVIDER_SLOTS."""
+
+    def __init__(self, sizes: Dict[str, Tuple[int, int]] = BULKHEAD_PROVIDER_SLOTS):
+        self.sizes = sizes
+        self._providers: Dict[str, ProviderSlots] = {}
+
+    def get(self, provider: str) -> ProviderSlots:
+        slots = self._providers.get(provider)
+        if slots is None:
+            capacity, reserved = self.sizes.get(provider, self.sizes["default"])
+            slots = self._providers[provider] = ProviderSlots(capacity, reserved)
+        return slots
+
+    @asynccontextmanager
+    async def slot(self, provider: str):
+        """Hold one of `provider`'s slots for the current request's traffic class."""
+        cls = traffic_class.get()
+        slots = self.get(provider)
+        await slots.acquire(cls, tenant.get())
+        try:
+            yield
+        finally:
+            slots.release(cls)
+
+    def stats(self) -> dict:
+        """Slot utilization and wait per provider and traffic class, and wait per tenant."""
+        return {
+            "providers": {provider: slots.stats() for provider, slots in sorted(self._providers.items())},
+            "tenants": tenant_waits.stats(),
+        }
+
+
+# Global bulkheads shared by all agents and search
+provider_bulkheads = ProviderBulkheads()
@@ -0,0 +1,139 @@
+"""
+Single-pass claim classifier.
+
+Labels a claim as normative (philosophical), prediction and/or news in one
+pass over the text, returning every matched span:
+
+- Normative patterns are joined into ONE precompiled alternation, instead of
+  re.search-ing each pattern (and recompiling with IGNORECASE) per call.
+- Prediction and news cues are matched on word tokens through a phrase trie,
+  so the claim is tokenized once and "will" can no longer match "goodwill".
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from config.settings import PREDICTION_KEYWORDS, NEWS_KEYWORDS
+
+NORMATIVE = "normative"
+PREDICTION = "prediction"
+NEWS = "news"
+
+# Normative language patterns that indicate philosophical/subjective claims
+NORMATIVE_PATTERNS = [
+    # Explicit value judgments
+    r'\binherently\s+(evil|good|bad|wrong|right)\b',
+    r'\bmorally\s+(wrong|right|corrupt|good|bad)\b',
+    r'\b(all|every)\s+\w+\s+(are|is)\s+(corrupt|evil|good|bad)\b',
+
+    # Absolute moral claims
+    r'\b(failed|corrupt)\s+system\b',
+    r'\bexploiting\s+(workers|people)\b',
+    r'\bcause[sd]?\s+more\s+harm\s+than\s+good\b',
+
+    # Universal negative/positive claims (often philosophical)
+    r'\b(all|every)\s+(politicians?|billionaires?|corporations?)\s+(are|is)\s+corrupt\b',
+    r'\ball\s+\w+\s+(media|news)\s+(is|are)\s+propaganda\b',
+
+    # Normative modals
+    r'\bshould(n\'t)?\s+\w+\b.*\?',  # Questions with "should"
+    r'\bdeserve[sd]?\b',
+
+    # Subjective aesthetic/quality judgments
+    r'\bbest\b.*\?',
+    r'\bbelong\s+on\b',  # "Does X belong on Y?"
+    r'\bis\s+\w+\s+(beautiful|ugly|perfect|flawed)\b',
+]
+
+_NORMATIVE_RE = re.compile("|".join(f"(?:{p})" for p in NORMATIVE_PATTERNS))
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+_END = "$label"
+
+
+def _build_phrase_trie(phrases_by_label: Dict[str, List[str]]) -> dict:
+    """Compile keyword phrases into a token trie: {token: {token: ..., _END: label}}."""
+    trie: dict = {}
+    for label, phrases in phrases_by_label.items():
+        for phrase in phrases:
+            node = trie
+            for token in _TOKEN_RE.findall(phrase.lower()):
+                node = node.setdefault(token, {})
+            node[_END] = label
+    return trie
+
+
+_PHRASE_TRIE = _build_phrase_trie({
+    PREDICTION: PREDICTION_KEYWORDS,
+    NEWS: NEWS_KEYWORDS,
+})
+
+
+@dataclass
+class LabelSpan:
+    """One matched cue: its label and character offsets into the claim."""
+    label: str
+    start: int
+    end: int
+    text: str
+
+
+@dataclass
+class ClaimClassification:
+    """All labels found in a claim plus the spans that triggered them."""
+    labels: set = field(default_factory=set)
+    spans: List[LabelSpan] = field(default_factory=list)
+
+    @property
+    def is_philosophical(self) -> bool:
+        return NORMATIVE in self.labels
+
+    @property
+    def is_prediction(self) -> bool:
+        return PREDICTION in self.labels
+
+    @property
+    def is_news(self) -> bool:
+        return NEWS in self.labels
+
+    @property
+    def filter_reason(self) -> str:
+        """Pre-filter reason string for the first normative match ('' if none)."""
+        for span in self.spans:
+            if span.label == NORMATIVE:
+                return f"Normative pattern detected: '{span.text}'"
+        return ""
+
+
+def classify_claim(claim: str) -> ClaimClassification:
+    """
+    Classify a claim as normative / prediction / news.
+
+    Returns:
+        ClaimClassification with every label present and the matched spans,
+        ordered by position in the claim.
+    """
+    # Normalize curly apostrophes 1:1 so offsets still index into the claim
+    text = claim.lower().replace("’", "'")
+    if len(text) != len(claim):
+        # Rare Unicode case-folding changed the length; report spans from the lowered text
+        claim = text
+    result = ClaimClassification()
+
+    for match in _NORMATIVE_RE.finditer(text):
+        result.spans.append(LabelSpan(NORMATIVE, match.start(), match.end(), claim[match.start():match.end()]))
+
+    tokens = [(m.group(), m.start(), m.end()) for m in _TOKEN_RE.finditer(text)]
+    for i in range(len(tokens)):
+        node = _PHRASE_TRIE
+        for j in range(i, len(tokens)):
+            node = node.get(tokens[j][0])
+            if node is None:
+                break
+            if _END in node:
+                start, end = tokens[i][1], tokens[j][2]
+                result.spans.append(LabelSpan(node[_END], start, end, claim[start:end]))
+
+    result.spans.sort(key=lambda span: span.start)
+    result.labels = {span.label for span in result.spans}
+    return result
@@ -0,0 +1,153 @@
+"""
+Connection warm-up and keep-warm for provider hosts.
+
+Right after startup the warmer builds the provider SDK clients (see
+provider_clients) and sends each configured provider a cheap probe, so DNS,
+TCP and TLS are paid before the first paid request instead of during it.
+Pooled hosts (DeepInfra, OpenAI, Exa, NewsAPI) get connection-only HEAD
+probes - any HTTP response, even a 401/404, means the connection is open.
+Anthropic and Gemini keep their own pools inside their SDKs and are probed
+with a free model-list call.
+
+Probes repeat every WARMUP_INTERVAL_SECONDS, shorter than the pools'
+keep-alive expiry, so connections survive idle periods. `/ready` reports
+ready only after the first warm-up pass.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Optional
+
+from config.settings import (
+    ANTHROPIC_API_KEY, ANTHROPIC_BASE_URL, DEEPINFRA_API_KEY, DEEPINFRA_BASE_URL, EXA_API_KEY, EXA_BASE_URL,
+    GEMINI_API_KEY, GEMINI_BASE_URL, NEWSAPI_KEY, NEWSAPI_URL, OPENAI_API_KEY, OPENAI_BASE_URL, CONNECTION_WARMUP_ENABLED,
+    WARMUP_INTERVAL_SECONDS, WARMUP_PROBE_TIMEOUT_SECONDS, WARMUP_CONNECTIONS_PER_HOST
+)
+from src.utils.http_clients import http_clients
+from src.utils.provider_clients import provider_clients
+
+logger = logging.getLogger(__name__)
+
+# Host each provider is reached on (also used by scripts/bench_warmup.py)
+PROVIDER_URLS = {
+    "deepinfra": DEEPINFRA_BASE_URL,
+    "openai": OPENAI_BASE_URL,
+    "exa": EXA_BASE_URL,
+    "newsapi": NEWSAPI_URL,
+    "anthropic": ANTHROPIC_BASE_URL,
+    "gemini": GEMINI_BASE_URL,
+}
+
+
+def _reached_server(error: BaseException) -> bool:
+    """An SDK error carrying an HTTP response (401, 404...) still means the connection is up."""
+    return getattr(error, "response", None) is not None or isinstance(getattr(error, "status_code", None), int)
+
+
+def _http_probe(client_name: str, url: str) -> Callable[[], Awaitable[None]]:
+    async def probe():
+        # Concurrent probes open several pooled connections (one suffices over HTTP/2)
+        client = http_clients.get(client_name)
+        await asyncio.gather(*(
+            client.head(url, timeout=WARMUP_PROBE_TIMEOUT_SECONDS) for _ in range(WARMUP_CONNECTIONS_PER_HOST)
+        ))
+    return probe
+
+
+def _sdk_probe(provider: str, list_models: Callable[[object], Awaitable[object]]) -> Callable[[], Awaitable[None]]:
+    async def probe():
+        client = await provider_clients.aget(provider)
+        try:
+            await asyncio.wait_for(list_models(client), timeout=WARMUP_PROBE_TIMEOUT_SECONDS)
+        except Exception as e:
+            if not _reached_server(e):
+                raise
+    return probe
+
+
+async def _exa_probe():
+    await provider_clients.aget("exa")  # configures the pooled client's base URL
+    await _http_probe("exa", PROVIDER_URLS["exa"])()
+
+
+def default_probes() -> Dict[str, Callable[[], Awaitable[None]]]:
+    """A probe for every provider that has an API key configured."""
+    probes = {
+        "deepinfra": (DEEPINFRA_API_KEY, _http_probe("deepinfra", PROVIDER_URLS["deepinfra"])),
+        "openai": (OPENAI_API_KEY, _http_probe("openai", PROVIDER_URLS["openai"])),
+        "exa": (EXA_API_KEY, _exa_probe),
+        "newsapi": (NEWSAPI_KEY, _http_probe("newsapi", PROVIDER_URLS["newsapi"])),
+        "anthropic": (ANTHROPIC_API_KEY, _sdk_probe("anthropic", lambda c: c.models.list(limit=1))),
+        "gemini": (GEMINI_API_KEY, _sdk_probe("gemini", lambda c: c.aio.models.list(config={"page_size": 1}))),
+    }
+    return {name: probe for name, (key, probe) in probes.items() if key}
+
+
+class ConnectionWarmer:
+    """Runs the probes at startup and on an interval; tracks readiness."""
+
+    def __init__(
+        self,
+        probes: Optional[Dict[str, Callable[[], Awaitable[None]]]] = None,
+        interval: float = WARMUP_INTERVAL_SECONDS,
+        enabled: bool = CONNECTION_WARMUP_ENABLED
+    ):
+        self._probes = probes
+        self.interval = interval
+        self.enabled = enabled
+        self.ready = not enabled  # nothing to wait for when warm-up is off
+        self.ready_after_seconds: Optional[float] = None
+        self.targets: Dict[str, dict] = {}
+
+    @property
+    def probes(self) -> Dict[str, Callable[[], Awaitable[None]]]:
+        if self._probes is None:
+            self._probes = default_probes()
+        return self._probes
+
+    async def _probe(self, name: str, probe: Callable[[], Awaitable[None]]):
+        state = self.targets.setdefault(name, {"probes": 0, "failures": 0, "warm": False})
+        started = time.perf_counter()
+        try:
+            await probe()
+            state.update(warm=True, last_ms=round((time.perf_counter() - started) * 1000, 1), last_error=None)
+        except Exception as e:
+            state.update(warm=False, last_error=str(e)[:200] or type(e).__name__)
+            state["failures"] += 1
+            logger.warning("warmup.probe_failed name=%s err=%s", name, state["last_error"])
+        state["probes"] += 1
+        state["last_probe_at"] = time.time()
+
+    async def warm_once(self):
+        """Probe every provider concurrently; failures are recorded, not raised."""
+        await asyncio.gather(*(self._probe(name, probe) for name, probe in self.probes.items()))
+
+    async def run(self):
+        """Startup warm-up, then keep-warm until cancelled (background lifespan task)."""
+        started = time.perf_counter()
+        await provider_clients.prewarm()
+        await self.warm_once()
+        self.ready = True
+        self.ready_after_seconds = round(time.perf_counter() - started, 3)
+        logger.info(
+            "warmup.ready ms=%.0f warm=%s",
+            self.ready_after_seconds * 1000, ",".join(n for n, s in self.targets.items() if s["warm"]) or "none"
+        )
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.warm_once()
+
+    def stats(self) -> dict:
+        """Readiness and per-provider probe state."""
+        return {
+            "enabled": self.enabled,
+            "ready": self.ready,
+            "ready_after_seconds": self.ready_after_seconds,
+            "interval_seconds": self.interval,
+            "targets": {name: dict(state) for name, state in sorted(self.targets.items())},
+        }
+
+
+# Global warmer started by the app lifespan
+connection_warmer = ConnectionWarmer()
@@ -0,0 +1,87 @@
+"""
+Per-request deadlines.
+
+A `Deadline` is created once at the endpoint (the tier's deadline, optionally
+shortened by the client's X-Request-Timeout header) and passed down through
+search, agents and judge. Each stage asks it for its share of the remaining
+budget instead of using its own fixed timeout, so the stages together can
+never overrun the request.
+"""
+
+import time
+from typing import Optional
+
+from config.settings import DEADLINE_MIN_CLIENT_SECONDS
+
+
+class Deadline:
+    """Absolute point in time by which a request must be answered."""
+
+    def __init__(self, seconds: float, clock=time.monotonic):
+        self._clock = clock
+        self.seconds = seconds
+        self.started_at = clock()
+        self.expires_at = self.started_at + seconds
+
+    @classmethod
+    def from_client(cls, value: Optional[str], max_seconds: float) -> "Deadline":
+        """
+        Deadline from a client-supplied timeout, capped at `max_seconds`.
+
+        Args:
+            value: Header value in seconds (None/empty = use `max_seconds`)
+            max_seconds: The tier's deadline; clients may only shorten it
+
+        Raises:
+            ValueError: If the value is not a number of at least DEADLINE_MIN_CLIENT_SECONDS
+        """
+        if not value:
+            return cls(max_seconds)
+        try:
+            seconds = float(value)
+        except ValueError:
+            raise ValueError(f"Request timeout must be a number of seconds, got {value!r}") from None
+        if not seconds >= DEADLINE_MIN_CLIENT_SECONDS:  # also rejects NaN
+            raise ValueError(f"Request timeout must be at least {DEADLINE_MIN_CLIENT_SECONDS:g} seconds")
+        return cls(min(seconds, max_seconds))
+
+    def remaining(self) -> float:
+        """Seconds left (0.0 once expired)."""
+        return max(0.0, self.expires_at - self._clock())
+
+    def elapsed(self) -> float:
+        return self._clock() - self.started_at
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+    def has(self, seconds: float) -> bool:
+        """Whether at least `seconds` remain (used to skip optional work)."""
+        return self.remaining() >= seconds
+
+    def budget(self, cap: Optional[float] = None, reserve: float = 0.0) -> float:
+        """
+        Timeout for the next stage.
+
+        Args:
+            cap: The stage's own timeout, if it has one
+            reserve: Seconds to keep back for the stages after this one
+
+        Returns:
+            min(cap, remaining - reserve), never negative
+        """
+        budget = max(0.0, self.remaining() - reserve)
+        return min(cap, budget) if cap is not None else budget
+
+    def __repr__(self) -> str:
+        return f"Deadline(seconds={self.seconds:g}, remaining={self.remaining():.2f})"
+
+
+def timeout_kwargs(deadline: Optional[Deadline], cap: Optional[float] = None) -> dict:
+    """
+    `timeout=` for an SDK call: the smaller of what is left of the deadline
+    and the call's own timeout `cap` ({} = SDK default when neither is set).
+    """
+    if deadline is None:
+        return {"timeout": cap} if cap is not None else {}
+    return {"timeout": deadline.budget(cap)}
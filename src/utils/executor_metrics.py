@@ -0,0 +1,99 @@
+"""
+Default thread-pool executor occupancy.
+
+Blocking SDK calls (the Anthropic judge, SQLite index I/O) run on asyncio's
+default executor. `to_thread` is a drop-in for asyncio.to_thread that counts
+calls submitted, running and queued so starvation of that pool is visible at
+/metrics/executor.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from typing import Any, Callable
+
+# ThreadPoolExecutor's default size, which asyncio's default executor uses
+DEFAULT_EXECUTOR_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+
+class ExecutorMetrics:
+    """Thread-safe counters for work sent to the default executor."""
+
+    def __init__(self, max_workers: int = DEFAULT_EXECUTOR_WORKERS):
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self.in_flight = 0  # submitted and not finished (running + queued)
+        self.running = 0
+        self.peak_in_flight = 0
+        self.completed = 0
+        self.total_queue_wait = 0.0
+
+    def submitted(self):
+        with self._lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def started(self, queue_wait: float):
+        with self._lock:
+            self.running += 1
+            self.total_queue_wait += queue_wait
+
+    def finished(self, ran: bool):
+        with self._lock:
+            self.in_flight -= 1
+            if ran:
+                self.running -= 1
+                self.completed += 1
+
+    def stats(self) -> dict:
+        """Current occupancy of the default executor."""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "in_flight": self.in_flight,
+                "running": self.running,
+                "queued": self.in_flight - self.running,
+                "occupancy": round(self.running / self.max_workers, 3),
+                "peak_in_flight": self.peak_in_flight,
+                "completed": self.completed,
+                "avg_queue_wait_ms": round(self.total_queue_wait / self.completed * 1000, 2) if self.completed else 0.0,
+            }
+
+
+executor_metrics = ExecutorMetrics()
+
+
+async def to_thread(func: Callable, /, *args, **kwargs) -> Any:
+    """
+    asyncio.to_thread with occupancy tracking.
+
+    A call counts as running from the moment a worker picks it up until the
+    function returns - even if the awaiting task was cancelled meanwhile, since
+    the thread is still occupied. A call cancelled while still queued is
+    dropped without running.
+    """
+    submitted_at = time.perf_counter()
+    state = {"status": "queued"}
+    state_lock = threading.Lock()
+
+    def run():
+        with state_lock:
+            if state["status"] == "cancelled":
+                return None
+            state["status"] = "running"
+        executor_metrics.started(time.perf_counter() - submitted_at)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            executor_metrics.finished(ran=True)
+
+    executor_metrics.submitted()
+    try:
+        return await asyncio.to_thread(run)
+    except asyncio.CancelledError:
+        with state_lock:
+            if state["status"] == "queued":
+                state["status"] = "cancelled"
+                executor_metrics.finished(ran=False)
+        raise
@@ -0,0 +1,135 @@
+"""
+Weighted fair queuing of provider calls across tenants.
+
+A tenant is a verified payer: the prepaid session, or the wallet of an
+X-PAYMENT that x402 has verified; otherwise the client IP. Admission control
+sets the IP in the `tenant` context variable and session auth and the
+payment wall re-key it, so every claim of a batch queues under its payer and
+an unverified header cannot borrow another payer's identity or weight.
+When a provider's slots are contended (src/utils/bulkheads.py), waiting calls
+are granted in deficit round-robin order across tenants instead of first
+come first served: a client with 100 claims queued gets the same share of
+freed slots as a client with one, scaled by FAIR_QUEUE_WEIGHTS for premium
+payers. Per-tenant slot wait is reported so this can be checked under load.
+"""
+
+from collections import OrderedDict, deque
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from config.settings import FAIR_QUEUE_WEIGHTS, FAIR_QUEUE_QUANTUM, FAIR_QUEUE_MAX_TRACKED_TENANTS
+from src.utils.adaptive_timeouts import LatencyWindow
+
+# Set per request by admission control, session auth and the payment wall;
+# calls outside a request share one tenant
+tenant: ContextVar[str] = ContextVar("tenant", default="internal")
+
+
+class DeficitRoundRobin:
+    """
+    Per-tenant FIFO queues served by deficit round-robin.
+
+    Each tenant offers its oldest eligible item. Each time the round reaches
+    a tenant whose offered item costs more than its deficit, the tenant is
+    credited quantum x weight and the round moves on; a tenant with enough
+    deficit is served. Ineligible items (e.g. bulk calls while bulk slots are
+    full) do not hold up the tenant's eligible ones queued behind them, and
+    a tenant with nothing eligible is skipped without credit.
+    """
+
+    def __init__(self, weights: Dict[str, float] = FAIR_QUEUE_WEIGHTS, quantum: float = FAIR_QUEUE_QUANTUM):
+        self.weights = weights
+        self.quantum = quantum
+        self._queues: Dict[str, deque] = {}
+        self._active: deque = deque()  # tenants with queued items, in round order
+        self._deficit: Dict[str, float] = {}
+
+    def weight(self, tenant_key: str) -> float:
+        return self.weights.get(tenant_key.lower(), 1.0)
+
+    def __len__(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def __iter__(self) -> Iterator[Any]:
+        for queue in self._queues.values():
+            for item, _ in queue:
+                yield item
+
+    def push(self, tenant_key: str, item: Any, cost: float = 1.0):
+        queue = self._queues.get(tenant_key)
+        if queue is None:
+            queue = self._queues[tenant_key] = deque()
+            self._active.append(tenant_key)
+            self._deficit[tenant_key] = 0.0
+        queue.append((item, cost))
+
+    def remove(self, tenant_key: str, item: Any) -> bool:
+        """Drop a queued item (e.g. its caller was cancelled); False if it is not queued."""
+        queue = self._queues.get(tenant_key)
+        if queue is None:
+            return False
+        for entry in queue:
+            if entry[0] is item:
+                queue.remove(entry)
+                if not queue:
+                    self._retire(tenant_key)
+                return True
+        return False
+
+    def _retire(self, tenant_key: str):
+        # An idle tenant keeps no credit: DRR deficits only carry over while backlogged
+        del self._queues[tenant_key]
+        del self._deficit[tenant_key]
+        self._active.remove(tenant_key)
+
+    @staticmethod
+    def _first_eligible(queue: deque, eligible: Callable[[Any], bool]) -> Optional[tuple]:
+        return next((entry for entry in queue if eligible(entry[0])), None)
+
+    def pop(self, eligible: Callable[[Any], bool] = lambda item: True) -> Optional[Any]:
+        """Next item in DRR order among those `eligible` accepts (None if there is none)."""
+        if not any(self._first_eligible(self._queues[t], eligible) for t in self._active):
+            return None
+        while True:
+            tenant_key = self._active[0]
+            queue = self._queues[tenant_key]
+            entry = self._first_eligible(queue, eligible)
+            if entry is not None:
+                item, cost = entry
+                if self._deficit[tenant_key] >= cost:
+                    queue.remove(entry)
+                    self._deficit[tenant_key] -= cost
+                    if not queue:
+                        self._retire(tenant_key)
+                    return item
+                self._deficit[tenant_key] += self.quantum * self.weight(tenant_key)
+            self._active.rotate(-1)
+
+class TenantWaits:
+    """Slot wait per tenant, for the most recently active FAIR_QUEUE_MAX_TRACKED_TENANTS tenants."""
+
+    def __init__(self, max_tenants: int = FAIR_QUEUE_MAX_TRACKED_TENANTS):
+        self.max_tenants = max_tenants
+        self._tenants: "OrderedDict[str, LatencyWindow]" = OrderedDict()
+
+    def record(self, tenant_key: str, seconds: float):
+        window = self._tenants.pop(tenant_key, None) or LatencyWindow()
+        window.record(seconds)
+        self._tenants[tenant_key] = window
+        if len(self._tenants) > self.max_tenants:
+            self._tenants.popitem(last=False)
+
+    def stats(self) -> dict:
+        return {
+            tenant_key: {
+                "calls": window.total,
+                "p50_wait_ms": round(window.percentile(50) * 1000, 2),
+                "p95_wait_ms": round(window.percentile(95) * 1000, 2),
+                "max_wait_ms": round(window.percentile(100) * 1000, 2),
+            }
+            for tenant_key, window in self._tenants.items()
+        }
+
+
+# Slot waits of every provider call, by tenant
+tenant_waits = TenantWaits()
@@ -0,0 +1,134 @@
+"""
+Application-wide outbound HTTP client registry.
+
+One pooled httpx.AsyncClient per upstream host, shared by every integration
+that talks to it, so keep-alive connections (and their TCP/TLS handshakes) are
+reused across requests. Each client gets its own connection limits, i.e.
+per-host limits. HTTP/2 is negotiated when the optional `h2` package is
+installed.
+
+Clients are created by `start()` at app startup, or on first `get()` for SDK
+clients built at import time, and closed by `aclose()` on shutdown.
+"""
+
+import importlib.util
+import logging
+import threading
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+from config.settings import HTTP_CLIENT_LIMITS, HTTP_KEEPALIVE_EXPIRY_SECONDS, HTTP2_ENABLED
+
+logger = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class HttpClientRegistry:
+    """Named, pooled async HTTP clients with shared lifecycle and stats."""
+
+    def __init__(self, limits: Dict[str, dict], http2: bool = HTTP2_ENABLED):
+        self._limits = dict(limits)
+        self._http2 = http2 and HTTP2_AVAILABLE
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._options: Dict[str, dict] = {}
+        self._requests: Dict[str, int] = {}
+        self._response_hooks: List[Callable[[httpx.Response], Awaitable[None]]] = []
+        self._lock = threading.Lock()
+
+    def configure(self, name: str, **options):
+        """
+        Set client options (base_url, headers, timeout) before the client is
+        first created. Limits come from HTTP_CLIENT_LIMITS[name] (or "default").
+        """
+        self._options[name] = options
+
+    def add_response_hook(self, hook: Callable[[httpx.Response], Awaitable[None]]):
+        """Call `hook` with every response of every client (e.g. to read rate-limit headers)."""
+        self._response_hooks.append(hook)
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        """The pooled client for `name`, created on first use."""
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            with self._lock:
+                client = self._clients.get(name)
+                if client is None or client.is_closed:
+                    client = self._create(name)
+                    self._clients[name] = client
+        return client
+
+    def _create(self, name: str) -> httpx.AsyncClient:
+        limits = self._limits.get(name, self._limits["default"])
+        options = self._options.get(name, {})
+
+        async def count_request(request: httpx.Request):
+            self._requests[name] = self._requests.get(name, 0) + 1
+
+        async def run_response_hooks(response: httpx.Response):
+            for hook in self._response_hooks:
+                await hook(response)
+
+        logger.info(
+            "http_client.created name=%s max_connections=%d http2=%s",
+            name, limits["max_connections"], self._http2,
+        )
+        return httpx.AsyncClient(
+            base_url=options.get("base_url", ""),
+            headers=options.get("headers"),
+            timeout=options.get("timeout", limits["timeout_seconds"]),
+            http2=self._http2,
+            limits=httpx.Limits(
+                max_connections=limits["max_connections"],
+                max_keepalive_connections=limits["max_keepalive_connections"],
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS
+            ),
+            event_hooks={"request": [count_request], "response": [run_response_hooks]}
+        )
+
+    async def start(self):
+        """Create every configured client up front (FastAPI startup)."""
+        for name in set(self._limits) - {"default"} | set(self._options):
+            self.get(name)
+
+    async def aclose(self):
+        """Close all clients and their pooled connections (FastAPI shutdown)."""
+        with self._lock:
+            clients, self._clients = self._clients, {}
+        for name, client in clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning("http_client.close.failed name=%s err=%s", name, e)
+
+    @staticmethod
+    def _pool_stats(client: httpx.AsyncClient) -> Optional[dict]:
+        """Connection counts from httpcore's pool (None if the transport doesn't expose it)."""
+        pool = getattr(getattr(client, "_transport", None), "_pool", None)
+        connections = getattr(pool, "connections", None)
+        if connections is None:
+            return None
+        return {
+            "connections": len(connections),
+            "idle": sum(1 for c in connections if c.is_idle()),
+            "http2": sum(1 for c in connections if "HTTP/2" in repr(c)),
+        }
+
+    def stats(self) -> dict:
+        """Per-client request counts, limits and live pool state."""
+        return {
+            "http2_enabled": self._http2,
+            "clients": {
+                name: {
+                    "requests": self._requests.get(name, 0),
+                    "max_connections": self._limits.get(name, self._limits["default"])["max_connections"],
+                    "pool": self._pool_stats(client),
+                }
+                for name, client in self._clients.items()
+            },
+        }
+
+
+# Global registry shared by all outbound integrations
+http_clients = HttpClientRegistry(HTTP_CLIENT_LIMITS)
@@ -7,34 +7,10 @@ If detected, immediately returns Inconclusive with confidence=0.30 (< 0.40 refun
 This is a cost-saving + brand-protection mechanism.
 """
 
-import re
 from typing import Tuple
 
-# Normative language patterns that indicate philosophical/subjective claims
-NORMATIVE_PATTERNS = [
-    # Explicit value judgments
-    r'\binherently\s+(evil|good|bad|wrong|right)\b',
-    r'\bmorally\s+(wrong|right|corrupt|good|bad)\b',
-    r'\b(all|every)\s+\w+\s+(are|is)\s+(corrupt|evil|good|bad)\b',
-    
-    # Absolute moral claims
-    r'\b(failed|corrupt)\s+system\b',
-    r'\bexploiting\s+(workers|people)\b',
-    r'\bcause[sd]?\s+more\s+harm\s+than\s+good\b',
-    
-    # Universal negative/positive claims (often philosophical)
-    r'\b(all|every)\s+(politicians?|billionaires?|corporations?)\s+(are|is)\s+corrupt\b',
-    r'\ball\s+\w+\s+(media|news)\s+(is|are)\s+propaganda\b',
-    
-    # Normative modals
-    r'\bshould(n\'t)?\s+\w+\b.*\?',  # Questions with "should"
-    r'\bdeserve[sd]?\b',
-    
-    # Subjective aesthetic/quality judgments
-    r'\bbest\b.*\?',
-    r'\bbelong\s+on\b',  # "Does X belong on Y?"
-    r'\bis\s+\w+\s+(beautiful|ugly|perfect|flawed)\b',
-]
+# Patterns live with the single-pass classifier; re-exported for compatibility
+from src.utils.claim_classifier import NORMATIVE_PATTERNS, classify_claim
 
 def is_philosophical_claim(claim: str) -> Tuple[bool, str]:
     """
@@ -43,14 +19,8 @@ def is_philosophical_claim(claim: str) -> Tuple[bool, str]:
     Returns:
         (is_philosophical, reason)
     """
-    claim_lower = claim.lower()
-    
-    for pattern in NORMATIVE_PATTERNS:
-        match = re.search(pattern, claim_lower, re.IGNORECASE)
-        if match:
-            return (True, f"Normative pattern detected: '{match.group()}'")
-    
-    return (False, "")
+    classification = classify_claim(claim)
+    return (classification.is_philosophical, classification.filter_reason)
 
 def get_philosophical_response(claim: str, reason: str) -> dict:
     """
@@ -0,0 +1,141 @@
+"""
+Lazily constructed provider SDK clients.
+
+Importing openai, anthropic, google.genai and exa_py costs seconds, and none
+of it is needed to serve /health or the landing page. Agents and search ask
+this registry for their client on first use instead of building one at module
+level; the SDK is imported at that moment, in a worker thread for async
+callers. `prewarm` builds everything in the background once the server is
+up, so the first paid request doesn't pay the import either.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict
+
+from config.settings import (
+    ANTHROPIC_API_KEY, ANTHROPIC_BASE_URL, DEEPINFRA_API_KEY, DEEPINFRA_BASE_URL, EXA_API_KEY, EXA_BASE_URL,
+    GEMINI_API_KEY, GEMINI_BASE_URL, OPENAI_API_KEY, OPENAI_BASE_URL
+)
+from src.utils.executor_metrics import to_thread
+from src.utils.http_clients import http_clients
+
+logger = logging.getLogger(__name__)
+
+
+def _build_deepinfra():
+    from openai import AsyncOpenAI
+    return AsyncOpenAI(
+        api_key=DEEPINFRA_API_KEY,
+        base_url=DEEPINFRA_BASE_URL,
+        max_retries=0,
+        http_client=http_clients.get("deepinfra")
+    )
+
+
+def _build_openai():
+    from openai import AsyncOpenAI
+    return AsyncOpenAI(
+        api_key=OPENAI_API_KEY,
+        base_url=OPENAI_BASE_URL,
+        max_retries=0,
+        http_client=http_clients.get("openai")
+    )
+
+
+def _build_anthropic():
+    from anthropic import AsyncAnthropic
+    # Retries are made by src/utils/retry.py, which knows the request deadline
+    return AsyncAnthropic(api_key=ANTHROPIC_API_KEY, base_url=ANTHROPIC_BASE_URL, max_retries=0)
+
+
+def _build_gemini():
+    from google import genai
+    from google.genai import types
+    # Async calls go through `client.aio`
+    return genai.Client(api_key=GEMINI_API_KEY, http_options=types.HttpOptions(base_url=GEMINI_BASE_URL))
+
+
+def _build_exa():
+    from exa_py import AsyncExa
+
+    class PooledAsyncExa(AsyncExa):
+        """AsyncExa on the shared "exa" client from the outbound HTTP registry."""
+
+        @property
+        def client(self):
+            return http_clients.get("exa")
+
+    # Async Exa client: a search that exceeds its timeout is cancelled together
+    # with its HTTP request, instead of leaving a worker thread blocked on it
+    exa = PooledAsyncExa(api_key=EXA_API_KEY, api_base=EXA_BASE_URL)
+    http_clients.configure("exa", base_url=exa.base_url, headers=exa.headers)
+    return exa
+
+
+_BUILDERS: Dict[str, Callable[[], Any]] = {
+    "deepinfra": _build_deepinfra,
+    "openai": _build_openai,
+    "anthropic": _build_anthropic,
+    "gemini": _build_gemini,
+    "exa": _build_exa,
+}
+
+
+class ProviderClients:
+    """One SDK client per provider, built on first use."""
+
+    def __init__(self, builders: Dict[str, Callable[[], Any]] = _BUILDERS):
+        self._builders = builders
+        self._clients: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self.init_seconds: Dict[str, float] = {}
+
+    def get(self, name: str) -> Any:
+        """The provider's client, importing its SDK and constructing it if needed."""
+        client = self._clients.get(name)
+        if client is not None:
+            return client
+        # Builds are serialized: prewarm (worker thread) and a request
+        # (event loop) may ask for the same client at the same time
+        with self._lock:
+            if name not in self._clients:
+                started = time.perf_counter()
+                self._clients[name] = self._builders[name]()
+                self.init_seconds[name] = time.perf_counter() - started
+                logger.info("provider.init name=%s ms=%.0f", name, self.init_seconds[name] * 1000)
+            return self._clients[name]
+
+    async def aget(self, name: str) -> Any:
+        """`get` for async callers: a first build (SDK import) runs off the event loop."""
+        client = self._clients.get(name)
+        if client is not None:
+            return client
+        return await to_thread(self.get, name)
+
+    def prewarm_sync(self):
+        """Build every client, logging (not raising) failures."""
+        for name in self._builders:
+            try:
+                self.get(name)
+            except Exception as e:
+                logger.warning("provider.prewarm_failed name=%s err=%s", name, e)
+
+    async def prewarm(self):
+        """Build every client off the event loop (background startup task)."""
+        started = time.perf_counter()
+        await to_thread(self.prewarm_sync)
+        logger.info("provider.prewarmed count=%d ms=%.0f", len(self._clients), (time.perf_counter() - started) * 1000)
+
+    def stats(self) -> dict:
+        """Which clients exist yet and what each cost to build."""
+        return {
+            "initialized": sorted(self._clients),
+            "pending": sorted(set(self._builders) - set(self._clients)),
+            "init_ms": {name: round(seconds * 1000, 1) for name, seconds in self.init_seconds.items()},
+        }
+
+
+# Global registry shared by all agents and search
+provider_clients = ProviderClients()
@@ -0,0 +1,326 @@
+"""
+Provider rate-limit quotas.
+
+Every provider/model has a requests-per-minute and a tokens-per-minute token
+bucket (QUOTA_LIMITS). Before a call, `quota_manager.reserve` takes one
+request and the estimated prompt + completion tokens from them; if a bucket
+is short, the call waits until it refills - briefly, up to
+QUOTA_MAX_WAIT_SECONDS or what the request deadline allows - instead of
+being sent into a 429. Once the call returns, the reservation is settled
+with the actual usage.
+
+Providers' own accounting wins over ours: x-ratelimit-* / anthropic-ratelimit-*
+response headers (seen by a hook on the pooled HTTP clients) lower the
+buckets to what the provider reports remaining, and a 429's Retry-After
+blocks further calls to that provider/model until it has passed.
+"""
+
+import asyncio
+import logging
+import math
+import re
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+from config.settings import QUOTA_LIMITS, QUOTA_MAX_WAIT_SECONDS, QUOTA_DEFAULT_RETRY_AFTER_SECONDS
+from src.utils.deadline import Deadline
+from src.utils.http_clients import http_clients
+
+logger = logging.getLogger(__name__)
+
+# The reservation of the provider call in progress, so the HTTP response hook
+# can attribute rate-limit headers to the right provider/model
+_current_reservation: ContextVar[Optional["Reservation"]] = ContextVar("current_reservation", default=None)
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+
+
+class QuotaExhausted(Exception):
+    """The provider/model's quota won't allow a call within the caller's wait limit."""
+
+    def __init__(self, provider: str, model: str, retry_after: float):
+        super().__init__(f"{provider}/{model} quota exhausted, retry after {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for a prompt (~4 characters per token)."""
+    return math.ceil(len(text) / 4)
+
+
+def usage_tokens(usage: Any) -> Optional[int]:
+    """Total tokens from an OpenAI-style, Anthropic or Gemini usage object (None if unknown)."""
+    if usage is None:
+        return None
+    for total in ("total_tokens", "total_token_count"):
+        if isinstance(getattr(usage, total, None), int):
+            return getattr(usage, total)
+    for prompt, completion in (("prompt_tokens", "completion_tokens"), ("input_tokens", "output_tokens")):
+        if isinstance(getattr(usage, prompt, None), int):
+            return getattr(usage, prompt) + (getattr(usage, completion, 0) or 0)
+    return None
+
+
+def parse_reset(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Seconds until a rate-limit reset.
+
+    Accepts plain seconds ("2", "0.5"), Go-style durations ("6m0s", "20ms")
+    and absolute times (RFC 3339 or HTTP date). None if unparseable.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if parts and "".join(n + u for n, u in parts) == value:
+        return sum(float(n) * _DURATION_UNITS[u] for n, u in parts)
+    try:
+        when = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, when.timestamp() - (time.time() if now is None else now))
+
+
+def _header(headers, *names: str) -> Optional[str]:
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            return value
+    return None
+
+
+class TokenBucket:
+    """A per-minute budget that refills continuously and may be reserved into debt."""
+
+    def __init__(self, per_minute: float, clock=time.monotonic):
+        self.per_minute = per_minute
+        self.rate = per_minute / 60.0
+        self.tokens = float(per_minute)
+        self._clock = clock
+        self._updated = clock()
+
+    def _refill(self):
+        now = self._clock()
+        self.tokens = min(self.per_minute, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_for(self, amount: float) -> float:
+        """Seconds until `amount` would be available (0.0 if it is now)."""
+        self._refill()
+        return max(0.0, (amount - self.tokens) / self.rate)
+
+    def take(self, amount: float):
+        """Reserve `amount`; the balance may go negative until it refills."""
+        self._refill()
+        self.tokens -= amount
+
+    def give_back(self, amount: float):
+        self._refill()
+        self.tokens = min(self.per_minute, self.tokens + amount)
+
+    def limit_to(self, remaining: float):
+        """Lower the balance to what the provider reports remaining."""
+        self._refill()
+        self.tokens = min(self.tokens, remaining)
+
+
+class Reservation:
+    """Tokens held for one call; `settle` corrects them to the actual usage."""
+
+    def __init__(self, quota: "ProviderQuota", tokens: int):
+        self.quota = quota
+        self.tokens = tokens
+        self.settled = False
+        self.observed = False  # headers already applied by the HTTP response hook
+
+    def settle(self, usage: Any):
+        """Replace the estimate with the response's token usage (ignored if unknown)."""
+        actual = usage_tokens(usage)
+        if actual is None or self.settled:
+            return
+        self.settled = True
+        if self.quota.tpm is not None:
+            if actual > self.tokens:
+                self.quota.tpm.take(actual - self.tokens)
+            else:
+                self.quota.tpm.give_back(self.tokens - actual)
+        self.tokens = actual
+
+
+class ProviderQuota:
+    """RPM/TPM buckets and Retry-After block for one provider/model."""
+
+    def __init__(self, provider: str, model: str, rpm: Optional[float], tpm: Optional[float], clock=time.monotonic):
+        self.provider = provider
+        self.model = model
+        self.rpm = TokenBucket(rpm, clock) if rpm else None
+        self.tpm = TokenBucket(tpm, clock) if tpm else None
+        self._clock = clock
+        self.blocked_until = 0.0
+        self.reserved = 0
+        self.waited = 0
+        self.total_wait = 0.0
+        self.exhausted = 0
+        self.rate_limited = 0
+
+    def wait_for(self, tokens: int) -> float:
+        """Seconds until one request of `tokens` fits every bucket and any block has passed."""
+        waits = [self.blocked_until - self._clock()]
+        if self.rpm:
+            waits.append(self.rpm.wait_for(1))
+        if self.tpm:
+            # A call larger than the whole minute's budget waits for a full bucket, not forever
+            waits.append(self.tpm.wait_for(min(tokens, self.tpm.per_minute)))
+        return max(0.0, *waits)
+
+    def take(self, tokens: int):
+        if self.rpm:
+            self.rpm.take(1)
+        if self.tpm:
+            self.tpm.take(tokens)
+
+    def refund_tokens(self, tokens: int):
+        if self.tpm:
+            self.tpm.give_back(tokens)
+
+    def block(self, seconds: float):
+        self.blocked_until = max(self.blocked_until, self._clock() + seconds)
+
+    def observe(self, headers, status_code: Optional[int] = None):
+        """Apply a response's rate-limit headers (and a 429's Retry-After)."""
+        remaining_requests = _header(headers, "x-ratelimit-remaining-requests", "anthropic-ratelimit-requests-remaining")
+        remaining_tokens = _header(headers, "x-ratelimit-remaining-tokens", "anthropic-ratelimit-tokens-remaining")
+        reset_requests = parse_reset(_header(headers, "x-ratelimit-reset-requests", "anthropic-ratelimit-requests-reset"))
+        reset_tokens = parse_reset(_header(headers, "x-ratelimit-reset-tokens", "anthropic-ratelimit-tokens-reset"))
+        try:
+            if remaining_requests is not None and self.rpm:
+                self.rpm.limit_to(float(remaining_requests))
+                if float(remaining_requests) <= 0 and reset_requests:
+                    self.block(reset_requests)
+            if remaining_tokens is not None and self.tpm:
+                self.tpm.limit_to(float(remaining_tokens))
+                if float(remaining_tokens) <= 0 and reset_tokens:
+                    self.block(reset_tokens)
+        except ValueError:
+            pass
+        if status_code == 429:
+            self.rate_limited += 1
+            retry_after_ms = _header(headers, "retry-after-ms")
+            retry_after = (
+                float(retry_after_ms) / 1000 if retry_after_ms and retry_after_ms.replace(".", "", 1).isdigit()
+                else parse_reset(_header(headers, "retry-after"))
+            )
+            if retry_after is None:
+                retry_after = max(reset_requests or 0.0, reset_tokens or 0.0) or QUOTA_DEFAULT_RETRY_AFTER_SECONDS
+            self.block(retry_after)
+            logger.warning("quota.rate_limited provider=%s model=%s retry_after=%.1f", self.provider, self.model, retry_after)
+
+    def stats(self) -> dict:
+        return {
+            "rpm_limit": self.rpm.per_minute if self.rpm else None,
+            "rpm_available": round(self.rpm.tokens, 1) if self.rpm else None,
+            "tpm_limit": self.tpm.per_minute if self.tpm else None,
+            "tpm_available": round(self.tpm.tokens) if self.tpm else None,
+            "blocked_seconds": round(max(0.0, self.blocked_until - self._clock()), 2),
+            "reserved": self.reserved,
+            "waited": self.waited,
+            "avg_wait_ms": round(self.total_wait / self.waited * 1000, 1) if self.waited else 0.0,
+            "exhausted": self.exhausted,
+            "rate_limited": self.rate_limited,
+        }
+
+
+class QuotaManager:
+    """ProviderQuota per provider/model, with limits from QUOTA_LIMITS."""
+
+    def __init__(self, limits: Dict[str, dict] = QUOTA_LIMITS, max_wait: float = QUOTA_MAX_WAIT_SECONDS):
+        self.limits = limits
+        self.max_wait = max_wait
+        self._quotas: Dict[tuple, ProviderQuota] = {}
+
+    def get(self, provider: str, model: str = "") -> ProviderQuota:
+        quota = self._quotas.get((provider, model))
+        if quota is None:
+            limits = self.limits.get(f"{provider}/{model}") or self.limits.get(provider) or {}
+            quota = self._quotas[(provider, model)] = ProviderQuota(
+                provider, model, limits.get("rpm"), limits.get("tpm")
+            )
+        return quota
+
+    @asynccontextmanager
+    async def reserve(self, provider: str, model: str, tokens: int, deadline: Optional[Deadline] = None):
+        """
+        Hold quota for one call of about `tokens` tokens, waiting for it if needed.
+
+        Yields a Reservation to `settle` with the response's usage. If the
+        call fails, its tokens are returned (the request still counts) and
+        any rate-limit headers on the error are applied.
+
+        Raises:
+            QuotaExhausted: If the quota frees up later than max_wait (or the deadline) allows
+        """
+        quota = self.get(provider, model)
+        max_wait = deadline.budget(self.max_wait) if deadline else self.max_wait
+        wait = quota.wait_for(tokens)
+        if wait > max_wait:
+            quota.exhausted += 1
+            logger.warning("quota.exhausted provider=%s model=%s wait=%.1f", provider, model, wait)
+            raise QuotaExhausted(provider, model, wait)
+        # Reserve before sleeping so concurrent callers queue behind this one
+        quota.take(tokens)
+        quota.reserved += 1
+        if wait > 0:
+            quota.waited += 1
+            quota.total_wait += wait
+            try:
+                await asyncio.sleep(wait)
+            except BaseException:
+                quota.refund_tokens(tokens)
+                raise
+        reservation = Reservation(quota, tokens)
+        token = _current_reservation.set(reservation)
+        try:
+            yield reservation
+        except BaseException as e:
+            if not reservation.settled:
+                quota.refund_tokens(reservation.tokens)
+            # SDK errors carry the HTTP response (clients outside the pooled registry, e.g. Anthropic's)
+            response = getattr(e, "response", None)
+            if not reservation.observed and getattr(response, "headers", None) is not None:
+                quota.observe(response.headers, getattr(response, "status_code", None))
+            raise
+        finally:
+            _current_reservation.reset(token)
+
+    async def observe_response(self, response):
+        """HTTP response hook: apply rate-limit headers to the quota of the call in progress."""
+        reservation = _current_reservation.get()
+        if reservation is not None:
+            reservation.observed = True
+            reservation.quota.observe(response.headers, response.status_code)
+
+    def stats(self) -> dict:
+        """Bucket levels, waits, exhaustion and 429 counts per provider/model."""
+        return {
+            f"{provider}/{model}" if model else provider: quota.stats()
+            for (provider, model), quota in sorted(self._quotas.items())
+        }
+
+
+# Global quota manager shared by all agents
+quota_manager = QuotaManager()
+http_clients.add_response_hook(quota_manager.observe_response)
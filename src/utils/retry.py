@@ -0,0 +1,142 @@
+"""
+Deadline-aware retries for provider calls.
+
+`retry_call` re-runs one provider call when it fails with a transient error
+(connection reset, timeout, 408/409/429/5xx, Anthropic's 529 overloaded),
+sleeping a decorrelated-jitter delay between attempts:
+
+    delay = min(RETRY_MAX_DELAY_SECONDS, uniform(RETRY_BASE_DELAY_SECONDS, 3 x previous delay))
+
+or the provider's Retry-After if that is longer (capped at
+RETRY_MAX_DELAY_SECONDS when there is no request deadline). A retry is only
+made while the request deadline leaves room for the delay plus
+RETRY_MIN_ATTEMPT_SECONDS of call; otherwise - and for every non-transient error - the error is raised
+and the caller falls back as before. Attempts and outcomes per provider are
+counted for /metrics/retries.
+"""
+
+import asyncio
+import logging
+import random
+from typing import Any, Awaitable, Callable, Optional
+
+from config.settings import (
+    RETRY_MAX_ATTEMPTS, RETRY_BASE_DELAY_SECONDS, RETRY_MAX_DELAY_SECONDS, RETRY_MIN_ATTEMPT_SECONDS
+)
+from src.utils.adaptive_timeouts import is_timeout
+from src.utils.deadline import Deadline
+from src.utils.quotas import QuotaExhausted, parse_reset
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504, 529}
+# Transport-level failures, matched by type name so no SDK/httpx import is needed
+_CONNECTION_ERRORS = ("APIConnectionError", "ConnectError", "ReadError", "WriteError", "RemoteProtocolError")
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether `error` is transient, i.e. the same call may well succeed if repeated."""
+    if isinstance(error, QuotaExhausted):
+        return False  # already waited for quota as long as allowed
+    if isinstance(error, ConnectionError) or type(error).__name__ in _CONNECTION_ERRORS:
+        return True
+    if is_timeout(error):
+        return True
+    return _status_code(error) in RETRYABLE_STATUS
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """The provider's Retry-After on an error response, in seconds."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers is None:
+        return None
+    return parse_reset(headers.get("retry-after"))
+
+
+class RetryMetrics:
+    """Attempt and outcome counts per provider."""
+
+    def __init__(self):
+        self._providers = {}
+
+    def _counts(self, provider: str) -> dict:
+        return self._providers.setdefault(provider, {
+            "calls": 0, "attempts": 0, "retries": 0, "recovered": 0,
+            "failed_not_retryable": 0, "failed_attempts_exhausted": 0, "failed_deadline": 0,
+        })
+
+    def record(self, provider: str, attempts: int, outcome: str):
+        counts = self._counts(provider)
+        counts["calls"] += 1
+        counts["attempts"] += attempts
+        counts["retries"] += attempts - 1
+        if outcome == "recovered":
+            counts["recovered"] += 1
+        elif outcome != "ok":
+            counts[f"failed_{outcome}"] += 1
+
+    def stats(self) -> dict:
+        return {provider: dict(counts) for provider, counts in sorted(self._providers.items())}
+
+
+retry_metrics = RetryMetrics()
+
+
+async def retry_call(
+    call: Callable[[], Awaitable[Any]],
+    provider: str,
+    deadline: Optional[Deadline] = None,
+    max_attempts: int = RETRY_MAX_ATTEMPTS,
+    base_delay: float = RETRY_BASE_DELAY_SECONDS,
+    max_delay: float = RETRY_MAX_DELAY_SECONDS,
+    sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+) -> Any:
+    """
+    Await `call()`, retrying transient failures.
+
+    Args:
+        call: Makes one attempt (a fresh coroutine each time)
+        provider: Name for logs and metrics
+        deadline: Request deadline; no retry is started that it can't fit
+
+    Returns:
+        The first successful attempt's result
+
+    Raises:
+        The last attempt's error when it is not retryable, attempts run out,
+        or the deadline leaves no room for another
+    """
+    delay = base_delay
+    for attempt in range(1, max_attempts + 1):
+        try:
+            result = await call()
+        except Exception as e:
+            if not is_retryable(e):
+                outcome = "not_retryable"
+            elif attempt == max_attempts:
+                outcome = "attempts_exhausted"
+            else:
+                delay = min(max_delay, random.uniform(base_delay, delay * 3))
+                wait = max(delay, retry_after(e) or 0.0)
+                if deadline is None:
+                    # Nothing else bounds a provider's Retry-After
+                    wait = min(wait, max_delay)
+                if deadline is None or deadline.has(wait + RETRY_MIN_ATTEMPT_SECONDS):
+                    logger.warning(
+                        "retry.scheduled provider=%s attempt=%d delay=%.2f err=%s",
+                        provider, attempt, wait, str(e)[:120]
+                    )
+                    await sleep(wait)
+                    continue
+                outcome = "deadline"
+            retry_metrics.record(provider, attempt, outcome)
+            raise
+        retry_metrics.record(provider, attempt, "recovered" if attempt > 1 else "ok")
+        return result
@@ -1,69 +1,90 @@
 """
 Token usage tracker for performance logging.
-Stores token counts globally during request execution.
+Stores token counts per request during execution.
 """
 
+from contextvars import ContextVar
 from typing import Dict, Optional
 
+# Each verification (including every claim of a concurrent batch) runs in its
+# own asyncio task, so a ContextVar keeps their token counts apart.
+_request_usage: ContextVar[Dict] = ContextVar("token_usage")
+
+
 class TokenTracker:
-    """Thread-local storage for token usage during verification."""
-    
+    """Per-request (context-local) storage for token usage during verification."""
+
     def __init__(self):
         self.reset()
-    
-    def reset(self):
+
+    @property
+    def _usage(self) -> Dict:
+        try:
+            return _request_usage.get()
+        except LookupError:
+            return self.reset()
+
+    def reset(self) -> Dict:
         """Clear all tracked tokens."""
-        self.prover_tokens: Optional[Dict] = None
-        self.debunker_tokens: Optional[Dict] = None
-        self.judge_tokens: Optional[Dict] = None
-        self.verdict_type: Optional[str] = None  # Track verdict for cost analysis
-        self.is_inconclusive: bool = False  # Flag for discount analysis
-    
-    def set_prover_tokens(self, model: str, input_tokens: int, output_tokens: int):
-        """Record prover agent token usage."""
-        self.prover_tokens = {
-            "model": model,
-            "input": input_tokens,
-            "output": output_tokens
+        usage = {
+            "prover": None,
+            "debunker": None,
+            "judge": None,
+            "quick_check": None,
+            "verdict_type": None,  # Track verdict for cost analysis
+            "is_inconclusive": False  # Flag for discount analysis
         }
-    
-    def set_debunker_tokens(self, model: str, input_tokens: int, output_tokens: int):
-        """Record debunker agent token usage."""
-        self.debunker_tokens = {
-            "model": model,
-            "input": input_tokens,
-            "output": output_tokens
-        }
-    
-    def set_judge_tokens(self, model: str, input_tokens: int, output_tokens: int):
-        """Record judge agent token usage."""
-        self.judge_tokens = {
+        _request_usage.set(usage)
+        return usage
+
+    def set_tokens(self, agent: str, model: str, input_tokens: int, output_tokens: int,
+                   cached_input_tokens: int = 0, cache_write_tokens: int = 0):
+        """
+        Record one agent's token usage ("prover", "debunker", "judge" or "quick_check").
+
+        input counts every prompt token; cached_input/cache_write are the
+        subsets read from / written to the provider's prompt cache.
+        """
+        self._usage[agent] = {
             "model": model,
             "input": input_tokens,
-            "output": output_tokens
+            "output": output_tokens,
+            "cached_input": cached_input_tokens,
+            "cache_write": cache_write_tokens
         }
-    
+
+    def set_prover_tokens(self, model: str, input_tokens: int, output_tokens: int, **cache_tokens):
+        """Record prover agent token usage (optionally cached_input_tokens / cache_write_tokens)."""
+        self.set_tokens("prover", model, input_tokens, output_tokens, **cache_tokens)
+
+    def set_debunker_tokens(self, model: str, input_tokens: int, output_tokens: int, **cache_tokens):
+        """Record debunker agent token usage (optionally cached_input_tokens / cache_write_tokens)."""
+        self.set_tokens("debunker", model, input_tokens, output_tokens, **cache_tokens)
+
+    def set_judge_tokens(self, model: str, input_tokens: int, output_tokens: int, **cache_tokens):
+        """Record judge agent token usage (optionally cached_input_tokens / cache_write_tokens)."""
+        self.set_tokens("judge", model, input_tokens, output_tokens, **cache_tokens)
+
+    def set_quick_check_tokens(self, model: str, input_tokens: int, output_tokens: int, **cache_tokens):
+        """Record quick check (tier 1) agent token usage (optionally cached_input_tokens / cache_write_tokens)."""
+        self.set_tokens("quick_check", model, input_tokens, output_tokens, **cache_tokens)
+
     def set_verdict(self, verdict: str):
         """
         Record the final verdict for cost analysis.
         Flags inconclusive results for potential discount consideration.
-        
+
         Args:
             verdict: "True"/"False"/"Inconclusive" (or "Likely"/"Unlikely"/"Uncertain" for predictions)
         """
-        self.verdict_type = verdict
+        usage = self._usage
+        usage["verdict_type"] = verdict
         # Flag inconclusive/uncertain verdicts for discount analysis
-        self.is_inconclusive = verdict.lower() in ["inconclusive", "uncertain"]
-    
+        usage["is_inconclusive"] = verdict.lower() in ["inconclusive", "uncertain"]
+
     def get_all(self) -> Dict:
         """Get all tracked token data including verdict info."""
-        return {
-            "prover": self.prover_tokens,
-            "debunker": self.debunker_tokens,
-            "judge": self.judge_tokens,
-            "verdict_type": self.verdict_type,
-            "is_inconclusive": self.is_inconclusive
-        }
+        return dict(self._usage)
 
 
 # Global instance for tracking during requests
@@ -0,0 +1,89 @@
+"""Adaptive provider timeouts: p99-derived, clamped, and fed by tracked calls."""
+import asyncio
+
+import pytest
+
+from src.utils.adaptive_timeouts import AdaptiveTimeouts, is_timeout
+
+
+def _timeouts(**kwargs):
+    kwargs.setdefault("bounds", {"default": (2.0, 30.0)})
+    kwargs.setdefault("multiplier", 1.5)
+    kwargs.setdefault("window", 50)
+    kwargs.setdefault("min_samples", 5)
+    kwargs.setdefault("enabled", True)
+    return AdaptiveTimeouts(**kwargs)
+
+
+def test_ceiling_until_enough_samples():
+    timeouts = _timeouts()
+    for _ in range(4):
+        timeouts.record("deepinfra", "m", 1.0)
+    assert timeouts.timeout("deepinfra", "m") == 30.0
+    timeouts.record("deepinfra", "m", 1.0)
+    assert timeouts.timeout("deepinfra", "m") == pytest.approx(2.0)  # 1.5 x 1.0, floored at 2
+
+
+def test_p99_is_scaled_and_clamped():
+    timeouts = _timeouts(bounds={"default": (1.0, 10.0)})
+    for seconds in (2.0, 2.0, 2.0, 2.0, 4.0):
+        timeouts.record("openai", "m", seconds)
+    assert timeouts.timeout("openai", "m") == pytest.approx(6.0)
+    assert timeouts.timeout("openai", "m", cap=3.0) == 3.0
+    for _ in range(5):
+        timeouts.record("openai", "m", 20.0, timed_out=True)
+    assert timeouts.timeout("openai", "m") == 10.0
+    # Other models of the same provider have their own window
+    assert timeouts.timeout("openai", "other") == 10.0
+
+
+def test_disabled_uses_the_ceiling():
+    timeouts = _timeouts(enabled=False)
+    for _ in range(10):
+        timeouts.record("exa", "search", 0.1)
+    assert timeouts.timeout("exa", "search") == 30.0
+
+
+def test_track_records_success_and_timeouts_but_not_other_errors():
+    timeouts = _timeouts()
+    with timeouts.track("anthropic", "m"):
+        pass
+    with pytest.raises(asyncio.TimeoutError):
+        with timeouts.track("anthropic", "m"):
+            raise asyncio.TimeoutError()
+    with pytest.raises(ValueError):
+        with timeouts.track("anthropic", "m"):
+            raise ValueError("bad request")
+    stats = timeouts.stats()["providers"]["anthropic/m"]
+    assert stats["calls"] == 2
+    assert stats["timeouts"] == 1
+
+
+def test_timeout_cut_short_by_the_cap_is_not_recorded():
+    timeouts = _timeouts()
+    for _ in range(5):
+        timeouts.record("deepinfra", "m", 4.0)
+    assert timeouts.timeout("deepinfra", "m") == pytest.approx(6.0)
+
+    with pytest.raises(asyncio.TimeoutError):
+        with timeouts.track("deepinfra", "m", cap=0.5) as timeout:  # the deadline had 0.5s left
+            assert timeout == 0.5
+            raise asyncio.TimeoutError()
+    assert timeouts.timeout("deepinfra", "m") == pytest.approx(6.0)
+    assert timeouts.stats()["providers"]["deepinfra/m"]["timeouts"] == 0
+
+    # The adaptive timeout itself was the limit: recorded at the timeout the call was given
+    with pytest.raises(asyncio.TimeoutError):
+        with timeouts.track("deepinfra", "m", cap=60.0):
+            raise asyncio.TimeoutError()
+    assert timeouts.stats()["providers"]["deepinfra/m"]["timeouts"] == 1
+    assert timeouts.latency("deepinfra", "m", 100) == pytest.approx(6.0)
+
+
+def test_is_timeout_matches_sdk_errors_by_name():
+    class APITimeoutError(Exception):
+        pass
+
+    assert is_timeout(APITimeoutError())
+    assert is_timeout(TimeoutError())
+    assert not is_timeout(ConnectionError())
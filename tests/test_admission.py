@@ -0,0 +1,114 @@
+"""Admission control: per-pool in-flight slots, FIFO queue, shedding with Retry-After."""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.middleware import admission
+from src.middleware.admission import AdmissionController, Overloaded
+from src.utils.bulkheads import traffic_class
+
+
+def test_slots_are_handed_to_queued_requests_in_order():
+    async def scenario():
+        controller = AdmissionController(max_in_flight=1, max_queue=5, max_queue_wait=1.0, service_time=0.1)
+        assert await controller.acquire() == 0.0
+        order = []
+
+        async def queued(name):
+            await controller.acquire()
+            order.append(name)
+
+        tasks = [asyncio.create_task(queued(name)) for name in ("a", "b")]
+        await asyncio.sleep(0)
+        assert controller.queued == 2 and controller.in_flight == 1
+        controller.release()
+        await asyncio.sleep(0)
+        controller.release()
+        await asyncio.gather(*tasks)
+        controller.release()
+        return order, controller
+
+    order, controller = asyncio.run(scenario())
+    assert order == ["a", "b"]
+    assert controller.in_flight == 0 and controller.queued == 0
+    assert controller.admitted == 3
+
+
+def test_sheds_when_queue_is_full_or_wait_is_too_long():
+    async def scenario():
+        controller = AdmissionController(max_in_flight=1, max_queue=1, max_queue_wait=5.0, service_time=1.0)
+        await controller.acquire()
+        waiter = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        with pytest.raises(Overloaded) as full:
+            await controller.acquire()
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+
+        slow = AdmissionController(max_in_flight=1, max_queue=10, max_queue_wait=5.0, service_time=8.0)
+        await slow.acquire()
+        with pytest.raises(Overloaded) as too_long:
+            await slow.acquire()
+        return controller, full.value, too_long.value
+
+    controller, full, too_long = asyncio.run(scenario())
+    assert full.reason == "queue_full"
+    assert too_long.reason == "expected_wait" and too_long.retry_after == 8.0
+    # The cancelled waiter left the queue without taking a slot
+    assert controller.queued == 0 and controller.in_flight == 1
+
+
+def test_queue_timeout_sheds():
+    async def scenario():
+        controller = AdmissionController(max_in_flight=1, max_queue=5, max_queue_wait=0.05, service_time=0.01)
+        await controller.acquire()
+        with pytest.raises(Overloaded) as e:
+            await controller.acquire()
+        return controller, e.value
+
+    controller, e = asyncio.run(scenario())
+    assert e.reason == "queue_timeout"
+    assert controller.stats()["shed"]["queue_timeout"] == 1
+    assert controller.queued == 0
+
+
+def test_middleware_returns_503_with_retry_after(monkeypatch):
+    interactive = AdmissionController(max_in_flight=1, max_queue=0, max_queue_wait=1.0, service_time=2.5)
+    bulk = AdmissionController(max_in_flight=1, max_queue=0, max_queue_wait=1.0, service_time=2.5)
+    monkeypatch.setattr(admission, "admission_pools", {"interactive": interactive, "bulk": bulk})
+    monkeypatch.setattr(admission, "ADMISSION_CONTROL_ENABLED", True)
+
+    def request(path):
+        return SimpleNamespace(url=SimpleNamespace(path=path), headers={}, client=SimpleNamespace(host="10.0.0.1"))
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def slow_endpoint(_):
+            await release.wait()
+            return SimpleNamespace(status_code=200)
+
+        first = asyncio.create_task(admission.admission_control(request("/verify"), slow_endpoint))
+        await asyncio.sleep(0)
+        shed = await admission.admission_control(request("/verify"), slow_endpoint)
+
+        classes = []
+
+        async def free(_):
+            classes.append(traffic_class.get())
+            return SimpleNamespace(status_code=200)
+
+        # A full interactive pool does not block batches or free endpoints
+        batch = await admission.admission_control(request("/verify/batch"), free)
+        health = await admission.admission_control(request("/health"), free)
+        release.set()
+        await first
+        return shed, batch, health, classes
+
+    shed, batch, health, classes = asyncio.run(scenario())
+    assert shed.status_code == 503
+    assert shed.headers["Retry-After"] == "3"
+    assert batch.status_code == 200 and health.status_code == 200
+    assert classes == ["bulk", "interactive"]
+    assert interactive.in_flight == 0 and bulk.in_flight == 0
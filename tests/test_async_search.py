@@ -0,0 +1,55 @@
+"""Async Exa search: timeouts cancel the request and never tie up executor threads."""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import src.services.search as search
+import src.utils.provider_clients as provider_clients_module
+from src.utils.executor_metrics import ExecutorMetrics, executor_metrics, to_thread
+
+
+def test_exa_timeout_cancels_the_request(monkeypatch):
+    state = {"cancelled": False}
+
+    async def slow_search_and_contents(claim, num_results, text):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            state["cancelled"] = True
+            raise
+        return SimpleNamespace(results=[])
+
+    monkeypatch.setattr(search, "EVIDENCE_INDEX_ENABLED", False)
+    monkeypatch.setattr(provider_clients_module, "EXA_API_KEY", "test-key")  # the SDK refuses to build without one
+    monkeypatch.setattr(search.provider_clients.get("exa"), "search_and_contents", slow_search_and_contents)
+
+    before = executor_metrics.stats()["in_flight"]
+    with pytest.raises(Exception, match="timed out"):
+        asyncio.run(search.search_and_retrieve_sources("claim", timeout_seconds=0.05))
+    assert state["cancelled"]
+    assert executor_metrics.stats()["in_flight"] == before
+
+
+def test_exa_uses_shared_pooled_client(monkeypatch):
+    monkeypatch.setattr(provider_clients_module, "EXA_API_KEY", "test-key")
+    exa = search.provider_clients.get("exa")
+    assert exa.client is search.http_clients.get("exa")
+    assert str(exa.client.base_url).startswith("https://api.exa.ai")
+
+
+def test_to_thread_tracks_occupancy(monkeypatch):
+    metrics = ExecutorMetrics(max_workers=4)
+    monkeypatch.setattr("src.utils.executor_metrics.executor_metrics", metrics)
+
+    async def main():
+        seen = []
+        result = await to_thread(lambda: seen.append(metrics.stats()) or 42)
+        return result, seen[0]
+
+    result, during = asyncio.run(main())
+    assert result == 42
+    assert during["running"] == 1 and during["in_flight"] == 1
+    after = metrics.stats()
+    assert after["running"] == 0 and after["in_flight"] == 0 and after["completed"] == 1
+    assert after["peak_in_flight"] == 1
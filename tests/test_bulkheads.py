@@ -0,0 +1,98 @@
+"""Provider-slot bulkheads: bulk traffic cannot take the slots reserved for interactive calls."""
+import asyncio
+
+from src.utils.bulkheads import BULK, INTERACTIVE, ProviderBulkheads, ProviderSlots, traffic_class
+
+
+def test_bulk_is_capped_below_capacity_and_interactive_uses_the_reserve():
+    async def scenario():
+        slots = ProviderSlots(capacity=3, reserved=1)
+        await slots.acquire(BULK)
+        await slots.acquire(BULK)
+        blocked_bulk = asyncio.create_task(slots.acquire(BULK))
+        await asyncio.sleep(0)
+        assert not blocked_bulk.done()
+        # The reserved slot is still free for interactive traffic
+        assert await slots.acquire(INTERACTIVE) == 0.0
+        blocked_interactive = asyncio.create_task(slots.acquire(INTERACTIVE))
+        await asyncio.sleep(0)
+        assert not blocked_interactive.done()
+
+        # A bulk slot frees: the queued bulk call (oldest) gets it
+        slots.release(BULK)
+        await asyncio.sleep(0)
+        assert blocked_bulk.done() and not blocked_interactive.done()
+        # The interactive slot frees: the queued interactive call gets it
+        slots.release(INTERACTIVE)
+        await asyncio.sleep(0)
+        assert blocked_interactive.done()
+        return slots.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["in_use"] == 3
+    assert stats["classes"]["bulk"]["in_use"] == 2
+    assert stats["classes"]["bulk"]["acquired"] == 3
+    assert stats["classes"]["interactive"]["acquired"] == 2
+    assert stats["classes"]["interactive"]["waiting"] == 0
+
+
+def test_queued_bulk_call_does_not_block_the_same_tenants_interactive_call():
+    async def scenario():
+        slots = ProviderSlots(capacity=3, reserved=1)
+        await slots.acquire(BULK, "payer")
+        await slots.acquire(BULK, "payer")
+        await slots.acquire(INTERACTIVE, "payer")
+        blocked_bulk = asyncio.create_task(slots.acquire(BULK, "payer"))
+        blocked_interactive = asyncio.create_task(slots.acquire(INTERACTIVE, "payer"))
+        await asyncio.sleep(0)
+
+        # Only an interactive slot frees: bulk is still at its cap, so the interactive call behind it gets it
+        slots.release(INTERACTIVE)
+        await asyncio.sleep(0)
+        assert blocked_interactive.done() and not blocked_bulk.done()
+        blocked_bulk.cancel()
+        await asyncio.gather(blocked_bulk, return_exceptions=True)
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_does_not_hold_up_the_fast_path():
+    async def scenario():
+        slots = ProviderSlots(capacity=2, reserved=0)
+        stale = asyncio.get_running_loop().create_future()
+        stale.cancel()  # its caller has not yet removed it from the queue
+        slots._waiters.push("payer", (INTERACTIVE, stale))
+        return await asyncio.wait_for(slots.acquire(INTERACTIVE, "payer"), timeout=1)
+
+    assert asyncio.run(scenario()) == 0.0
+
+
+def test_cancelled_waiter_leaves_the_queue():
+    async def scenario():
+        slots = ProviderSlots(capacity=1, reserved=0)
+        await slots.acquire(INTERACTIVE)
+        waiter = asyncio.create_task(slots.acquire(INTERACTIVE))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        slots.release(INTERACTIVE)
+        return slots
+
+    slots = asyncio.run(scenario())
+    assert slots.in_use == {INTERACTIVE: 0, BULK: 0}
+    assert slots.stats()["classes"]["interactive"]["waiting"] == 0
+
+
+def test_slot_uses_the_request_traffic_class():
+    bulkheads = ProviderBulkheads({"default": (4, 2)})
+
+    async def scenario():
+        token = traffic_class.set(BULK)
+        try:
+            async with bulkheads.slot("deepinfra"):
+                return bulkheads.stats()["providers"]["deepinfra"]["classes"]["bulk"]["in_use"]
+        finally:
+            traffic_class.reset(token)
+
+    assert asyncio.run(scenario()) == 1
+    assert bulkheads.stats()["providers"]["deepinfra"]["in_use"] == 0
@@ -0,0 +1,47 @@
+"""Single-pass claim classifier: label accuracy fixtures and span reporting."""
+import json
+from pathlib import Path
+
+from src.utils.claim_classifier import classify_claim, NORMATIVE, PREDICTION
+from src.utils.philosophical_filter import is_philosophical_claim
+
+FIXTURES = Path(__file__).parent / "fixtures" / "claim_classifier_cases.json"
+
+
+def test_fixture_accuracy():
+    cases = json.loads(FIXTURES.read_text(encoding="utf-8"))
+    misses = [
+        (case["claim"], sorted(classify_claim(case["claim"]).labels), case["labels"])
+        for case in cases
+        if sorted(classify_claim(case["claim"]).labels) != sorted(case["labels"])
+    ]
+    assert not misses, misses
+
+
+def test_keywords_match_whole_words_only():
+    assert not classify_claim("The firm booked goodwill impairments").is_prediction
+    assert classify_claim("The firm will book impairments").is_prediction
+
+
+def test_spans_index_into_claim():
+    claim = "Will Bitcoin hit $100k? Should we care?"
+    result = classify_claim(claim)
+    assert result.labels == {PREDICTION, NORMATIVE}
+    for span in result.spans:
+        assert claim[span.start:span.end] == span.text
+    assert [span.label for span in result.spans] == [PREDICTION, NORMATIVE]
+
+
+def test_philosophical_filter_compatibility():
+    is_philosophical, reason = is_philosophical_claim("Is capitalism inherently evil?")
+    assert is_philosophical
+    assert reason == "Normative pattern detected: 'inherently evil'"
+    assert is_philosophical_claim("The Earth orbits the Sun") == (False, "")
+
+
+if __name__ == "__main__":
+    test_fixture_accuracy()
+    test_keywords_match_whole_words_only()
+    test_spans_index_into_claim()
+    test_philosophical_filter_compatibility()
+    print("✅ Claim classifier tests passed")
@@ -0,0 +1,57 @@
+"""Connection warm-up: readiness after the first pass, probe state, configured targets."""
+import asyncio
+from types import SimpleNamespace
+
+from src.utils import connection_warmup
+from src.utils.connection_warmup import ConnectionWarmer, _reached_server
+from src.utils.provider_clients import ProviderClients
+
+
+def test_ready_only_after_the_first_pass(monkeypatch):
+    monkeypatch.setattr(connection_warmup, "provider_clients", ProviderClients({}))
+    release = asyncio.Event()
+    seen_ready = []
+
+    async def slow_probe():
+        seen_ready.append(warmer.ready)
+        await release.wait()
+
+    async def broken_probe():
+        raise ConnectionError("dns failure")
+
+    warmer = ConnectionWarmer({"deepinfra": slow_probe, "exa": broken_probe}, interval=3600, enabled=True)
+
+    async def scenario():
+        task = asyncio.create_task(warmer.run())
+        await asyncio.sleep(0.01)
+        assert not warmer.ready
+        release.set()
+        await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(scenario())
+    assert seen_ready == [False]
+    stats = warmer.stats()
+    assert stats["ready"] and stats["ready_after_seconds"] is not None
+    assert stats["targets"]["deepinfra"]["warm"]
+    assert not stats["targets"]["exa"]["warm"]
+    assert stats["targets"]["exa"]["failures"] == 1
+    assert "dns failure" in stats["targets"]["exa"]["last_error"]
+
+
+def test_disabled_warmer_is_ready_immediately():
+    assert ConnectionWarmer({}, enabled=False).ready
+
+
+def test_http_errors_count_as_reached():
+    assert _reached_server(SimpleNamespace(response=SimpleNamespace(status_code=401)))
+    assert not _reached_server(ConnectionError("reset"))
+
+
+def test_only_configured_providers_are_probed(monkeypatch):
+    for key in ("DEEPINFRA_API_KEY", "OPENAI_API_KEY", "EXA_API_KEY", "NEWSAPI_KEY", "ANTHROPIC_API_KEY", "GEMINI_API_KEY"):
+        monkeypatch.setattr(connection_warmup, key, None)
+    monkeypatch.setattr(connection_warmup, "ANTHROPIC_API_KEY", "key")
+    monkeypatch.setattr(connection_warmup, "EXA_API_KEY", "key")
+    assert set(connection_warmup.default_probes()) == {"anthropic", "exa"}
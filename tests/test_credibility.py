@@ -0,0 +1,49 @@
+"""Domain credibility trie, URL host parsing and batched recency multipliers."""
+from datetime import datetime, timedelta, timezone
+
+from src.services.credibility import DomainCredibility, domain_credibility, recency_multipliers, url_host
+from src.services.search import calculate_source_weights
+
+TABLE = DomainCredibility({
+    "wikipedia.org": {"weight": 0.5, "label": "Wikipedia"},
+    "gov": {"weight": 1.3, "label": "US government"},
+    "nih.gov": {"weight": 1.4, "label": "NIH"},
+})
+
+
+def test_url_host_strips_scheme_userinfo_port_and_path():
+    assert url_host("https://en.wikipedia.org/wiki/Paris") == "en.wikipedia.org"
+    assert url_host("http://user:pw@Example.COM:8080/a?b#c") == "example.com"
+    assert url_host("example.com.?q=1") == "example.com"
+    assert url_host("https://[::1]:8000/x") == "::1"
+
+
+def test_longest_suffix_wins():
+    assert TABLE.weight("https://en.m.wikipedia.org/wiki/X") == 0.5
+    assert TABLE.weight("https://www.cdc.gov/flu") == 1.3
+    assert TABLE.weight("https://pubmed.ncbi.nih.gov/123") == 1.4
+    # Whole labels only: no substring matches
+    assert TABLE.weight("https://notwikipedia.org/") == 1.0
+    assert TABLE.weight("https://example.com/wikipedia.org") == 1.0
+
+
+def test_labels_name_host_and_class():
+    assert TABLE.label("https://www.cdc.gov/flu") == "cdc.gov - US government"
+    assert TABLE.label("https://example.com/page") == "example.com"
+
+
+def test_recency_multipliers_batch():
+    now = datetime(2026, 1, 8, tzinfo=timezone.utc)
+    naive = now.replace(tzinfo=None)
+    dates = [naive - timedelta(hours=2), naive - timedelta(days=3), naive - timedelta(days=30), None,
+             now - timedelta(hours=24)]
+    assert recency_multipliers(dates, now=now.timestamp()) == [1.5, 1.2, 1.0, 1.0, 1.5]
+
+
+def test_calculate_source_weights_uses_shipped_table():
+    recent = datetime.utcnow() - timedelta(hours=1)
+    weights = calculate_source_weights(
+        ["https://en.wikipedia.org/wiki/X", "https://www.reuters.com/a", "https://blog.example.com"],
+        [recent, None],
+    )
+    assert weights == [0.5 * 1.5, domain_credibility.weight("https://reuters.com"), 1.0]
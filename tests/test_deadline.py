@@ -0,0 +1,42 @@
+"""Request deadlines: remaining budget, per-stage budgets and client overrides."""
+import pytest
+
+from src.utils.deadline import Deadline, timeout_kwargs
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_budget_is_capped_and_reserves_time_for_later_stages():
+    clock = FakeClock()
+    deadline = Deadline(30, clock=clock)
+    assert deadline.budget(20) == 20
+    assert deadline.budget(20, reserve=15) == 15
+    clock.now += 25
+    assert deadline.remaining() == 5
+    assert deadline.has(5) and not deadline.has(6)
+    assert deadline.budget(20, reserve=8) == 0.0
+    clock.now += 10
+    assert deadline.expired()
+    assert deadline.remaining() == 0.0
+
+
+def test_client_may_only_shorten_the_tier_deadline():
+    assert Deadline.from_client(None, 45).seconds == 45
+    assert Deadline.from_client("10", 45).seconds == 10
+    assert Deadline.from_client("120", 45).seconds == 45
+    for bad in ("soon", "0.5", "nan", "-3"):
+        with pytest.raises(ValueError):
+            Deadline.from_client(bad, 45)
+
+
+def test_timeout_kwargs():
+    assert timeout_kwargs(None) == {}
+    assert 0 < timeout_kwargs(Deadline(5))["timeout"] <= 5
+    assert timeout_kwargs(None, 7) == {"timeout": 7}
+    assert timeout_kwargs(Deadline(30), 7) == {"timeout": 7}
@@ -0,0 +1,45 @@
+"""Near-duplicate source elimination: syndicated copies collapse into one citation."""
+from datetime import datetime
+
+from src.services.dedupe import dedupe_sources, jaccard, shingle_hashes
+
+ARTICLE = (
+    "The city council voted on Tuesday to approve a new budget that raises spending on "
+    "public transit by twelve percent, the mayor said in a statement after the meeting."
+)
+SYNDICATED = "Reuters - " + ARTICLE.replace("Tuesday", "Tuesday evening")
+UNRELATED = "Scientists reported a new species of frog discovered in the rainforests of Peru this spring."
+
+
+def test_syndicated_copies_are_merged_into_first_citation():
+    result = dedupe_sources(
+        ["https://a.com/1", "https://b.com/2", "https://c.com/3"],
+        [ARTICLE, UNRELATED, SYNDICATED],
+    )
+    assert result.sources == ["https://a.com/1", "https://b.com/2"]
+    assert result.text_blobs == [ARTICLE, UNRELATED]
+    assert result.keep == [0, 1]
+    assert result.duplicates == {"https://a.com/1": ["https://c.com/3"]}
+    assert result.tokens_saved >= len(SYNDICATED) // 4
+
+
+def test_distinct_sources_are_untouched():
+    texts = [ARTICLE, UNRELATED, ""]
+    result = dedupe_sources(["u1", "u2", "u3"], texts)
+    assert result.sources == ["u1", "u2", "u3"]
+    assert result.duplicates == {}
+    assert result.tokens_saved == 0
+
+
+def test_select_keeps_aligned_lists_in_step():
+    dates = [datetime(2024, 1, d) for d in (1, 2, 3)]
+    result = dedupe_sources(["u1", "u2", "u3"], [ARTICLE, SYNDICATED, UNRELATED])
+    assert result.select(dates) == [dates[0], dates[2]]
+
+
+def test_similarity_is_symmetric_and_bounded():
+    a, b = shingle_hashes(ARTICLE), shingle_hashes(SYNDICATED)
+    assert jaccard(a, b) == jaccard(b, a)
+    assert 0.6 <= jaccard(a, b) < 1.0
+    assert jaccard(a, shingle_hashes(UNRELATED)) == 0.0
+    assert jaccard(a, set()) == 0.0
@@ -0,0 +1,66 @@
+"""Local evidence index: retrieved documents are stored and reused before hitting Exa."""
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import src.services.search as search
+import src.utils.provider_clients as provider_clients_module
+from src.services.evidence_index import EvidenceIndex
+
+CLAIM = "The Eiffel Tower was completed in 1889"
+DOCS = {
+    "https://a.com/eiffel": "The Eiffel Tower in Paris was completed in 1889 for the World's Fair.",
+    "https://b.com/tower": "Completed in 1889, the Eiffel Tower was the tallest structure in the world.",
+    "https://c.com/frogs": "A new frog species was found in Peru.",
+}
+
+
+def _index(tmp_path):
+    index = EvidenceIndex(str(tmp_path / "evidence.db"))
+    index.add(list(DOCS), list(DOCS.values()))
+    return index
+
+
+def test_lookup_returns_fresh_covering_documents(tmp_path):
+    index = _index(tmp_path)
+    docs = index.lookup(CLAIM, limit=2, max_age_seconds=3600)
+    assert {doc.url for doc in docs} == {"https://a.com/eiffel", "https://b.com/tower"}
+    assert index.stats()["hits"] == 1
+
+
+def test_lookup_misses_when_coverage_is_insufficient(tmp_path):
+    index = _index(tmp_path)
+    assert index.lookup(CLAIM, limit=3, max_age_seconds=3600) is None
+    assert index.lookup("Frogs were discovered on Mars in 1889", limit=1, max_age_seconds=3600) is None
+    assert index.lookup(CLAIM, limit=2, max_age_seconds=-1) is None
+    assert index.stats()["misses"] == 3
+
+
+def test_documents_persist_and_refresh_by_url(tmp_path):
+    _index(tmp_path)
+    reopened = EvidenceIndex(str(tmp_path / "evidence.db"))
+    published = datetime.utcnow() - timedelta(hours=2)
+    reopened.add(["https://a.com/eiffel"], ["Updated: the Eiffel Tower was completed in 1889."], [published])
+    assert reopened.stats()["documents"] == 3
+
+    docs = reopened.lookup(CLAIM, limit=1, max_age_seconds=3600, published_within_seconds=3 * 3600)
+    assert docs[0].text.startswith("Updated")
+    assert abs((docs[0].published_at - published).total_seconds()) < 1
+
+
+def test_search_answers_from_index_before_exa(tmp_path, monkeypatch):
+    exa_calls = []
+
+    async def fake_search_and_contents(claim, num_results, text):
+        exa_calls.append(claim)
+        return SimpleNamespace(results=[SimpleNamespace(url=url, text=text) for url, text in DOCS.items()][:num_results])
+
+    monkeypatch.setattr(search, "evidence_index", EvidenceIndex(str(tmp_path / "evidence.db")))
+    monkeypatch.setattr(search, "EVIDENCE_INDEX_ENABLED", True)
+    monkeypatch.setattr(provider_clients_module, "EXA_API_KEY", "test-key")  # the SDK refuses to build without one
+    monkeypatch.setattr(search.provider_clients.get("exa"), "search_and_contents", fake_search_and_contents)
+
+    first = asyncio.run(search.search_and_retrieve_sources(CLAIM, num_results=2))
+    second = asyncio.run(search.search_and_retrieve_sources(CLAIM, num_results=2))
+    assert exa_calls == [CLAIM]
+    assert set(second[0]) == set(first[0])
@@ -0,0 +1,130 @@
+"""Fair queuing: deficit round-robin across tenants, weights, and per-tenant waits."""
+import asyncio
+import base64
+import json
+from types import SimpleNamespace
+
+from config.settings import SESSION_TOKEN_HEADER
+from src.middleware.admission import as_verified_payer, request_tenant
+from src.middleware.session_auth import authenticate_session
+from src.services.sessions import session_store
+from src.utils import bulkheads
+from src.utils.bulkheads import INTERACTIVE, ProviderSlots
+from src.utils.fair_queue import DeficitRoundRobin, TenantWaits, tenant
+
+
+def _drain(queue, eligible=lambda item: True):
+    order = []
+    while True:
+        item = queue.pop(eligible)
+        if item is None:
+            return order
+        order.append(item)
+
+
+def test_round_robin_across_tenants_regardless_of_backlog():
+    queue = DeficitRoundRobin(weights={})
+    for i in range(5):
+        queue.push("heavy", f"h{i}")
+    queue.push("light", "l0")
+    queue.push("light", "l1")
+    assert _drain(queue) == ["h0", "l0", "h1", "l1", "h2", "h3", "h4"]
+    assert len(queue) == 0
+
+
+def test_weights_scale_the_share():
+    queue = DeficitRoundRobin(weights={"premium": 2.0})
+    for i in range(4):
+        queue.push("premium", f"p{i}")
+        queue.push("basic", f"b{i}")
+    assert _drain(queue)[:6] == ["p0", "p1", "b0", "p2", "p3", "b1"]
+
+
+def test_ineligible_items_are_skipped_and_removable():
+    queue = DeficitRoundRobin(weights={})
+    queue.push("a", "bulk-1")
+    queue.push("b", "interactive-1")
+    assert queue.pop(lambda item: item.startswith("interactive")) == "interactive-1"
+    assert queue.pop(lambda item: item.startswith("interactive")) is None
+    assert queue.remove("a", "bulk-1")
+    assert not queue.remove("a", "bulk-1")
+    assert len(queue) == 0
+
+
+def test_ineligible_head_does_not_block_the_same_tenants_eligible_items():
+    queue = DeficitRoundRobin(weights={})
+    queue.push("a", "bulk-1")
+    queue.push("a", "interactive-1")
+    assert queue.pop(lambda item: item.startswith("interactive")) == "interactive-1"
+    assert queue.pop() == "bulk-1"
+
+
+def test_light_tenant_is_not_stuck_behind_a_heavy_one(monkeypatch):
+    monkeypatch.setattr(bulkheads, "tenant_waits", TenantWaits())
+
+    async def scenario():
+        slots = ProviderSlots(capacity=1, reserved=0)
+        await slots.acquire(INTERACTIVE, "heavy")
+        granted = []
+
+        async def call(tenant_key, name):
+            await slots.acquire(INTERACTIVE, tenant_key)
+            granted.append(name)
+
+        heavy = [asyncio.create_task(call("heavy", f"h{i}")) for i in range(10)]
+        await asyncio.sleep(0)
+        light = asyncio.create_task(call("light", "l0"))
+        await asyncio.sleep(0)
+        for _ in range(2):
+            slots.release(INTERACTIVE)
+            await asyncio.sleep(0)
+        for task in heavy:
+            task.cancel()
+        await asyncio.gather(*heavy, light, return_exceptions=True)
+        return granted
+
+    assert asyncio.run(scenario()) == ["h0", "l0"]
+
+
+def _payment_header(payer):
+    payload = {"payload": {"authorization": {"from": payer}}}
+    return base64.b64encode(json.dumps(payload).encode()).decode()
+
+
+def test_unverified_payment_header_does_not_pick_the_tenant():
+    client = SimpleNamespace(host="203.0.113.5")
+    request = SimpleNamespace(headers={"X-PAYMENT": _payment_header("0xABCdef")}, client=client)
+    assert request_tenant(request) == "ip:203.0.113.5"
+
+
+def test_verified_payer_and_session_become_the_tenant():
+    seen = []
+
+    async def call_next(request):
+        seen.append(tenant.get())
+
+    async def scenario():
+        paid = SimpleNamespace(headers={"X-PAYMENT": _payment_header("0xABCdef")})
+        await as_verified_payer(call_next)(paid)
+
+        token = session_store.create(credits=1)["session_token"]
+        session = SimpleNamespace(
+            headers={SESSION_TOKEN_HEADER: token}, url=SimpleNamespace(path="/verify"), state=SimpleNamespace()
+        )
+        await authenticate_session(session, call_next)
+        return session.state.session_id
+
+    session_id = asyncio.run(scenario())
+    assert seen == ["0xabcdef", f"session:{session_id}"]
+    assert tenant.get() == "internal"  # reset once the request is done
+
+
+def test_tenant_wait_stats_keep_the_most_recent_tenants():
+    waits = TenantWaits(max_tenants=2)
+    waits.record("a", 0.1)
+    waits.record("b", 0.2)
+    waits.record("a", 0.3)
+    waits.record("c", 0.0)
+    stats = waits.stats()
+    assert set(stats) == {"a", "c"}
+    assert stats["a"]["calls"] == 2 and stats["a"]["max_wait_ms"] == 300.0
@@ -0,0 +1,90 @@
+"""Offline provider stand-ins: response shapes, injected failures, and FAKE_PROVIDERS_URL wiring."""
+import asyncio
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import httpx
+
+from scripts.fake_providers import FakeProvider, create_app, load_profile
+
+QUIET = {"median_ms": 0, "error_rate": 0.0, "rate_limit_rate": 0.0}
+
+
+def _profile(**overrides):
+    profile = load_profile()
+    for provider in ("deepinfra", "openai", "anthropic", "gemini", "exa", "newsapi"):
+        profile[provider].update(QUIET)
+    for provider, settings in overrides.items():
+        profile[provider].update(settings)
+    return profile
+
+
+def _call(profile, method, path, **kwargs):
+    async def request():
+        transport = httpx.ASGITransport(app=create_app(profile, latency_scale=0, seed=7))
+        async with httpx.AsyncClient(transport=transport, base_url="http://fake") as client:
+            return await client.request(method, path, **kwargs)
+
+    return asyncio.run(request())
+
+
+def test_model_answers_have_the_shape_each_agent_expects():
+    quick = _call(_profile(quick_check={"escalate_rate": 0.0}), "POST", "/deepinfra/v1/openai/chat/completions", json={
+        "model": "m", "max_tokens": 50,
+        "messages": [{"role": "user", "content": "source_stances must contain exactly 3 entries"}],
+    }).json()
+    answer = json.loads(quick["choices"][0]["message"]["content"])
+    assert answer["source_stances"] == ["supports"] * 3 and answer["confidence_score"] > 0.9
+    assert quick["usage"]["completion_tokens"] <= 50
+
+    judge = _call(_profile(), "POST", "/anthropic/v1/messages", json={
+        "model": "claude", "max_tokens": 400,
+        "system": [{"type": "text", "text": 'Reply as {"verdict": ...}'}],
+        "messages": [{"role": "user", "content": "debate transcript"}],
+    }).json()
+    assert json.loads(judge["content"][0]["text"])["verdict"] == "Verified"
+    assert judge["usage"]["input_tokens"] > 0 and judge["usage"]["cache_read_input_tokens"] == 0
+
+
+def test_search_providers_return_the_requested_documents():
+    exa = _call(_profile(), "POST", "/exa/search", json={"query": "Bitcoin was launched in 2009", "numResults": 4}).json()
+    assert len(exa["results"]) == 4
+    assert len({result["url"] for result in exa["results"]}) == 4
+
+    news = _call(_profile(), "GET", "/newsapi/v2/everything", params={"q": "Bitcoin", "pageSize": 3}).json()
+    assert news["status"] == "ok" and len(news["articles"]) == 3
+
+
+def test_injected_failures_use_each_providers_status():
+    overloaded = _call(_profile(anthropic={"error_rate": 1.0}), "POST", "/anthropic/v1/messages",
+                       json={"model": "claude", "messages": []})
+    assert overloaded.status_code == 529
+    assert overloaded.json()["error"]["type"] == "overloaded_error"
+
+    limited = _call(_profile(deepinfra={"rate_limit_rate": 1.0}), "POST", "/deepinfra/v1/openai/chat/completions",
+                    json={"model": "m", "messages": []})
+    assert limited.status_code == 429 and limited.headers["retry-after"] == "1"
+
+
+def test_latency_is_lognormal_around_the_profile():
+    provider = FakeProvider("exa", {"median_ms": 1000, "p99_ms": 5000}, random.Random(3))
+    draws = sorted(provider.latency() for _ in range(20000))
+    assert math.isclose(draws[len(draws) // 2], 1.0, rel_tol=0.05)
+    assert math.isclose(draws[int(len(draws) * 0.99)], 5.0, rel_tol=0.15)
+
+
+def test_fake_providers_url_redirects_every_provider():
+    env = dict(os.environ, FAKE_PROVIDERS_URL="http://127.0.0.1:9100/")
+    script = (
+        "import json; from config import settings as s; print(json.dumps([s.DEEPINFRA_BASE_URL, s.OPENAI_BASE_URL,"
+        " s.ANTHROPIC_BASE_URL, s.GEMINI_BASE_URL, s.EXA_BASE_URL, s.NEWSAPI_URL, s.QUOTA_LIMITS]))"
+    )
+    output = subprocess.run([sys.executable, "-c", script], env=env, cwd=Path(__file__).resolve().parent.parent, capture_output=True, text=True, check=True)
+    *urls, quotas = json.loads(output.stdout.strip().splitlines()[-1])
+    assert all(url.startswith("http://127.0.0.1:9100/") for url in urls)
+    assert quotas == {}
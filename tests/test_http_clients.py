@@ -0,0 +1,53 @@
+"""Outbound HTTP client registry: one pooled client per upstream, shared lifecycle."""
+import asyncio
+
+import httpx
+
+from src.utils.http_clients import HttpClientRegistry
+
+LIMITS = {
+    "default": {"max_connections": 3, "max_keepalive_connections": 1, "timeout_seconds": 5},
+    "newsapi": {"max_connections": 7, "max_keepalive_connections": 2, "timeout_seconds": 5},
+}
+
+
+def test_clients_are_shared_and_recreated_after_close():
+    registry = HttpClientRegistry(LIMITS, http2=False)
+    first = registry.get("newsapi")
+    assert registry.get("newsapi") is first
+
+    asyncio.run(registry.aclose())
+    assert first.is_closed
+    assert registry.get("newsapi") is not first
+
+
+def test_start_creates_configured_clients_with_options():
+    registry = HttpClientRegistry(LIMITS, http2=False)
+    registry.configure("exa", base_url="https://api.exa.ai", headers={"x-api-key": "k"})
+    asyncio.run(registry.start())
+
+    stats = registry.stats()
+    assert set(stats["clients"]) == {"newsapi", "exa"}
+    assert stats["clients"]["newsapi"]["max_connections"] == 7
+    assert stats["clients"]["exa"]["max_connections"] == 3  # falls back to default
+    assert registry.get("exa").headers["x-api-key"] == "k"
+
+
+def test_requests_reuse_the_pool_and_are_counted():
+    registry = HttpClientRegistry(LIMITS, http2=False)
+
+    def handler(request):
+        return httpx.Response(200, json={"ok": True})
+
+    # Swap in a mock transport on a client built with the registry's hooks
+    client = registry.get("newsapi")
+    client._transport = httpx.MockTransport(handler)
+
+    async def main():
+        for _ in range(3):
+            response = await client.get("https://newsapi.org/v2/everything")
+            assert response.json() == {"ok": True}
+        await registry.aclose()
+
+    asyncio.run(main())
+    assert registry._requests["newsapi"] == 3
@@ -0,0 +1,153 @@
+"""LLM gateway: role routing, fallback, hedging, streaming and uniform token accounting."""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.agents.prompts import PROVER, build_agent_prompt
+from src.llm.adapters import (
+    AnthropicAdapter, CallSettings, LLMResult, OpenAICompatibleAdapter, ProviderAdapter
+)
+from src.llm.gateway import LLMGateway, LLMUnavailable
+from src.utils.adaptive_timeouts import adaptive_timeouts
+from src.utils.deadline import Deadline
+from src.utils.provider_clients import ProviderClients
+from src.utils.token_tracker import token_tracker
+
+PROMPT = build_agent_prompt(PROVER, "claim", ["source"])
+
+
+class FakeAdapter(ProviderAdapter):
+    """Answers after `delay` seconds, or raises `error`; records the models it was asked for."""
+
+    def __init__(self, provider, delay=0.0, error=None):
+        self.provider = provider
+        self.delay = delay
+        self.error = error
+        self.models = []
+        self.cancelled = False
+
+    async def complete(self, client, model, prompt, settings, timeout):
+        self.models.append(model)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error:
+            raise self.error
+        return LLMResult(text=f"{self.provider} says", provider=self.provider, model=model,
+                         input_tokens=100, output_tokens=20, cached_input_tokens=40)
+
+    async def stream(self, client, model, prompt, settings, timeout, result):
+        if self.error:
+            raise self.error
+        for word in ("streamed ", "answer"):
+            result.text += word
+            yield word
+        result.input_tokens, result.output_tokens = 100, 2
+
+
+def _gateway(adapters, chain, **kwargs):
+    return LLMGateway(
+        routes={"prover": {"chain": chain, "max_tokens": 50, "hedge": True}},
+        adapters={adapter.provider: adapter for adapter in adapters},
+        clients=ProviderClients({adapter.provider: object for adapter in adapters}),
+        **kwargs
+    )
+
+
+def test_falls_back_along_the_chain_and_tracks_the_role():
+    primary = FakeAdapter("gw-primary", error=ValueError("bad request"))
+    fallback = FakeAdapter("gw-fallback")
+    gateway = _gateway([primary, fallback], [("gw-primary", "big"), ("gw-fallback", "gpt-4o-mini")])
+    token_tracker.reset()
+
+    result = asyncio.run(gateway.complete("prover", PROMPT, model="tier-model"))
+
+    assert result.text == "gw-fallback says"
+    assert primary.models == ["tier-model"]  # the tier override replaces the primary model only
+    assert token_tracker.get_all()["prover"] == {
+        "model": "gpt-4o-mini", "input": 100, "output": 20, "cached_input": 40, "cache_write": 0
+    }
+    stats = gateway.stats()
+    assert stats["roles"]["prover"] == {"calls": 1, "failed": 0, "fallbacks": 1, "hedged": 0, "hedge_wins": 0}
+    assert stats["models"]["gw-fallback/gpt-4o-mini"]["calls"] == 1
+    assert stats["models"]["gw-fallback/gpt-4o-mini"]["cost_usd"] > 0
+
+
+def test_raises_when_the_chain_is_exhausted_or_the_deadline_is_short():
+    primary = FakeAdapter("gw-down", error=ValueError("bad request"))
+    fallback = FakeAdapter("gw-spare")
+    gateway = _gateway([primary, fallback], [("gw-down", "m"), ("gw-spare", "m")])
+
+    with pytest.raises(LLMUnavailable) as e:
+        asyncio.run(gateway.complete("prover", PROMPT, deadline=Deadline(1)))
+    assert "gw-down: bad request" in str(e.value)
+    assert fallback.models == []  # 1s left is below DEADLINE_MIN_FALLBACK_SECONDS
+    assert gateway.stats()["roles"]["prover"]["failed"] == 1
+
+
+def test_slow_primary_is_hedged_to_the_next_model():
+    for _ in range(adaptive_timeouts.min_samples):
+        adaptive_timeouts.record("gw-slow", "m", 0.01)
+    slow = FakeAdapter("gw-slow", delay=5)
+    fast = FakeAdapter("gw-fast")
+    gateway = _gateway([slow, fast], [("gw-slow", "m"), ("gw-fast", "m")], hedging=True, hedge_min_delay=0.02)
+
+    result = asyncio.run(gateway.complete("prover", PROMPT))
+
+    assert result.provider == "gw-fast"
+    assert slow.cancelled  # the loser gives its slot and quota back
+    assert gateway.stats()["roles"]["prover"]["hedged"] == 1
+    assert gateway.stats()["roles"]["prover"]["hedge_wins"] == 1
+
+
+def test_no_hedge_without_latency_history():
+    slow = FakeAdapter("gw-unseen", delay=0.05)
+    fast = FakeAdapter("gw-unused")
+    gateway = _gateway([slow, fast], [("gw-unseen", "m"), ("gw-unused", "m")], hedging=True, hedge_min_delay=0.0)
+
+    assert asyncio.run(gateway.complete("prover", PROMPT)).provider == "gw-unseen"
+    assert fast.models == []
+
+
+def test_stream_falls_back_before_the_first_chunk_and_accounts_tokens():
+    broken = FakeAdapter("gw-broken", error=ConnectionError("refused"))
+    streaming = FakeAdapter("gw-stream")
+    gateway = _gateway([broken, streaming], [("gw-broken", "m"), ("gw-stream", "m")])
+    token_tracker.reset()
+
+    async def collect():
+        return [chunk async for chunk in gateway.stream("prover", PROMPT)]
+
+    assert asyncio.run(collect()) == ["streamed ", "answer"]
+    assert token_tracker.get_all()["prover"]["output"] == 2
+    assert gateway.stats()["models"]["gw-stream/m"]["calls"] == 1
+
+
+def test_adapters_normalize_usage():
+    async def openai_create(**kwargs):
+        assert kwargs["response_format"] == {"type": "json_object"} and kwargs["timeout"] == 3
+        usage = SimpleNamespace(prompt_tokens=10, completion_tokens=5,
+                                prompt_tokens_details=SimpleNamespace(cached_tokens=4))
+        return SimpleNamespace(usage=usage, choices=[SimpleNamespace(message=SimpleNamespace(content="{}"))])
+
+    async def anthropic_create(**kwargs):
+        assert kwargs["system"] and "cache_control" not in str(kwargs["messages"])
+        usage = SimpleNamespace(input_tokens=10, output_tokens=5, cache_read_input_tokens=30, cache_creation_input_tokens=2)
+        return SimpleNamespace(usage=usage, content=[SimpleNamespace(text="verdict")])
+
+    openai_client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=openai_create)))
+    anthropic_client = SimpleNamespace(messages=SimpleNamespace(create=anthropic_create))
+
+    openai_result = asyncio.run(OpenAICompatibleAdapter("openai").complete(
+        openai_client, "gpt-4o-mini", PROMPT, CallSettings(max_tokens=10, json=True), {"timeout": 3}
+    ))
+    anthropic_result = asyncio.run(AnthropicAdapter().complete(
+        anthropic_client, "claude", PROMPT, CallSettings(max_tokens=10), {}
+    ))
+
+    assert (openai_result.input_tokens, openai_result.output_tokens, openai_result.cached_input_tokens) == (10, 5, 4)
+    assert anthropic_result.text == "verdict"
+    assert (anthropic_result.input_tokens, anthropic_result.cached_input_tokens, anthropic_result.cache_write_tokens) == (42, 30, 2)
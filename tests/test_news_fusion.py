@@ -0,0 +1,102 @@
+"""News retrieval: NewsAPI and Exa run concurrently and are fused by reciprocal rank."""
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+import src.services.search as search
+from src.services.search import NewsDocument, normalize_url, reciprocal_rank_fusion
+
+NOW = datetime.utcnow()
+
+
+def _doc(url, hours_old=1, origin="newsapi", text="text"):
+    return NewsDocument(url, text, NOW - timedelta(hours=hours_old) if hours_old is not None else None, origin)
+
+
+def test_normalize_url_ignores_scheme_www_tracking_and_slash():
+    assert normalize_url("https://www.Example.com/story/?utm_source=x&id=3#top") == \
+        normalize_url("http://example.com/story?id=3")
+
+
+def test_rrf_merges_duplicates_and_ranks_agreement_first():
+    newsapi = [_doc("https://a.com/1"), _doc("https://b.com/2"), _doc("https://c.com/3")]
+    exa = [_doc("https://www.c.com/3/", hours_old=5, origin="exa", text="longer exa text"), _doc("https://d.com/4", origin="exa")]
+    fused = reciprocal_rank_fusion([newsapi, exa])
+
+    assert [normalize_url(d.url) for d in fused][0] == "//c.com/3"
+    assert len(fused) == 4
+    merged = fused[0]
+    assert merged.text == "longer exa text"
+    assert merged.published_at == NOW - timedelta(hours=5)  # earliest known date
+
+
+def _install(monkeypatch, newsapi, exa):
+    monkeypatch.setattr(search, "EVIDENCE_INDEX_ENABLED", False)
+    monkeypatch.setattr(search, "NEWSAPI_KEY", "key")
+    monkeypatch.setattr(search, "_fetch_newsapi", newsapi)
+    monkeypatch.setattr(search, "_fetch_exa_news", exa)
+
+
+def test_newsapi_outage_costs_max_not_sum(monkeypatch):
+    async def failing_newsapi(claim, timeout_seconds, num_results):
+        await asyncio.sleep(0.2)
+        raise RuntimeError("newsapi down")
+
+    async def exa(claim, timeout_seconds, num_results):
+        await asyncio.sleep(0.2)
+        return [_doc("https://e.com/1", hours_old=None, origin="exa")]
+
+    _install(monkeypatch, failing_newsapi, exa)
+    start = time.perf_counter()
+    sources, texts, dates = asyncio.run(search.search_news_sources("claim", timeout_seconds=2))
+    assert time.perf_counter() - start < 0.35
+    assert sources == ["https://e.com/1"]
+    assert dates == [None]  # no fake "now" date for undated Exa results
+
+
+def test_early_return_cancels_slow_provider(monkeypatch):
+    state = {"cancelled": False}
+
+    async def fast_newsapi(claim, timeout_seconds, num_results):
+        return [_doc(f"https://n.com/{i}") for i in range(3)]
+
+    async def slow_exa(claim, timeout_seconds, num_results):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            state["cancelled"] = True
+            raise
+
+    _install(monkeypatch, fast_newsapi, slow_exa)
+    sources, _, dates = asyncio.run(search.search_news_sources("claim", timeout_seconds=10))
+    assert len(sources) == 3
+    assert state["cancelled"]
+    assert all(d.tzinfo is None for d in dates)
+
+
+def test_timeout_bounds_the_whole_fan_out(monkeypatch):
+    async def newsapi(claim, timeout_seconds, num_results):
+        await asyncio.sleep(0.2)
+        return [_doc("https://n.com/1", hours_old=100)]  # too stale to return early on
+
+    async def hung_exa(claim, timeout_seconds, num_results):
+        await asyncio.sleep(5)
+
+    _install(monkeypatch, newsapi, hung_exa)
+    start = time.perf_counter()
+    sources, _, _ = asyncio.run(search.search_news_sources("claim", timeout_seconds=0.3))
+    assert time.perf_counter() - start < 0.45  # not 0.2 + a fresh 0.3
+    assert sources == ["https://n.com/1"]
+
+
+def test_all_providers_failing_raises(monkeypatch):
+    async def failing(claim, timeout_seconds, num_results):
+        raise RuntimeError("down")
+
+    _install(monkeypatch, failing, failing)
+    try:
+        asyncio.run(search.search_news_sources("claim"))
+    except Exception as e:
+        assert "every provider" in str(e)
+    else:
+        raise AssertionError("expected failure")
@@ -0,0 +1,40 @@
+"""Passage extraction: fill the per-source budget with claim-relevant chunks, not the page head."""
+from src.services.passages import bm25_scores, chunk_text, extract_passages
+
+BOILERPLATE = "Home | News | Sport | Weather | Subscribe | Sign in. " * 6
+RELEVANT = "The Eiffel Tower was completed in 1889 for the World's Fair in Paris."
+PAGE = BOILERPLATE + "Other stories today cover the local elections. " + RELEVANT + " Tickets are sold online."
+
+
+def test_relevant_passage_beats_page_head():
+    excerpt = extract_passages("When was the Eiffel Tower completed?", [PAGE], 120)[0]
+    assert "completed in 1889" in excerpt
+    assert "Subscribe" not in excerpt
+    assert len(excerpt) <= 120
+
+
+def test_short_or_unmatched_documents_keep_leading_text():
+    short = "Eiffel Tower facts."
+    unrelated = "Nothing here matches. " * 20
+    excerpts = extract_passages("Eiffel Tower height", [short, unrelated], 50)
+    assert excerpts == [short, unrelated[:50]]
+
+
+def test_excerpts_stay_aligned_and_in_document_order():
+    doc = "Paris is in France. " * 10 + "The tower is 330 metres tall. " + "Filler text. " * 10 + "Paris tower lights."
+    excerpts = extract_passages("How tall is the Paris tower?", [PAGE, doc], 240)
+    assert len(excerpts) == 2
+    second = excerpts[1]
+    assert second.index("330 metres") < second.index("Paris tower lights")
+    assert not second.startswith("Paris is in France. Paris is in France. Paris is in France.")
+
+
+def test_chunks_respect_size_and_keep_text():
+    chunks = chunk_text(PAGE, 80)
+    assert all(len(c) <= 80 for c in chunks)
+    assert "".join(chunks).replace(" ", "") == PAGE.replace(" ", "")
+
+
+def test_bm25_prefers_chunks_with_rarer_query_terms():
+    scores = bm25_scores("eiffel tower 1889", ["the tower in paris", "eiffel tower built 1889", "weather today"])
+    assert scores[1] > scores[0] > scores[2] == 0.0
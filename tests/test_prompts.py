@@ -0,0 +1,88 @@
+"""Shared prompt layout: one prefix for every agent, role instructions in the tail, cached-token pricing."""
+import os
+from types import SimpleNamespace
+
+from performance_log import PerformanceLogger
+from src.agents.prompts import PROVER, DEBUNKER, QUICK_CHECK, build_agent_prompt, build_judge_prompt
+from src.llm.adapters import openai_cached_tokens
+
+CLAIM = "The Eiffel Tower is in Paris"
+SOURCES = ["The Eiffel Tower is a landmark in Paris.", "Paris, France is home to the Eiffel Tower."]
+
+
+def test_evidence_block_is_identical_for_every_agent():
+    prompts = [build_agent_prompt(role, CLAIM, SOURCES) for role in (PROVER, DEBUNKER, QUICK_CHECK)]
+    prompts.append(build_judge_prompt(CLAIM, SOURCES, [0.5, 1.0], "for", "against"))
+
+    assert len({p.evidence for p in prompts}) == 1
+    for prompt in prompts:
+        user = prompt.openai_messages()[1]["content"]
+        assert user.startswith(prompt.evidence)
+
+
+def test_system_prefix_does_not_depend_on_request():
+    first = build_judge_prompt(CLAIM, SOURCES, [1.0, 1.0], "a", "b")
+    second = build_judge_prompt(
+        "Water boils at 100C", ["Other source"], [0.5], "c", "d", source_labels=["en.wikipedia.org - Wikipedia"]
+    )
+    assert first.system == second.system
+    assert "Source 1: 0.5x weight (en.wikipedia.org - Wikipedia)" in second.task
+    assert "Source 2: 1x weight\n" in first.task
+
+
+def test_prover_debunker_and_judge_share_a_prefix_through_the_evidence():
+    for is_prediction in (False, True):
+        texts = [build_agent_prompt(role, CLAIM, SOURCES, is_prediction).as_text() for role in (PROVER, DEBUNKER, QUICK_CHECK)]
+        judge = build_judge_prompt(CLAIM, SOURCES, [1.0, 1.0], "for", "against", is_prediction=is_prediction)
+        texts.append(judge.as_text())
+
+        shared = os.path.commonprefix(texts)
+        assert shared.startswith(judge.system)
+        assert f"{judge.system}\n\n{judge.evidence}" in shared
+        messages = [build_agent_prompt(role, CLAIM, SOURCES, is_prediction).openai_messages() for role in (PROVER, DEBUNKER)]
+        assert messages[0][0] == messages[1][0]
+        assert os.path.commonprefix([m[1]["content"] for m in messages]).startswith(judge.evidence)
+
+
+def test_role_instructions_live_in_the_task_tail():
+    prover = build_agent_prompt(PROVER, CLAIM, SOURCES)
+    judge = build_judge_prompt(CLAIM, SOURCES, [1.0, 1.0], "for", "against", is_prediction=True)
+    assert "PROVE the claim" in prover.task and "PROVE" not in prover.system
+    assert judge.task.index("Prediction Analyst") < judge.task.index("OPTIMIST'S ARGUMENT (arguing")
+
+
+def test_anthropic_request_has_no_cache_breakpoints():
+    # The judge is the only Anthropic call per request: a cache write would never be read
+    request = build_judge_prompt(CLAIM, SOURCES, [1.0, 1.0], "for", "against", is_prediction=True).anthropic_request()
+    evidence, task = request["messages"][0]["content"]
+    assert "cache_control" not in str(request)
+    assert evidence["text"].startswith("PREDICTION:")
+    assert "OPTIMIST'S ARGUMENT" in task["text"]
+
+
+def test_openai_cached_tokens_reads_usage_details():
+    usage = SimpleNamespace(prompt_tokens=100, prompt_tokens_details=SimpleNamespace(cached_tokens=64))
+    assert openai_cached_tokens(usage) == 64
+    assert openai_cached_tokens(SimpleNamespace(prompt_tokens=100)) == 0
+    assert openai_cached_tokens(SimpleNamespace(prompt_tokens_details=None)) == 0
+
+
+def test_cached_tokens_are_billed_at_cache_rates():
+    model = "claude-3-5-haiku-20241022"
+    full = PerformanceLogger.calculate_cost(model, 2_000_000, 0)
+    cached = PerformanceLogger.calculate_cost(model, 2_000_000, 0, cached_input_tokens=1_000_000)
+    assert full == 2.0
+    assert round(cached, 6) == 1.08
+
+    # Models without a cache rate fall back to the normal input price
+    deepseek = "deepseek-ai/DeepSeek-V3"
+    assert PerformanceLogger.calculate_cost(deepseek, 1_000_000, 0, cached_input_tokens=500_000) == \
+        PerformanceLogger.calculate_cost(deepseek, 1_000_000, 0)
+
+
+def test_judge_is_told_which_argument_is_missing():
+    complete = build_judge_prompt(CLAIM, SOURCES, [1.0, 1.0], "for", "against")
+    partial = build_judge_prompt(CLAIM, SOURCES, [1.0, 1.0], "[none]", "against", missing_arguments=[PROVER])
+    assert "MISSING" not in complete.task
+    assert "PROVER'S ARGUMENT is MISSING" in partial.task
+    assert partial.evidence == complete.evidence  # cache prefix unaffected
@@ -0,0 +1,66 @@
+"""Provider SDK clients: built lazily, once, and prewarmed without raising."""
+import asyncio
+import subprocess
+import sys
+
+from src.utils.provider_clients import ProviderClients
+
+
+def _registry(calls):
+    def build(name):
+        def factory():
+            calls.append(name)
+            if name == "broken":
+                raise RuntimeError("no key")
+            return object()
+        return factory
+    return ProviderClients({name: build(name) for name in ("deepinfra", "exa", "broken")})
+
+
+def test_clients_are_built_on_first_use_only():
+    calls = []
+    registry = _registry(calls)
+    assert calls == []
+    first = registry.get("deepinfra")
+    assert asyncio.run(registry.aget("deepinfra")) is first
+    assert calls == ["deepinfra"]
+    assert registry.stats()["initialized"] == ["deepinfra"]
+
+
+def test_prewarm_builds_everything_and_logs_failures():
+    calls = []
+    registry = _registry(calls)
+    asyncio.run(registry.prewarm())
+    stats = registry.stats()
+    assert stats["initialized"] == ["deepinfra", "exa"]
+    assert stats["pending"] == ["broken"]
+    assert set(stats["init_ms"]) == {"deepinfra", "exa"}
+
+
+def test_importing_the_app_does_not_import_provider_sdks():
+    code = (
+        "import sys, src.app; "
+        "print(','.join(m for m in ('openai', 'anthropic', 'google.genai', 'exa_py') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ""
+
+
+def test_agents_await_the_lazily_built_client(monkeypatch):
+    from types import SimpleNamespace
+
+    from src.agents import debunker, prover, quick_check
+    from src.llm import llm_gateway
+
+    async def create(**kwargs):
+        usage = SimpleNamespace(prompt_tokens=10, completion_tokens=5, prompt_tokens_details=None)
+        content = '{"verdict": "Verified", "confidence_score": 0.9, "source_stances": ["supports"]}'
+        return SimpleNamespace(usage=usage, choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+    fake = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    registry = ProviderClients({"deepinfra": lambda: fake, "openai": lambda: fake})
+    monkeypatch.setattr(llm_gateway, "clients", registry)
+
+    assert asyncio.run(prover.run_prover_agent("claim", ["source"])).startswith('{"verdict"')
+    assert asyncio.run(debunker.run_debunker_agent("claim", ["source"])).startswith('{"verdict"')
+    assert asyncio.run(quick_check.run_quick_check_agent("claim", ["source"]))["verdict"] == "Verified"
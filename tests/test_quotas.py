@@ -0,0 +1,121 @@
+"""Provider quotas: RPM/TPM buckets, brief queuing, and rate-limit headers."""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils.quotas import (
+    ProviderQuota, QuotaExhausted, QuotaManager, TokenBucket, parse_reset, usage_tokens
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 50.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_parse_reset_formats():
+    assert parse_reset("2") == 2.0
+    assert parse_reset("6m0s") == 360.0
+    assert parse_reset("1m30.5s") == 90.5
+    assert parse_reset("20ms") == pytest.approx(0.02)
+    assert parse_reset("2030-01-01T00:00:10Z", now=1893456000.0) == 10.0
+    assert parse_reset("Tue, 01 Jan 2030 00:00:05 GMT", now=1893456000.0) == 5.0
+    assert parse_reset("soon") is None
+    assert parse_reset(None) is None
+
+
+def test_bucket_refills_continuously_and_can_go_into_debt():
+    clock = FakeClock()
+    bucket = TokenBucket(60, clock=clock)
+    bucket.take(60)
+    assert bucket.wait_for(1) == pytest.approx(1.0)
+    bucket.take(2)
+    assert bucket.wait_for(1) == pytest.approx(3.0)
+    clock.now += 3
+    assert bucket.wait_for(1) == 0.0
+    clock.now += 600
+    assert bucket.tokens <= 60 and bucket.wait_for(60) == 0.0
+
+
+def test_headers_lower_buckets_and_429_blocks():
+    clock = FakeClock()
+    quota = ProviderQuota("openai", "gpt-4o-mini", rpm=500, tpm=200_000, clock=clock)
+    quota.observe({"x-ratelimit-remaining-requests": "0", "x-ratelimit-reset-requests": "2s",
+                   "x-ratelimit-remaining-tokens": "1000"})
+    assert quota.wait_for(1) == pytest.approx(2.0)
+    assert quota.tpm.tokens == 1000
+    quota.observe({"retry-after": "7"}, status_code=429)
+    assert quota.wait_for(1) == pytest.approx(7.0)
+    assert quota.stats()["rate_limited"] == 1
+    clock.now += 7
+    assert quota.wait_for(10) == 0.0
+
+
+def test_reserve_waits_briefly_then_settles_actual_usage():
+    manager = QuotaManager({"deepinfra": {"rpm": 600, "tpm": 10_000}}, max_wait=1.0)
+
+    async def scenario():
+        quota = manager.get("deepinfra", "m")
+        quota.rpm.take(600)  # empty: the next request waits ~0.1s
+        async with manager.reserve("deepinfra", "m", 500) as reservation:
+            reservation.settle(SimpleNamespace(prompt_tokens=100, completion_tokens=50))
+        return quota
+
+    quota = asyncio.run(scenario())
+    stats = quota.stats()
+    assert stats["waited"] == 1 and stats["reserved"] == 1
+    assert quota.tpm.tokens == pytest.approx(10_000 - 150, abs=30)  # plus ~0.1s of refill
+
+
+def test_reserve_fails_fast_when_the_wait_is_too_long():
+    manager = QuotaManager({"anthropic": {"rpm": 60}}, max_wait=0.5)
+
+    async def scenario():
+        manager.get("anthropic", "m").block(30)
+        async with manager.reserve("anthropic", "m", 100):
+            pass
+
+    with pytest.raises(QuotaExhausted):
+        asyncio.run(scenario())
+    assert manager.stats()["anthropic/m"]["exhausted"] == 1
+
+
+def test_failed_call_returns_tokens_and_applies_error_headers():
+    manager = QuotaManager({"anthropic": {"rpm": 50, "tpm": 1000}})
+
+    class RateLimitError(Exception):
+        response = SimpleNamespace(status_code=429, headers={"retry-after": "4"})
+
+    async def scenario():
+        async with manager.reserve("anthropic", "m", 400):
+            raise RateLimitError()
+
+    with pytest.raises(RateLimitError):
+        asyncio.run(scenario())
+    quota = manager.get("anthropic", "m")
+    assert quota.tpm.tokens == pytest.approx(1000, abs=1)
+    assert quota.wait_for(1) > 3.0
+
+
+def test_response_hook_applies_to_the_call_in_progress():
+    manager = QuotaManager({"openai": {"rpm": 500, "tpm": 200_000}})
+
+    async def scenario():
+        response = SimpleNamespace(status_code=200, headers={"x-ratelimit-remaining-tokens": "1234"})
+        await manager.observe_response(response)  # outside a call: ignored
+        async with manager.reserve("openai", "m", 10):
+            await manager.observe_response(response)
+
+    asyncio.run(scenario())
+    assert manager.get("openai", "m").tpm.tokens <= 1234
+
+
+def test_usage_tokens_across_sdks():
+    assert usage_tokens(SimpleNamespace(total_tokens=42)) == 42
+    assert usage_tokens(SimpleNamespace(input_tokens=10, output_tokens=5)) == 15
+    assert usage_tokens(SimpleNamespace(total_token_count=7)) == 7
+    assert usage_tokens(None) is None
@@ -0,0 +1,118 @@
+"""Deadline-aware retries: error classification, jittered delays and the deadline."""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils import retry
+from src.utils.deadline import Deadline
+from src.utils.quotas import QuotaExhausted
+from src.utils.retry import RetryMetrics, is_retryable, retry_call
+
+
+class StatusError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(status_code=status_code, headers=headers or {})
+
+
+class APIConnectionError(Exception):
+    pass
+
+
+def test_classification():
+    assert is_retryable(StatusError(502))
+    assert is_retryable(StatusError(529))
+    assert is_retryable(StatusError(429))
+    assert is_retryable(APIConnectionError("reset"))
+    assert is_retryable(asyncio.TimeoutError())
+    assert not is_retryable(StatusError(400))
+    assert not is_retryable(StatusError(401))
+    assert not is_retryable(ValueError("bad json"))
+    assert not is_retryable(QuotaExhausted("openai", "m", 10))
+
+
+def _flaky(failures):
+    calls = {"n": 0}
+
+    async def call():
+        calls["n"] += 1
+        if failures:
+            raise failures.pop(0)
+        return "ok"
+
+    return call, calls
+
+
+def _recording_sleep():
+    delays = []
+
+    async def sleep(seconds):
+        delays.append(seconds)
+
+    return sleep, delays
+
+
+def test_transient_errors_are_retried_with_jittered_delays(monkeypatch):
+    monkeypatch.setattr(retry, "retry_metrics", RetryMetrics())
+    call, calls = _flaky([StatusError(502), APIConnectionError("reset")])
+    sleep, delays = _recording_sleep()
+    result = asyncio.run(retry_call(call, "deepinfra", max_attempts=3, base_delay=0.1, max_delay=1.0, sleep=sleep))
+    assert result == "ok" and calls["n"] == 3
+    assert len(delays) == 2 and all(0.1 <= d <= 1.0 for d in delays)
+    stats = retry.retry_metrics.stats()["deepinfra"]
+    assert stats["attempts"] == 3 and stats["retries"] == 2 and stats["recovered"] == 1
+
+
+def test_non_retryable_and_exhausted_errors_are_raised(monkeypatch):
+    monkeypatch.setattr(retry, "retry_metrics", RetryMetrics())
+    sleep, delays = _recording_sleep()
+    call, calls = _flaky([StatusError(400)])
+    with pytest.raises(StatusError):
+        asyncio.run(retry_call(call, "openai", sleep=sleep))
+    assert calls["n"] == 1
+
+    call, calls = _flaky([StatusError(503), StatusError(503)])
+    with pytest.raises(StatusError):
+        asyncio.run(retry_call(call, "openai", max_attempts=2, sleep=sleep))
+    assert calls["n"] == 2
+    stats = retry.retry_metrics.stats()["openai"]
+    assert stats["failed_not_retryable"] == 1 and stats["failed_attempts_exhausted"] == 1
+
+
+def test_retry_after_is_honored_and_deadline_stops_retries(monkeypatch):
+    monkeypatch.setattr(retry, "retry_metrics", RetryMetrics())
+    sleep, delays = _recording_sleep()
+    call, _ = _flaky([StatusError(429, {"retry-after": "1.5"})])
+    assert asyncio.run(retry_call(call, "anthropic", deadline=Deadline(30), base_delay=0.1, max_delay=0.5, sleep=sleep)) == "ok"
+    assert delays == [1.5]
+
+    # Without a deadline, Retry-After is capped like the computed backoff
+    call, _ = _flaky([StatusError(429, {"retry-after": "3600"})])
+    assert asyncio.run(retry_call(call, "anthropic", base_delay=0.1, max_delay=0.5, sleep=sleep)) == "ok"
+    assert delays == [1.5, 0.5]
+
+    call, calls = _flaky([StatusError(502)])
+    with pytest.raises(StatusError):
+        asyncio.run(retry_call(call, "anthropic", deadline=Deadline(1), sleep=sleep))
+    assert calls["n"] == 1
+    assert retry.retry_metrics.stats()["anthropic"]["failed_deadline"] == 1
+
+
+def test_prover_retries_deepinfra_before_falling_back(monkeypatch):
+    from src.agents import prover
+    from src.llm import llm_gateway
+    from src.utils.provider_clients import ProviderClients
+
+    failures = [StatusError(502)]
+
+    async def create(**kwargs):
+        if failures:
+            raise failures.pop(0)
+        usage = SimpleNamespace(prompt_tokens=10, completion_tokens=5, prompt_tokens_details=None)
+        return SimpleNamespace(usage=usage, choices=[SimpleNamespace(message=SimpleNamespace(content="argument"))])
+
+    fake = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(llm_gateway, "clients", ProviderClients({"deepinfra": lambda: fake}))
+    assert asyncio.run(prover.run_prover_agent("claim", ["source"])) == "argument"
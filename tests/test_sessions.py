@@ -0,0 +1,43 @@
+"""Prepaid session ledger: token signing, credit consumption and refunds."""
+
+from src.services.sessions import SessionStore
+
+
+def test_session_lifecycle():
+    store = SessionStore("test-secret", ttl_seconds=60)
+    session = store.create(credits=3)
+
+    session_id = store.authenticate(session["session_token"])
+    assert session_id == session["session_id"]
+
+    assert store.consume(session_id)
+    assert store.consume(session_id, 2)
+    assert not store.consume(session_id)  # balance exhausted
+    assert store.balance(session_id) == 0
+
+    # refunded_* verifications are credited back
+    store.refund(session_id, 1)
+    assert store.balance(session_id) == 1
+
+
+def test_rejects_tampered_and_expired_tokens():
+    store = SessionStore("test-secret", ttl_seconds=60)
+    token = store.create(credits=5)["session_token"]
+
+    version, session_id, expires_at, signature = token.split(".")
+    forged = f"{version}.{session_id}.{int(expires_at) + 3600}.{signature}"
+    assert store.authenticate(forged) is None
+    assert store.authenticate("not-a-token") is None
+
+    # Tokens signed with another secret are rejected
+    assert SessionStore("other-secret").authenticate(token) is None
+
+    expired_store = SessionStore("test-secret", ttl_seconds=-1)
+    expired = expired_store.create(credits=5)["session_token"]
+    assert expired_store.authenticate(expired) is None
+
+
+if __name__ == "__main__":
+    test_session_lifecycle()
+    test_rejects_tampered_and_expired_tokens()
+    print("✅ Session tests passed")
@@ -0,0 +1,184 @@
+"""Settlement queue: journaling, bulk flushing and crash recovery."""
+import asyncio
+import base64
+import importlib
+import json
+
+import httpx
+
+from src.services.settlement import SettlementQueue, LocalFacilitator, extract_payer
+
+app_module = importlib.import_module("src.app")  # the package re-exports `app`, shadowing the module
+
+
+class FailingFacilitator:
+    async def submit_batch(self, batch_id, entries):
+        raise ConnectionError("facilitator unavailable")
+
+
+class RejectingFacilitator:
+    """Settles every entry except those whose claim is in `rejected_claims`."""
+
+    def __init__(self, rejected_claims):
+        self.rejected_claims = set(rejected_claims)
+        self.batches = []
+
+    async def submit_batch(self, batch_id, entries):
+        self.batches.append([entry["claim"] for entry in entries])
+        return [entry["id"] for entry in entries if entry["claim"] not in self.rejected_claims]
+
+
+def test_flush_in_batches(tmp_path):
+    facilitator = LocalFacilitator(str(tmp_path / "batches.jsonl"))
+    queue = SettlementQueue(str(tmp_path / "journal.jsonl"), facilitator, batch_size=2)
+
+    asyncio.run(queue.record("settled", 0.05, payer="0xabc", claim="Water is wet"))
+    asyncio.run(queue.record("refunded_due_to_uncertainty", 0.05, payer="0xabc"))
+    asyncio.run(queue.record("settled", 0.05))
+    stats = queue.stats()
+    assert stats["queue_depth"] == 3
+    assert stats["pending_refund"] == 1
+
+    completed = asyncio.run(queue.flush())
+    assert completed == 3
+    assert queue.stats()["queue_depth"] == 0
+    assert queue.batches_submitted == 2  # 3 entries / batch_size 2
+    assert not (tmp_path / "journal.jsonl").exists()  # compacted once drained
+
+
+def test_pending_decisions_survive_restart(tmp_path):
+    journal = str(tmp_path / "journal.jsonl")
+    queue = SettlementQueue(journal, FailingFacilitator())
+    asyncio.run(queue.record("settled", 0.05))
+    asyncio.run(queue.record("refunded_due_to_system_error", 0.05))
+
+    assert asyncio.run(queue.flush()) == 0
+    assert queue.stats()["last_error"] == "facilitator unavailable"
+
+    recovered = SettlementQueue(journal, LocalFacilitator(str(tmp_path / "batches.jsonl")))
+    assert recovered.stats()["queue_depth"] == 2
+    assert asyncio.run(recovered.flush()) == 2
+
+
+def test_torn_final_line_is_skipped_on_replay(tmp_path):
+    journal = tmp_path / "journal.jsonl"
+    queue = SettlementQueue(str(journal), FailingFacilitator())
+    asyncio.run(queue.record("settled", 0.05))
+    with open(journal, "a") as f:
+        f.write('{"event": "enqueued", "entry": {"id": "torn')  # crash mid-append
+
+    recovered = SettlementQueue(str(journal), FailingFacilitator())
+    assert recovered.stats()["queue_depth"] == 1
+
+
+def test_permanently_rejected_entry_is_dead_lettered(tmp_path):
+    facilitator = RejectingFacilitator({"bad"})
+    queue = SettlementQueue(
+        str(tmp_path / "journal.jsonl"), facilitator, batch_size=1,
+        max_rejections=3, dead_letter_path=str(tmp_path / "failed.jsonl")
+    )
+    asyncio.run(queue.record("settled", 0.05, claim="bad"))
+    asyncio.run(queue.record("settled", 0.05, claim="good"))
+
+    assert asyncio.run(queue.flush()) == 1  # the rejected head does not block the entry behind it
+    assert facilitator.batches == [["bad"], ["good"]]
+    assert queue.stats()["pending_rejected"] == 1
+
+    assert asyncio.run(queue.flush()) == 0
+    restarted = SettlementQueue(
+        str(tmp_path / "journal.jsonl"), facilitator, max_rejections=3, dead_letter_path=str(tmp_path / "failed.jsonl")
+    )
+    assert list(restarted._pending.values())[0]["rejections"] == 2  # rejections survive a restart
+
+    asyncio.run(restarted.flush())
+    assert restarted.stats()["queue_depth"] == 0 and restarted.entries_failed == 1
+    dead = [json.loads(line) for line in (tmp_path / "failed.jsonl").read_text().splitlines()]
+    assert [item["entry"]["claim"] for item in dead] == ["bad"]
+    assert not (tmp_path / "journal.jsonl").exists()
+
+
+def test_journal_is_compacted_while_entries_are_pending(tmp_path):
+    journal = tmp_path / "journal.jsonl"
+    queue = SettlementQueue(str(journal), RejectingFacilitator({"later"}), batch_size=10)
+    for claim in ("a", "b", "later", "c"):
+        asyncio.run(queue.record("settled", 0.05, claim=claim))
+
+    assert asyncio.run(queue.flush()) == 3
+    events = [json.loads(line) for line in journal.read_text().splitlines()]
+    assert [(event["event"], event["entry"]["claim"]) for event in events] == [("enqueued", "later")]
+    assert not journal.with_name(journal.name + ".tmp").exists()
+
+    asyncio.run(queue.record("settled", 0.05, claim="d"))
+    recovered = SettlementQueue(str(journal), LocalFacilitator(str(tmp_path / "batches.jsonl")))
+    assert sorted(entry["claim"] for entry in recovered._pending.values()) == ["d", "later"]
+    assert recovered.stats()["pending_rejected"] == 1
+
+
+def _post_batch(monkeypatch, tmp_path, verdicts, tier="standard"):
+    """POST /verify/batch with stubbed verifications; returns (response, journaled entries)."""
+    queue = SettlementQueue(str(tmp_path / "journal.jsonl"), FailingFacilitator())
+    monkeypatch.setattr(app_module, "settlement_queue", queue)
+    results = iter(verdicts)
+
+    async def verify_claim_logic(claim, tier, deadline):
+        return dict(next(results))
+
+    monkeypatch.setattr(app_module, "verify_claim_logic", verify_claim_logic)
+
+    async def post():
+        transport = httpx.ASGITransport(app=app_module.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://localhost") as client:
+            return await client.post(f"/verify/batch?tier={tier}", json={"claims": [f"claim {i}" for i in range(len(verdicts))]})
+
+    response = asyncio.run(post())
+    return response.json(), list(queue._pending.values())
+
+
+def test_batch_is_journaled_once_for_what_it_cost(monkeypatch, tmp_path):
+    settled = {"verdict": "Verified", "payment_status": "settled"}
+    refunded = {"verdict": "Unverified", "payment_status": "refunded_due_to_uncertainty"}
+    body, entries = _post_batch(monkeypatch, tmp_path, [settled] * 5 + [refunded])
+
+    assert len(entries) == 1
+    assert entries[0]["action"] == "settle"
+    assert entries[0]["amount_usdc"] == body["final_cost"]
+
+
+def test_batch_cost_uses_the_tier_price(monkeypatch, tmp_path):
+    settled = {"verdict": "Verified", "payment_status": "settled"}
+    body, entries = _post_batch(monkeypatch, tmp_path, [settled] * 5, tier="thorough")
+
+    assert body["base_cost"] == 0.5  # 5 x 0.10
+    assert body["final_cost"] == 0.45  # 10% bulk discount
+    assert entries[0]["amount_usdc"] == 0.45
+
+
+def test_failed_batch_is_refunded_once(monkeypatch, tmp_path):
+    # Source-fetch errors carry no payment_status of their own
+    body, entries = _post_batch(monkeypatch, tmp_path, [{"verdict": "Error"}] * 3)
+
+    assert body["successful_verifications"] == 0
+    assert len(entries) == 1
+    assert entries[0]["payment_status"] == "refunded_due_to_system_error"
+
+
+def test_extract_payer():
+    header = base64.b64encode(json.dumps({
+        "x402Version": 1,
+        "payload": {"authorization": {"from": "0xPayer"}}
+    }).encode()).decode()
+    assert extract_payer(header) == "0xPayer"
+    assert extract_payer("garbage") is None
+    assert extract_payer(None) is None
+
+
+if __name__ == "__main__":
+    import tempfile
+    from pathlib import Path
+
+    with tempfile.TemporaryDirectory() as tmp:
+        test_flush_in_batches(Path(tmp))
+    with tempfile.TemporaryDirectory() as tmp:
+        test_pending_decisions_survive_restart(Path(tmp))
+    test_extract_payer()
+    print("✅ Settlement tests passed")
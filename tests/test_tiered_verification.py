@@ -0,0 +1,262 @@
+"""Tiered verification: quick check settles easy claims, escalates the rest to the debate."""
+import asyncio
+from types import SimpleNamespace
+
+import src.services.verification as verification
+
+
+def _agents(calls):
+    """Agent names in call order (search calls dropped, judge model stripped)."""
+    return [c if isinstance(c, str) else c[0] for c in calls if c[0] not in ("search", "judge_missing")]
+
+
+def _install_fakes(monkeypatch, quick_result, calls):
+    async def fake_search(claim, timeout_seconds=20, num_results=5, max_text_length=500):
+        calls.append(("search", num_results))
+        return [f"https://example.com/{i}" for i in range(5)], [f"distinct source text number {i}" for i in range(5)]
+
+    async def fake_quick_check(claim, text_blobs, is_prediction=False, model=None, deadline=None):
+        calls.append("quick_check")
+        return quick_result
+
+    async def fake_prover(claim, text_blobs, is_prediction=False, model=None, deadline=None):
+        calls.append("prover")
+        return "Prover says yes."
+
+    async def fake_debunker(claim, text_blobs, is_prediction=False, model=None, deadline=None):
+        calls.append("debunker")
+        return "Debunker says no."
+
+    async def fake_judge(claim, text_blobs, weights, prover_arg, debunker_arg, is_prediction=False, model=None,
+                         source_labels=None, missing_arguments=None, deadline=None):
+        calls.append(("judge", model))
+        calls.append(("judge_missing", missing_arguments))
+        return {"verdict": "Verified", "confidence_score": 0.8, "summary": "Judge ruling"}
+
+    monkeypatch.setattr(verification, "search_and_retrieve_sources", fake_search)
+    monkeypatch.setattr(verification, "run_quick_check_agent", fake_quick_check)
+    monkeypatch.setattr(verification, "run_prover_agent", fake_prover)
+    monkeypatch.setattr(verification, "run_debunker_agent", fake_debunker)
+    monkeypatch.setattr(verification, "run_judge_agent", fake_judge)
+    monkeypatch.setattr(verification.PerformanceLogger, "log_request", lambda **kwargs: None)
+
+
+def test_quick_check_settles_when_sources_agree(monkeypatch):
+    calls = []
+    _install_fakes(monkeypatch, {
+        "verdict": "Verified",
+        "confidence_score": 0.95,
+        "summary": "All sources confirm it",
+        "source_stances": ["supports"] * 5,
+    }, calls)
+
+    result = asyncio.run(verification.verify_claim_logic("The Earth orbits the Sun"))
+    assert _agents(calls) == ["quick_check"]
+    assert result["verification_path"] == "quick_check"
+    assert result["verdict"] == "Verified"
+    assert result["payment_status"] == "settled"
+
+
+def test_escalates_on_source_disagreement(monkeypatch):
+    calls = []
+    _install_fakes(monkeypatch, {
+        "verdict": "Verified",
+        "confidence_score": 0.95,
+        "summary": "Mostly confirmed",
+        "source_stances": ["supports", "supports", "refutes", "refutes", "irrelevant"],
+    }, calls)
+
+    result = asyncio.run(verification.verify_claim_logic("The Earth orbits the Sun"))
+    agents = _agents(calls)
+    assert agents[0] == "quick_check"
+    assert set(agents[1:]) == {"prover", "debunker", "judge"}
+    assert result["verification_path"] == "full_debate"
+    assert result["summary"] == "Judge ruling"
+
+
+def test_escalates_when_quick_check_fails_or_unsure(monkeypatch):
+    for quick_result in (None, {"verdict": "Verified", "confidence_score": 0.5, "source_stances": ["supports"] * 5}):
+        calls = []
+        _install_fakes(monkeypatch, quick_result, calls)
+        result = asyncio.run(verification.verify_claim_logic("The Earth orbits the Sun"))
+        assert result["verification_path"] == "full_debate"
+        assert "judge" in _agents(calls)
+
+
+def test_predictions_skip_quick_check(monkeypatch):
+    calls = []
+    _install_fakes(monkeypatch, {"verdict": "Verified", "confidence_score": 0.99, "source_stances": ["supports"] * 5}, calls)
+
+    result = asyncio.run(verification.verify_claim_logic("Will it rain tomorrow in New York?"))
+    assert "quick_check" not in _agents(calls)
+    assert result["verification_path"] == "full_debate"
+
+
+SETTLED_QUICK = {
+    "verdict": "Verified",
+    "confidence_score": 0.95,
+    "summary": "All sources confirm it",
+    "source_stances": ["supports"] * 5,
+}
+
+
+def test_fast_tier_never_debates(monkeypatch):
+    calls = []
+    _install_fakes(monkeypatch, {**SETTLED_QUICK, "source_stances": ["supports", "refutes"] * 2 + ["irrelevant"]}, calls)
+
+    result = asyncio.run(verification.verify_claim_logic("The Earth orbits the Sun", tier="fast"))
+    assert _agents(calls) == ["quick_check"]
+    assert ("search", verification.VERIFICATION_TIERS["fast"]["num_results"]) in calls
+    assert result["tier"] == "fast"
+    assert result["verification_path"] == "quick_check"
+    assert result["manual_review"] is True
+
+
+def test_thorough_tier_always_debates_with_tier_judge(monkeypatch):
+    calls = []
+    _install_fakes(monkeypatch, SETTLED_QUICK, calls)
+
+    result = asyncio.run(verification.verify_claim_logic("The Earth orbits the Sun", tier="thorough"))
+    assert "quick_check" not in _agents(calls)
+    assert ("judge", verification.VERIFICATION_TIERS["thorough"]["models"]["judge"]) in calls
+    assert result["tier"] == "thorough"
+    assert result["verification_path"] == "full_debate"
+
+
+def test_tier_deadline_refunds(monkeypatch):
+    calls = []
+    _install_fakes(monkeypatch, SETTLED_QUICK, calls)
+
+    async def slow_search(claim, **kwargs):
+        await asyncio.sleep(1)
+
+    monkeypatch.setattr(verification, "search_and_retrieve_sources", slow_search)
+    monkeypatch.setitem(verification.VERIFICATION_TIERS["fast"], "deadline_seconds", 0.05)
+
+    result = asyncio.run(verification.verify_claim_logic("The Earth orbits the Sun", tier="fast"))
+    assert result["payment_status"] == "refunded_due_to_timeout"
+    assert result["tier"] == "fast"
+
+
+def test_short_client_deadline_answers_from_quick_check(monkeypatch):
+    calls = []
+    _install_fakes(monkeypatch, {**SETTLED_QUICK, "source_stances": ["supports", "refutes"] * 2 + ["irrelevant"]}, calls)
+
+    # Standard tier would escalate, but 3s cannot fit a debate + judge
+    deadline = verification.Deadline(3)
+    result = asyncio.run(verification.verify_claim_logic("The Earth orbits the Sun", deadline=deadline))
+    assert _agents(calls) == ["quick_check"]
+    assert result["degraded_reason"] == "deadline_before_debate"
+    assert result["verdict"] == "Verified"
+    assert result["manual_review"] is True
+
+
+def test_slow_judge_degrades_before_the_deadline(monkeypatch):
+    calls = []
+    _install_fakes(monkeypatch, {**SETTLED_QUICK, "source_stances": ["supports", "refutes"] * 2 + ["irrelevant"]}, calls)
+
+    async def slow_judge(*args, **kwargs):
+        await asyncio.sleep(30)
+
+    monkeypatch.setattr(verification, "run_judge_agent", slow_judge)
+    monkeypatch.setattr(verification, "DEADLINE_MIN_DEBATE_SECONDS", 0.1)
+    monkeypatch.setattr(verification, "DEADLINE_MIN_JUDGE_SECONDS", 0.1)
+    monkeypatch.setattr(verification, "DEADLINE_SAFETY_MARGIN_SECONDS", 0.1)
+
+    deadline = verification.Deadline(0.5)
+    result = asyncio.run(verification.verify_claim_logic("The Earth orbits the Sun", deadline=deadline))
+    assert not deadline.expired()
+    assert result["degraded_reason"] == "judge_timeout"
+    assert result["verdict"] == "Verified"  # the quick check's ruling
+    assert result["debate"]["prover"] == "Prover says yes."
+    assert result["manual_review"] is True
+
+
+def test_judge_runs_with_the_argument_that_finished(monkeypatch):
+    calls = []
+    _install_fakes(monkeypatch, None, calls)
+    state = {"cancelled": False}
+
+    async def slow_debunker(*args, **kwargs):
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            state["cancelled"] = True
+            raise
+
+    monkeypatch.setattr(verification, "run_debunker_agent", slow_debunker)
+    monkeypatch.setattr(verification, "DEBATE_TIMEOUT_SECONDS", 0.1)
+
+    result = asyncio.run(verification.verify_claim_logic("The Earth orbits the Sun"))
+    assert ("judge_missing", ["debunker"]) in calls
+    assert state["cancelled"]
+    assert result["verdict"] == "Verified"
+    assert result["payment_status"] == "settled"
+    assert result["manual_review"] is True
+    assert result["degraded_reason"] == "missing_argument:debunker"
+    assert result["debate"]["prover"] == "Prover says yes."
+    assert "No debunker argument" in result["debate"]["debunker"]
+
+
+def test_debater_whose_models_all_fail_is_counted_missing(monkeypatch):
+    from src.agents import debunker, prover
+    from src.llm import LLMUnavailable, llm_gateway
+
+    calls = []
+    _install_fakes(monkeypatch, None, calls)
+    monkeypatch.setattr(verification, "run_prover_agent", prover.run_prover_agent)
+    monkeypatch.setattr(verification, "run_debunker_agent", debunker.run_debunker_agent)
+
+    async def complete(role, prompt, model=None, deadline=None):
+        if role == "debunker":
+            raise LLMUnavailable(role, [("deepinfra", RuntimeError("503")), ("openai", RuntimeError("503"))])
+        return SimpleNamespace(text="Prover says yes.")
+
+    monkeypatch.setattr(llm_gateway, "complete", complete)
+
+    result = asyncio.run(verification.verify_claim_logic("The Earth orbits the Sun"))
+    assert ("judge_missing", ["debunker"]) in calls
+    assert result["manual_review"] is True
+    assert result["degraded_reason"] == "missing_argument:debunker"
+    assert result["debate"]["prover"] == "Prover says yes."
+    assert "No debunker argument" in result["debate"]["debunker"]
+
+
+def test_both_debaters_timing_out_without_quick_check_is_an_error(monkeypatch):
+    calls = []
+    _install_fakes(monkeypatch, None, calls)
+
+    async def slow_agent(*args, **kwargs):
+        await asyncio.sleep(30)
+
+    monkeypatch.setattr(verification, "run_prover_agent", slow_agent)
+    monkeypatch.setattr(verification, "run_debunker_agent", slow_agent)
+    monkeypatch.setattr(verification, "DEBATE_TIMEOUT_SECONDS", 0.1)
+
+    result = asyncio.run(verification.verify_claim_logic("The Earth orbits the Sun"))
+    assert "judge" not in _agents(calls)
+    assert result["verdict"] == "Error"
+    assert result["payment_status"] == "refunded_due_to_timeout"
+
+
+def test_cancelled_debate_cancels_its_debaters():
+    cancelled = []
+
+    async def slow_agent(role):
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            cancelled.append(role)
+            raise
+
+    async def run():
+        debate = asyncio.ensure_future(verification._run_debate(
+            {"prover": slow_agent("prover"), "debunker": slow_agent("debunker")}, timeout=30
+        ))
+        await asyncio.sleep(0.05)
+        debate.cancel()  # e.g. the outer backstop timeout or a client disconnect
+        await asyncio.gather(debate, return_exceptions=True)
+        await asyncio.sleep(0)
+        return sorted(cancelled)  # checked before asyncio.run cancels leftover tasks itself
+
+    assert asyncio.run(run()) == ["debunker", "prover"]